@@ -21,6 +21,7 @@ import os
 import re
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Any
@@ -329,10 +330,58 @@ def _latest_entry_ts(client, feed_id: int) -> tuple[float | None, str | None]:
     return _parse_ts(raw), raw
 
 
+_AUDIT_PAGE_SIZE = 250
+_AUDIT_WORKERS = 8
+
+
+def _latest_entry_ts_bulk(
+    client, feed_ids: set[int], cutoff: float
+) -> dict[int, tuple[float | None, str | None]]:
+    """Latest entry timestamp per feed, read from newest-first entry pages.
+
+    Pages through all entries by published_at desc, keeping the first hit
+    per feed, until every feed is resolved or the pages pass `cutoff`.
+    Feeds still unresolved then are stale either way; their latest entry
+    is looked up per feed on a small thread pool. If the entries run out
+    first, the remaining feeds have none.
+    """
+    latest: dict[int, tuple[float | None, str | None]] = {}
+    pending = set(feed_ids)
+    offset = 0
+    while pending:
+        entries = client.get_entries(
+            order="published_at",
+            direction="desc",
+            limit=_AUDIT_PAGE_SIZE,
+            offset=offset,
+        ).get("entries", [])
+        for e in entries:
+            feed_id = e.get("feed_id") or (e.get("feed") or {}).get("id")
+            if feed_id in pending:
+                pending.discard(feed_id)
+                raw = e.get("published_at")
+                latest[feed_id] = (_parse_ts(raw), raw)
+        if len(entries) < _AUDIT_PAGE_SIZE:
+            latest.update(dict.fromkeys(pending, (None, None)))
+            return latest
+        oldest = _parse_ts(entries[-1].get("published_at"))
+        if oldest is not None and oldest < cutoff:
+            break
+        offset += len(entries)
+
+    stragglers = sorted(pending)
+    if stragglers:
+        workers = min(_AUDIT_WORKERS, len(stragglers))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            found = pool.map(lambda fid: _latest_entry_ts(client, fid), stragglers)
+            latest.update(zip(stragglers, found))
+    return latest
+
+
 def cmd_health_audit(client, args) -> dict[str, Any]:
     now = getattr(args, "now", None) or time.time()
     cutoff = now - args.stale_days * 86400
-    errored, disabled, stale = [], [], []
+    errored, disabled, active = [], [], []
     for f in client.get_feeds():
         summary = {"id": f["id"], "title": f.get("title")}
         if f.get("parsing_error_count", 0) > 0:
@@ -340,7 +389,11 @@ def cmd_health_audit(client, args) -> dict[str, Any]:
         if f.get("disabled", False):
             disabled.append(summary)
             continue  # disabled feeds are not also flagged stale
-        ts, raw = _latest_entry_ts(client, f["id"])
+        active.append(summary)
+    latest = _latest_entry_ts_bulk(client, {f["id"] for f in active}, cutoff)
+    stale = []
+    for summary in active:
+        ts, raw = latest[summary["id"]]
         if ts is None or ts < cutoff:
             stale.append({**summary, "latest_entry": raw})
     return {
@@ -359,35 +359,71 @@ class TestHealthAudit:
             {"id": 3, "title": "Stale", "parsing_error_count": 0, "disabled": False},
             {"id": 4, "title": "Fresh", "parsing_error_count": 0, "disabled": False},
         ]
-
-        # Latest entry published_at per feed. Feed 1 (Errored) gets a fresh entry
-        # so it is flagged ONLY as errored, not incidentally stale (errored and
-        # stale are independent conditions in the impl).
-        def feed_entries(feed_id, **kwargs):
-            latest = {
-                1: "2026-06-13T00:00:00Z",
-                3: "2000-01-01T00:00:00Z",
-                4: "2026-06-13T00:00:00Z",
-            }.get(feed_id)
-            entries = [{"published_at": latest}] if latest else []
-            return {"total": len(entries), "entries": entries}
-
-        client.get_feed_entries.side_effect = feed_entries
+        # All entries newest first, as get_entries returns them. Feed 1 (Errored)
+        # gets a fresh entry so it is flagged ONLY as errored, not incidentally
+        # stale (errored and stale are independent conditions in the impl).
+        client.get_entries.return_value = {
+            "total": 4,
+            "entries": [
+                {"feed_id": 4, "published_at": "2026-06-13T00:00:00Z"},
+                {"feed_id": 1, "published_at": "2026-06-13T00:00:00Z"},
+                {"feed_id": 4, "published_at": "2026-06-01T00:00:00Z"},
+                {"feed_id": 3, "published_at": "2000-01-01T00:00:00Z"},
+            ],
+        }
 
         out = mfa.cmd_health_audit(client, _ns(stale_days=30, now=1750000000))
         assert {f["id"] for f in out["errored"]} == {1}
         assert {f["id"] for f in out["disabled"]} == {2}
         assert {f["id"] for f in out["stale"]} == {3}
+        assert out["stale"][0]["latest_entry"] == "2000-01-01T00:00:00Z"
+        client.get_feed_entries.assert_not_called()
 
     def test_no_entries_counts_as_stale(self):
         client = MagicMock()
         client.get_feeds.return_value = [
             {"id": 9, "title": "Empty", "parsing_error_count": 0, "disabled": False}
         ]
-        client.get_feed_entries.return_value = {"total": 0, "entries": []}
+        client.get_entries.return_value = {"total": 0, "entries": []}
         out = mfa.cmd_health_audit(client, _ns(stale_days=30, now=1750000000))
         assert out["stale"][0]["id"] == 9
         assert out["stale"][0]["latest_entry"] is None
+        client.get_feed_entries.assert_not_called()
+
+    def test_pages_stop_at_cutoff_and_stragglers_are_looked_up(self, monkeypatch):
+        monkeypatch.setattr(mfa, "_AUDIT_PAGE_SIZE", 2)
+        client = MagicMock()
+        client.get_feeds.return_value = [
+            {"id": n, "title": f"Feed {n}", "parsing_error_count": 0} for n in (1, 2, 3)
+        ]
+        pages = [
+            [
+                {"feed_id": 1, "published_at": "2026-06-13T00:00:00Z"},
+                {"feed_id": 1, "published_at": "2026-06-12T00:00:00Z"},
+            ],
+            [
+                {"feed_id": 2, "published_at": "2026-06-11T00:00:00Z"},
+                {"feed_id": 2, "published_at": "2000-01-01T00:00:00Z"},
+            ],
+            [{"feed_id": 3, "published_at": "1999-01-01T00:00:00Z"}],
+        ]
+        client.get_entries.side_effect = lambda **kw: {
+            "entries": pages[kw["offset"] // 2]
+        }
+        client.get_feed_entries.return_value = {
+            "entries": [{"published_at": "1999-01-01T00:00:00Z"}]
+        }
+
+        out = mfa.cmd_health_audit(client, _ns(stale_days=30, now=1750000000))
+        assert out["stale"] == [
+            {"id": 3, "title": "Feed 3", "latest_entry": "1999-01-01T00:00:00Z"}
+        ]
+        # Paging ends once a page reaches past the cutoff; feed 3 never showed
+        # up, so it is the only per-feed lookup.
+        offsets = [c.kwargs["offset"] for c in client.get_entries.call_args_list]
+        assert offsets == [0, 2]
+        client.get_feed_entries.assert_called_once()
+        assert client.get_feed_entries.call_args.args == (3,)
 
 
 class TestCuration:
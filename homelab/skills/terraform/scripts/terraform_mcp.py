@@ -22,101 +22,374 @@ set NO_PROXY=* in your environment.
 from __future__ import annotations
 
 import argparse
+import contextlib
+import datetime as dt
+import difflib
+import email.utils
+import gzip
+import hashlib
+import importlib.util
 import json
 import os
+import queue
+import random
+import re
+import selectors
+import socket
+import socketserver
+import sqlite3
 import subprocess
 import sys
 import tempfile
+import threading
 import time
 import warnings
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from pathlib import Path
 from typing import Any
 
 import httpx
 import yaml
 
+try:
+    import orjson  # optional: faster JSON encoding for large listings
+except ImportError:
+    orjson = None
+
 # Configuration
 DEFAULT_TFE_ADDRESS = "https://app.terraform.io"
+REGISTRY_ADDRESS = "https://registry.terraform.io"
 DOCKER_IMAGE = "hashicorp/terraform-mcp-server:0.3.3"
 POLL_INTERVAL = 5  # seconds
+FAST_POLL_INTERVAL = 2  # seconds, right after a run changes status
+MAX_POLL_INTERVAL = 60  # seconds, backoff cap for queued/planning runs
+LOG_CHUNK_SIZE = 65536  # bytes per incremental log read
+LOG_SPOOL_BYTES = 4 * 1024 * 1024  # prefetched log kept in memory before disk
+TERMINAL_STATES = frozenset(
+    {
+        "applied",
+        "errored",
+        "discarded",
+        "canceled",
+        "force_canceled",
+        "planned_and_finished",
+        "policy_soft_failed",
+    }
+)
+SUCCESS_STATES = frozenset({"applied", "planned_and_finished"})
+RUN_CACHE_MAX_BYTES = 256 * 1024 * 1024  # terminal run/log cache size cap
+DOCS_CACHE_TTL = 7 * 86400  # seconds a cached provider-docs search stays fresh
+MCP_REQUEST_TIMEOUT = 120.0  # seconds per request; TFE_MCP_TIMEOUT overrides
+STDERR_TAIL_LINES = 40  # server stderr lines kept for error messages
+BROKER_IDLE_TIMEOUT = 900  # seconds
+BROKER_START_TIMEOUT = 120  # seconds (covers a first-time docker pull)
+HCP_RATE_LIMIT = 30  # API requests per second per token (HCP's documented limit)
+HCP_MAX_RETRIES = 4  # retries of rate-limited, unavailable or dropped requests
+HCP_RETRY_BACKOFF = 0.5  # seconds, doubled per attempt before jitter
+HCP_RETRY_MAX_WAIT = 30.0  # seconds; longer server-requested waits are not retried
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+
+class Timings:
+    """Monotonic wall-clock timings of gateway phases.
+
+    Disabled by default, in which case `span` costs one attribute check.
+    Spans may be recorded from worker threads.
+    """
 
+    def __init__(self):
+        self.enabled = False
+        self.spans: list[dict[str, Any]] = []
+        self._origin = time.perf_counter()
+        self._lock = threading.Lock()
+
+    def enable(self) -> None:
+        """Start recording, measuring span starts from now."""
+        self.enabled = True
+        self._origin = time.perf_counter()
+
+    @contextlib.contextmanager
+    def span(self, name: str, **attrs: Any) -> Iterator[None]:
+        """Record how long the enclosed block takes under `name`."""
+        if not self.enabled:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            end = time.perf_counter()
+            record = {
+                "name": name,
+                "start_ms": round((start - self._origin) * 1000, 3),
+                "duration_ms": round((end - start) * 1000, 3),
+                **attrs,
+            }
+            with self._lock:
+                self.spans.append(record)
+
+    def elapsed_ms(self) -> float:
+        """Milliseconds since recording started."""
+        return round((time.perf_counter() - self._origin) * 1000, 3)
+
+    def summary(self) -> str:
+        """Per-phase count, total and max duration, slowest total first."""
+        totals: dict[str, list[float]] = {}
+        for record in self.spans:
+            totals.setdefault(record["name"], []).append(record["duration_ms"])
+        width = max((len(name) for name in totals), default=5)
+        lines = [f"{'PHASE':<{width}}  {'N':>4}  {'TOTAL ms':>10}  {'MAX ms':>10}"]
+        for name, durations in sorted(totals.items(), key=lambda kv: -sum(kv[1])):
+            lines.append(
+                f"{name:<{width}}  {len(durations):>4}  "
+                f"{sum(durations):>10.1f}  {max(durations):>10.1f}"
+            )
+        lines.append(f"{'wall clock':<{width}}  {'':>4}  {self.elapsed_ms():>10.1f}")
+        return "\n".join(lines)
+
+    def report(self, destination: str, command: str | None) -> None:
+        """Print the summary to stderr, or append one JSONL record to a file."""
+        if destination == "stderr":
+            print(self.summary(), file=sys.stderr)
+            return
+        record = {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "command": command,
+            "image": DOCKER_IMAGE,
+            "total_ms": self.elapsed_ms(),
+            "spans": self.spans,
+        }
+        with open(destination, "a", encoding="utf-8") as f:
+            f.write(json.dumps(record) + "\n")
 
-class MCPStdioClient:
-    """MCP client communicating via stdio with Docker container."""
 
-    def __init__(self, proc: subprocess.Popen):
-        self._proc = proc
+TIMINGS = Timings()
+
+
+class MCPClient:
+    """Shared MCP request/response handling; subclasses provide the transport.
+
+    Requests are pipelined: `submit` writes a JSON-RPC request and returns a
+    Future, and a reader thread matches replies to futures by `id`, so
+    replies may arrive in any order. Server notifications are dropped and
+    server-initiated requests get a JSON-RPC error reply.
+    """
+
+    def __init__(self):
         self._request_id = 0
         self._initialized = False
+        self._lock = threading.Lock()
+        self._init_lock = threading.Lock()
+        self._pending: dict[int, Future[dict[str, Any]]] = {}
+        self._reader: threading.Thread | None = None
+        self._closed_error: str | None = None
+        try:
+            self.request_timeout = float(
+                os.environ.get("TFE_MCP_TIMEOUT", MCP_REQUEST_TIMEOUT)
+            )
+        except ValueError:
+            self.request_timeout = MCP_REQUEST_TIMEOUT
 
-    def _send(
+    # Transport hooks
+
+    def _write(self, data: bytes) -> None:
+        """Write one encoded message to the server."""
+        raise NotImplementedError
+
+    def _readline(self) -> bytes:
+        """Read one line from the server; b"" at end of stream."""
+        raise NotImplementedError
+
+    def _dead_error(self) -> str | None:
+        """Error message if the transport is known dead before writing."""
+        return None
+
+    def _eof_error(self) -> str:
+        """Error message for requests outstanding at end of stream."""
+        return "No response from MCP server"
+
+    def _diagnostics(self) -> str:
+        """Recent server output to attach to errors, if the transport has any."""
+        return ""
+
+    # JSON-RPC plumbing
+
+    def _ensure_reader(self) -> None:
+        if self._reader is None:
+            self._reader = threading.Thread(
+                target=self._read_loop, name="mcp-reader", daemon=True
+            )
+            self._reader.start()
+
+    def _read_loop(self) -> None:
+        try:
+            while True:
+                line = self._readline()
+                if not line:
+                    break
+                if not line.strip():
+                    continue
+                try:
+                    message = json.loads(line)
+                except json.JSONDecodeError as e:
+                    self._fail_pending(f"Invalid JSON response from MCP server: {e}")
+                    continue
+                if isinstance(message, dict):
+                    self._dispatch(message)
+        except (OSError, ValueError) as e:
+            error = f"Connection to MCP server broken: {e}"
+        else:
+            error = self._eof_error()
+        with self._lock:
+            self._closed_error = error
+        self._fail_pending(error)
+
+    def _dispatch(self, message: dict[str, Any]) -> None:
+        """Route one incoming message."""
+        msg_id = message.get("id")
+        if "method" in message:
+            if msg_id is not None:
+                # Server-initiated request: answer ping, refuse the rest
+                if message["method"] == "ping":
+                    reply: dict[str, Any] = {"result": {}}
+                else:
+                    reply = {"error": {"code": -32601, "message": "Method not found"}}
+                reply.update({"jsonrpc": "2.0", "id": msg_id})
+                try:
+                    with self._lock:
+                        self._write((json.dumps(reply) + "\n").encode())
+                except OSError:
+                    pass
+            # Notifications (progress, logging) carry nothing we act on
+            return
+
+        with self._lock:
+            future = self._pending.pop(msg_id, None)
+        if future is not None and future.set_running_or_notify_cancel():
+            future.set_result(message)
+
+    def _fail_pending(self, error: str) -> None:
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        for future in pending.values():
+            if future.set_running_or_notify_cancel():
+                future.set_result({"error": {"message": error}})
+
+    def submit(
         self, method: str, params: dict[str, Any] | None = None
-    ) -> dict[str, Any]:
-        """Send JSON-RPC request and receive response."""
-        # Check if process is still running
-        if self._proc.poll() is not None:
-            stderr_output = ""
-            if self._proc.stderr:
-                stderr_output = self._proc.stderr.read().decode(errors="replace")
-            error_msg = f"MCP server process exited (code {self._proc.returncode})"
-            if stderr_output:
-                error_msg += f": {stderr_output[:500]}"
-            return {"error": {"message": error_msg}}
-
-        self._request_id += 1
-        request = {
-            "jsonrpc": "2.0",
-            "id": self._request_id,
-            "method": method,
-            "params": params or {},
-        }
+    ) -> Future[dict[str, Any]]:
+        """Send a JSON-RPC request; the Future resolves to the raw response.
 
+        Transport failures resolve to {"error": {"message": ...}} rather than
+        raising, matching `_send`.
+        """
+        future: Future[dict[str, Any]] = Future()
+        with self._lock:
+            error = self._closed_error or self._dead_error()
+            if error:
+                future.set_result({"error": {"message": error}})
+                return future
+
+            self._request_id += 1
+            request_id = self._request_id
+            request = {
+                "jsonrpc": "2.0",
+                "id": request_id,
+                "method": method,
+                "params": params or {},
+            }
+            self._pending[request_id] = future
+            future.add_done_callback(
+                lambda f: f.cancelled() and self._forget(request_id)
+            )
+            self._ensure_reader()
+            try:
+                self._write((json.dumps(request) + "\n").encode())
+            except OSError as e:
+                self._pending.pop(request_id, None)
+                future.set_result(
+                    {"error": {"message": f"Connection to MCP server broken: {e}"}}
+                )
+        return future
+
+    def _forget(self, request_id: int) -> None:
+        """Drop an abandoned request so a late reply to it is discarded."""
+        with self._lock:
+            self._pending.pop(request_id, None)
+
+    def notify(self, method: str, params: dict[str, Any] | None = None) -> None:
+        """Send a JSON-RPC notification (no id, no reply expected)."""
+        message = {"jsonrpc": "2.0", "method": method, "params": params or {}}
+        with self._lock:
+            if self._closed_error or self._dead_error():
+                return
+            try:
+                self._write((json.dumps(message) + "\n").encode())
+            except OSError:
+                pass
+
+    def _await(self, future: Future[dict[str, Any]]) -> dict[str, Any] | None:
+        """Wait for a reply within `request_timeout`; None once it has passed.
+
+        The future is cancelled on a miss, which removes its request from
+        the pending map; a reply that arrives after the deadline is discarded.
+        """
         try:
-            line = json.dumps(request) + "\n"
-            self._proc.stdin.write(line.encode())
-            self._proc.stdin.flush()
+            return future.result(timeout=self.request_timeout)
+        except TimeoutError:
+            future.cancel()
+            return None
+
+    def _timeout_error(self, what: str) -> str:
+        """Describe a missed deadline, with recent server stderr when known."""
+        error = f"MCP request '{what}' timed out after {self.request_timeout:g}s"
+        diagnostics = self._diagnostics()
+        if diagnostics:
+            error += f": {diagnostics}"
+        return error
 
-            response_line = self._proc.stdout.readline()
-            if not response_line:
-                # Try to get stderr for better error message
-                stderr_output = ""
-                if self._proc.stderr:
-                    stderr_output = self._proc.stderr.read().decode(errors="replace")
-                error_msg = "No response from MCP server"
-                if stderr_output:
-                    error_msg += f": {stderr_output[:500]}"
-                return {"error": {"message": error_msg}}
-
-            return json.loads(response_line)
-        except BrokenPipeError as e:
-            return {"error": {"message": f"Connection to MCP server broken: {e}"}}
-        except json.JSONDecodeError as e:
-            return {"error": {"message": f"Invalid JSON response from MCP server: {e}"}}
+    def _send(
+        self, method: str, params: dict[str, Any] | None = None
+    ) -> dict[str, Any]:
+        """Send JSON-RPC request and receive response."""
+        result = self._await(self.submit(method, params))
+        if result is None:
+            return {"error": {"message": self._timeout_error(method)}}
+        return result
 
     def initialize(self) -> dict[str, Any]:
         """Initialize the MCP session."""
-        if self._initialized:
-            return {"success": True}
-
-        result = self._send(
-            "initialize",
-            {
-                "protocolVersion": "2024-11-05",
-                "capabilities": {},
-                "clientInfo": {"name": "terraform-mcp-gateway", "version": "1.0.0"},
-            },
-        )
+        with self._init_lock:
+            if self._initialized:
+                return {"success": True}
+
+            with TIMINGS.span("mcp.initialize"):
+                result = self._send(
+                    "initialize",
+                    {
+                        "protocolVersion": "2024-11-05",
+                        "capabilities": {},
+                        "clientInfo": {
+                            "name": "terraform-mcp-gateway",
+                            "version": "1.0.0",
+                        },
+                    },
+                )
 
-        if "error" not in result:
-            self._initialized = True
-            # Send initialized notification
-            self._send("notifications/initialized", {})
+            if "error" not in result:
+                self._initialized = True
+                # Send initialized notification
+                self.notify("notifications/initialized")
 
-        return result
+            return result
 
-    def list_tools(self) -> dict[str, Any]:
-        """List all available tools."""
+    def fetch_tools(self) -> dict[str, Any]:
+        """Issue tools/list and return the full tool definitions."""
         self.initialize()
-        result = self._send("tools/list")
+        with TIMINGS.span("mcp.tools/list"):
+            result = self._send("tools/list")
 
         if "error" in result:
             return {
@@ -125,67 +398,495 @@ class MCPStdioClient:
             }
 
         if "result" in result and "tools" in result["result"]:
-            tool_names = [t["name"] for t in result["result"]["tools"]]
-            return {"success": True, "tools": sorted(tool_names)}
+            return {"success": True, "tools": result["result"]["tools"]}
 
         return {"success": False, "error": f"Unexpected response: {result}"}
 
+    def list_tools(self) -> dict[str, Any]:
+        """List all available tools."""
+        result = self.fetch_tools()
+        if not result.get("success"):
+            return result
+        return {"success": True, "tools": sorted(t["name"] for t in result["tools"])}
+
     def describe_tool(self, tool_name: str) -> dict[str, Any]:
-        """Get schema for a specific tool."""
-        self.initialize()
-        result = self._send("tools/list")
+        """Get schema for a specific tool, suggesting close names on a miss."""
+        result = self.fetch_tools()
+        if not result.get("success"):
+            return result
+
+        for tool in result["tools"]:
+            if tool["name"] == tool_name:
+                return {
+                    "success": True,
+                    "tool": {
+                        "name": tool["name"],
+                        "description": tool.get("description", ""),
+                        "inputSchema": tool.get("inputSchema", {}),
+                    },
+                }
 
+        all_tools = [t["name"] for t in result["tools"]]
+        similar = [t for t in all_tools if tool_name.lower() in t.lower()]
+        similar += [
+            t
+            for t in difflib.get_close_matches(tool_name, all_tools, n=5, cutoff=0.5)
+            if t not in similar
+        ]
+        msg = f"Tool '{tool_name}' not found."
+        if similar:
+            msg += f" Similar: {', '.join(similar[:5])}"
+        return {"success": False, "error": msg}
+
+    @staticmethod
+    def _tool_result(result: dict[str, Any]) -> dict[str, Any]:
+        """Shape a raw tools/call response into {"success", "result"|"error"}."""
         if "error" in result:
             return {
                 "success": False,
                 "error": result["error"].get("message", str(result["error"])),
             }
 
-        if "result" in result and "tools" in result["result"]:
-            for tool in result["result"]["tools"]:
-                if tool["name"] == tool_name:
-                    return {
-                        "success": True,
-                        "tool": {
-                            "name": tool["name"],
-                            "description": tool.get("description", ""),
-                            "inputSchema": tool.get("inputSchema", {}),
-                        },
-                    }
-
-            all_tools = [t["name"] for t in result["result"]["tools"]]
-            similar = [t for t in all_tools if tool_name.lower() in t.lower()]
-            msg = f"Tool '{tool_name}' not found."
-            if similar:
-                msg += f" Similar: {', '.join(similar[:5])}"
-            return {"success": False, "error": msg}
+        if "result" in result:
+            return {"success": True, "result": result["result"]}
 
         return {"success": False, "error": f"Unexpected response: {result}"}
 
+    def submit_tool(
+        self, tool_name: str, arguments: dict[str, Any]
+    ) -> Future[dict[str, Any]]:
+        """Call a tool without waiting; resolves to the `call_tool` result."""
+        self.initialize()
+        raw = self.submit("tools/call", {"name": tool_name, "arguments": arguments})
+        shaped: Future[dict[str, Any]] = Future()
+
+        def shape(f: Future[dict[str, Any]]) -> None:
+            if not f.cancelled() and shaped.set_running_or_notify_cancel():
+                shaped.set_result(self._tool_result(f.result()))
+
+        raw.add_done_callback(shape)
+        shaped.add_done_callback(lambda f: f.cancelled() and raw.cancel())
+        return shaped
+
     def call_tool(self, tool_name: str, arguments: dict[str, Any]) -> dict[str, Any]:
         """Call a tool with arguments."""
-        self.initialize()
-        result = self._send("tools/call", {"name": tool_name, "arguments": arguments})
+        future = self.submit_tool(tool_name, arguments)
+        with TIMINGS.span(f"mcp.tool/{tool_name}"):
+            result = self._await(future)
+        if result is None:
+            return {"success": False, "error": self._timeout_error(tool_name)}
+        return result
 
-        if "error" in result:
-            return {
-                "success": False,
-                "error": result["error"].get("message", str(result["error"])),
-            }
+    def close(self):
+        """Release the transport."""
 
-        if "result" in result:
-            return {"success": True, "result": result["result"]}
 
-        return {"success": False, "error": f"Unexpected response: {result}"}
+class MCPStdioClient(MCPClient):
+    """MCP client communicating via stdio with Docker container.
+
+    stdout is read through a selector with a short poll interval, so the
+    reader notices close() instead of blocking in readline forever. A
+    background thread drains stderr continuously into a bounded ring
+    buffer: a chatty server can never fill the pipe and wedge the session,
+    and the most recent lines are attached to errors.
+    """
+
+    SELECT_INTERVAL = 0.5  # seconds between checks for close()
+
+    def __init__(self, proc: subprocess.Popen):
+        super().__init__()
+        self._proc = proc
+        self._buffer = bytearray()
+        self._scanned = 0
+        self._closing = False
+        self._selector = selectors.DefaultSelector()
+        self._selector.register(proc.stdout, selectors.EVENT_READ)
+        self._stderr_lines: deque[str] = deque(maxlen=STDERR_TAIL_LINES)
+        self._stderr_thread: threading.Thread | None = None
+        if proc.stderr:
+            self._stderr_thread = threading.Thread(
+                target=self._drain_stderr, name="mcp-stderr", daemon=True
+            )
+            self._stderr_thread.start()
+
+    def _drain_stderr(self) -> None:
+        try:
+            for line in iter(self._proc.stderr.readline, b""):
+                self._stderr_lines.append(line.decode(errors="replace").rstrip())
+        except (OSError, ValueError):
+            pass
+
+    def _stderr_tail(self) -> str:
+        if self._stderr_thread and self._proc.poll() is not None:
+            # The process is gone: let the drain thread pick up its last words
+            self._stderr_thread.join(timeout=1)
+        return "\n".join(line for line in self._stderr_lines if line)[-2000:]
+
+    def _diagnostics(self) -> str:
+        return self._stderr_tail()
+
+    def _write(self, data: bytes) -> None:
+        try:
+            self._proc.stdin.write(data)
+            self._proc.stdin.flush()
+        except ValueError as e:  # stdin already closed
+            raise BrokenPipeError(str(e)) from e
+
+    def _readline(self) -> bytes:
+        fd = self._proc.stdout.fileno()
+        while True:
+            newline = self._buffer.find(b"\n", self._scanned)
+            if newline >= 0:
+                line = bytes(self._buffer[: newline + 1])
+                del self._buffer[: newline + 1]
+                self._scanned = 0
+                return line
+            self._scanned = len(self._buffer)
+            if self._closing:
+                return b""
+            if not self._selector.select(timeout=self.SELECT_INTERVAL):
+                continue
+            chunk = os.read(fd, 65536)
+            if not chunk:
+                line = bytes(self._buffer)
+                self._buffer.clear()
+                self._scanned = 0
+                return line
+            self._buffer += chunk
+
+    def _dead_error(self) -> str | None:
+        if self._proc.poll() is None:
+            return None
+        error_msg = f"MCP server process exited (code {self._proc.returncode})"
+        stderr_output = self._stderr_tail()
+        if stderr_output:
+            error_msg += f": {stderr_output}"
+        return error_msg
+
+    def _eof_error(self) -> str:
+        error_msg = "No response from MCP server"
+        stderr_output = self._stderr_tail()
+        if stderr_output:
+            error_msg += f": {stderr_output}"
+        return error_msg
 
     def close(self):
         """Terminate the MCP server process."""
+        self._closing = True
         if self._proc.poll() is None:
             self._proc.terminate()
             try:
                 self._proc.wait(timeout=5)
             except subprocess.TimeoutExpired:
                 self._proc.kill()
+        self._selector.close()
+
+
+class BrokerClient(MCPClient):
+    """MCP client that talks to a running broker over its Unix socket.
+
+    The broker owns an already-initialized container session, so requests skip
+    both the `docker run` and the `initialize` handshake.
+    """
+
+    def __init__(self, sock: socket.socket):
+        super().__init__()
+        self._sock = sock
+        self._rfile = sock.makefile("rb")
+
+    @classmethod
+    def connect(cls, path: Path, timeout: float = 1.0) -> BrokerClient | None:
+        """Connect to the broker at `path`; None if no broker is listening."""
+        if not path.exists():
+            return None
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            sock.settimeout(timeout)
+            sock.connect(str(path))
+            sock.settimeout(None)
+        except OSError:
+            sock.close()
+            return None
+        return cls(sock)
+
+    def _write(self, data: bytes) -> None:
+        self._sock.sendall(data)
+
+    def _readline(self) -> bytes:
+        return self._rfile.readline()
+
+    def _eof_error(self) -> str:
+        return "No response from MCP broker"
+
+    def initialize(self) -> dict[str, Any]:
+        """Confirm the broker session; the broker already did the handshake."""
+        with self._init_lock:
+            if self._initialized:
+                return {"success": True}
+            result = self._send("initialize", {})
+            if "error" not in result:
+                self._initialized = True
+            return result
+
+    def status(self) -> dict[str, Any]:
+        """Return broker pid, image, uptime and request count."""
+        return self._send("broker/status")
+
+    def shutdown(self) -> dict[str, Any]:
+        """Ask the broker to stop its container and exit."""
+        return self._send("broker/shutdown")
+
+    def close(self):
+        """Close the socket; the broker and its container keep running."""
+        try:
+            self._sock.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        self._rfile.close()
+        self._sock.close()
+
+
+class ToolSchemaCache:
+    """tools/list result persisted on disk for one MCP server image.
+
+    The tool schema is a pure function of the image tag, so the file is
+    named after it; storing a new tag removes files left by older ones.
+    """
+
+    def __init__(self, root: Path, image: str = DOCKER_IMAGE):
+        self.image = image
+        self.root = root
+        slug = re.sub(r"[^A-Za-z0-9.]+", "-", image)
+        self.path = root / f"tools-{slug}.json"
+
+    def load(self) -> list[dict[str, Any]] | None:
+        """Return the cached tool definitions, or None on a miss."""
+        try:
+            data = json.loads(self.path.read_text())
+        except (OSError, ValueError):
+            return None
+        if not isinstance(data, dict) or data.get("image") != self.image:
+            return None
+        return data.get("tools")
+
+    def store(self, tools: list[dict[str, Any]]) -> None:
+        """Persist tool definitions and drop those of other image tags."""
+        for stale in self.root.glob("tools-*.json"):
+            if stale != self.path:
+                stale.unlink(missing_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=self.root, suffix=".tmp")
+        with os.fdopen(fd, "w") as f:
+            json.dump({"image": self.image, "tools": tools}, f)
+        os.replace(tmp, self.path)
+
+
+class LazyMCPClient(MCPClient):
+    """Defer container spawn (or broker connect) until the first MCP request.
+
+    Commands served entirely by the HCP REST API never pay for Docker, and
+    with a `tools_cache` neither do list-tools and describe once the
+    schema has been seen for the current image.
+    """
+
+    def __init__(
+        self, session: SessionManager, tools_cache: ToolSchemaCache | None = None
+    ):
+        super().__init__()
+        self._session = session
+        self._tools_cache = tools_cache
+        self._client: MCPClient | None = None
+        self._resolve_lock = threading.Lock()
+
+    def _resolve(self) -> MCPClient:
+        with self._resolve_lock:
+            if self._client is None:
+                self._client = self._session.get_client()
+            return self._client
+
+    @property
+    def started(self) -> bool:
+        """Whether an MCP session has been created."""
+        return self._client is not None
+
+    def submit(
+        self, method: str, params: dict[str, Any] | None = None
+    ) -> Future[dict[str, Any]]:
+        """Send a JSON-RPC request; the Future resolves to the raw response."""
+        return self._resolve().submit(method, params)
+
+    def notify(self, method: str, params: dict[str, Any] | None = None) -> None:
+        """Send a JSON-RPC notification (no id, no reply expected)."""
+        self._resolve().notify(method, params)
+
+    def initialize(self) -> dict[str, Any]:
+        """Initialize the MCP session."""
+        return self._resolve().initialize()
+
+    def fetch_tools(self) -> dict[str, Any]:
+        """Return tool definitions, from the schema cache when possible."""
+        cached = self._tools_cache.load() if self._tools_cache else None
+        if cached is not None:
+            return {"success": True, "tools": cached}
+        result = self._resolve().fetch_tools()
+        if result.get("success") and self._tools_cache:
+            self._tools_cache.store(result["tools"])
+        return result
+
+    def submit_tool(
+        self, tool_name: str, arguments: dict[str, Any]
+    ) -> Future[dict[str, Any]]:
+        """Call a tool without waiting; resolves to the `call_tool` result."""
+        return self._resolve().submit_tool(tool_name, arguments)
+
+    def close(self):
+        """Nothing to release; SessionManager.cleanup owns the session."""
+
+
+def _broker_enabled() -> bool:
+    """Broker use is on unless TFE_MCP_BROKER is set to a false value."""
+    return os.environ.get("TFE_MCP_BROKER", "1").lower() not in ("0", "false", "no")
+
+
+def broker_socket_path(env: dict[str, str]) -> Path:
+    """Socket path for the broker serving this image, address and token.
+
+    The name is a digest of all three so a token or image change never reuses
+    a broker started with different credentials. The parent directory is
+    private to the current user.
+    """
+    key = f"{DOCKER_IMAGE}|{env['TFE_ADDRESS']}|{env['TFE_TOKEN']}"
+    digest = hashlib.sha256(key.encode()).hexdigest()[:16]
+    base = os.environ.get("XDG_RUNTIME_DIR") or tempfile.gettempdir()
+    runtime_dir = Path(base) / f"terraform-mcp-{os.getuid()}"
+    runtime_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+    return runtime_dir / f"broker-{digest}.sock"
+
+
+class MCPBroker:
+    """Serve one initialized MCP session to many CLI invocations.
+
+    Speaks newline-delimited JSON-RPC on a Unix socket. `initialize` is
+    answered from the cached handshake, `tools/*` requests are forwarded to
+    the container, and the broker exits after `idle_timeout` seconds without
+    a request or when its container dies.
+    """
+
+    def __init__(self, client: MCPStdioClient, path: Path, idle_timeout: float):
+        self._client = client
+        self._path = path
+        self._idle_timeout = idle_timeout
+        self._lock = threading.Lock()
+        self._started = time.time()
+        self._last_activity = time.monotonic()
+        self._requests = 0
+        self._stop = threading.Event()
+        self._init_result: dict[str, Any] = {}
+
+    def _handle(
+        self, request: dict[str, Any]
+    ) -> Future[dict[str, Any]] | dict[str, Any] | None:
+        """Answer one request; None for notifications.
+
+        Forwarded `tools/*` requests return a Future so one connection can
+        pipeline many requests through the shared session.
+        """
+        method = request.get("method", "")
+        if method.startswith("notifications/"):
+            return None
+
+        self._last_activity = time.monotonic()
+        if method == "initialize":
+            return dict(self._init_result)
+        if method == "broker/status":
+            return {
+                "result": {
+                    "pid": os.getpid(),
+                    "image": DOCKER_IMAGE,
+                    "socket": str(self._path),
+                    "uptime": round(time.time() - self._started),
+                    "requests": self._requests,
+                    "idle_timeout": self._idle_timeout,
+                }
+            }
+        if method == "broker/shutdown":
+            self._stop.set()
+            return {"result": {"stopping": True}}
+
+        with self._lock:
+            self._requests += 1
+        return self._client.submit(method, request.get("params"))
+
+    def _make_handler(self) -> type[socketserver.StreamRequestHandler]:
+        broker = self
+
+        class Handler(socketserver.StreamRequestHandler):
+            def setup(self):
+                super().setup()
+                self._write_lock = threading.Lock()
+
+            def _reply(self, request_id: Any, response: dict[str, Any]) -> None:
+                response = dict(response)
+                response["jsonrpc"] = "2.0"
+                response["id"] = request_id
+                with self._write_lock:
+                    try:
+                        self.wfile.write((json.dumps(response) + "\n").encode())
+                        self.wfile.flush()
+                    except (OSError, ValueError):
+                        pass  # client went away
+
+            def handle(self):
+                for line in self.rfile:
+                    try:
+                        request = json.loads(line)
+                    except json.JSONDecodeError as e:
+                        self._reply(
+                            None,
+                            {"error": {"code": -32700, "message": f"Parse error: {e}"}},
+                        )
+                        continue
+                    request_id = request.get("id")
+                    response = broker._handle(request)
+                    if isinstance(response, Future):
+                        response.add_done_callback(
+                            lambda f, rid=request_id: self._reply(rid, f.result())
+                        )
+                    elif response is not None:
+                        self._reply(request_id, response)
+
+        return Handler
+
+    def serve(self) -> int:
+        """Initialize the session, then serve until idle, stopped or dead."""
+        result = self._client.initialize()
+        if "error" in result:
+            message = result["error"].get("message", str(result["error"]))
+            print(f"Error: MCP initialize failed: {message}", file=sys.stderr)
+            return 1
+        self._init_result = {"result": result.get("result", {})}
+
+        if self._path.exists():
+            self._path.unlink()
+        server = socketserver.ThreadingUnixStreamServer(
+            str(self._path), self._make_handler()
+        )
+        server.daemon_threads = True
+        server.timeout = 1.0
+        os.chmod(self._path, 0o600)
+        try:
+            while not self._stop.is_set():
+                server.handle_request()
+                if time.monotonic() - self._last_activity > self._idle_timeout:
+                    print("Broker idle timeout reached", file=sys.stderr)
+                    break
+                if self._client._proc.poll() is not None:
+                    print("MCP server process exited", file=sys.stderr)
+                    return 1
+        finally:
+            server.server_close()
+            if self._path.exists():
+                self._path.unlink()
+        return 0
 
 
 class SessionManager:
@@ -193,7 +894,7 @@ class SessionManager:
 
     def __init__(self):
         self._proc: subprocess.Popen | None = None
-        self._client: MCPStdioClient | None = None
+        self._client: MCPClient | None = None
         self._env_file_path: str | None = None
 
     def _get_env(self) -> dict[str, str]:
@@ -250,9 +951,21 @@ class SessionManager:
                 self._env_file_path = None
             raise
 
-    def get_client(self) -> MCPStdioClient:
-        """Get or create MCP client."""
-        self._proc = self._spawn_container()
+    def get_client(self, use_broker: bool = True) -> MCPClient:
+        """Get or create MCP client.
+
+        Connects to a running broker when one serves this image and token,
+        otherwise spawns a fresh container.
+        """
+        if use_broker and _broker_enabled():
+            with TIMINGS.span("broker.connect"):
+                broker = BrokerClient.connect(broker_socket_path(self._get_env()))
+            if broker is not None:
+                self._client = broker
+                return broker
+
+        with TIMINGS.span("docker.spawn"):
+            self._proc = self._spawn_container()
         self._client = MCPStdioClient(self._proc)
         return self._client
 
@@ -260,7 +973,8 @@ class SessionManager:
         """Clean up resources."""
         # Close MCP client first
         if self._client:
-            self._client.close()
+            with TIMINGS.span("mcp.close"):
+                self._client.close()
             self._client = None
 
         # Terminate container process (redundant but safe)
@@ -278,12 +992,134 @@ class SessionManager:
             self._env_file_path = None
 
 
+# API collection holding each log kind's log-read-url
+_LOG_ENDPOINTS = {"plan": "plans", "apply": "applies"}
+_LOG_KINDS = {"plans": "plan", "applies": "apply"}
+
+
+class HCPTerraformError(Exception):
+    """An HCP Terraform API request failed; raised by the paging iterators.
+
+    `status` is the HTTP status code when the API answered with an error.
+    """
+
+    def __init__(self, message: str | None, status: int | None = None):
+        super().__init__(message)
+        self.status = status
+
+
+def _http_error_message(e: httpx.HTTPError) -> str:
+    """Render an httpx error the way every HCPTerraformClient method reports it."""
+    if isinstance(e, httpx.HTTPStatusError):
+        return f"HTTP {e.response.status_code}: {e.response.text[:200]}"
+    if isinstance(e, httpx.TimeoutException):
+        return f"Request timed out: {e}"
+    return f"Network error: {e}"
+
+
+def _retry_after(response: httpx.Response, default: float) -> float:
+    """Seconds to wait per a Retry-After header (delta-seconds or HTTP date)."""
+    value = response.headers.get("retry-after", "")
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        when = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return default
+    return max(when.timestamp() - time.time(), 0.0)
+
+
+_RETRY_STATUSES = frozenset({429, 502, 503, 504})
+
+
+def _retry_delay(response: httpx.Response | None, attempt: int) -> float:
+    """Seconds to wait before retry number `attempt` (0-based).
+
+    The server's Retry-After, then X-RateLimit-Reset, wins over jittered
+    exponential backoff.
+    """
+    backoff = HCP_RETRY_BACKOFF * 2**attempt * random.uniform(0.5, 1.0)
+    if response is None:
+        return backoff
+    if "retry-after" in response.headers:
+        return _retry_after(response, backoff)
+    try:
+        return max(float(response.headers["x-ratelimit-reset"]), 0.0)
+    except (KeyError, ValueError):
+        return backoff
+
+
+class TokenBucket:
+    """Thread-safe token bucket pacing callers to `rate` requests per second.
+
+    Bursts of up to `rate` requests go straight through; beyond that each
+    caller sleeps until its token accrues. `pause` puts the bucket in debt
+    so that every caller holds off, e.g. after a 429.
+    """
+
+    def __init__(self, rate: float):
+        self.rate = rate
+        self._tokens = rate
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.rate, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def acquire(self) -> None:
+        """Take one token, sleeping until it has accrued.
+
+        Tokens are reserved under the lock, so concurrent callers queue up
+        behind each other instead of racing for the next one.
+        """
+        with self._lock:
+            self._refill()
+            self._tokens -= 1
+            wait = -self._tokens / self.rate
+        if wait > 0:
+            time.sleep(wait)
+
+    def pause(self, seconds: float) -> None:
+        """Hold every caller off for at least `seconds`."""
+        with self._lock:
+            self._refill()
+            self._tokens = min(self._tokens, 1 - seconds * self.rate)
+
+    def set_rate(self, rate: float) -> None:
+        """Adopt a new sustained rate, e.g. from an X-RateLimit-Limit header."""
+        with self._lock:
+            self._refill()
+            self.rate = max(rate, 1.0)
+
+
 class HCPTerraformClient:
-    """Direct HCP Terraform API client for operations not exposed via MCP."""
+    """Direct HCP Terraform API client for operations not exposed via MCP.
+
+    The underlying httpx.Clients are thread-safe and keep up to
+    `max_connections` keep-alive connections each (over HTTP/2 when the
+    h2 package is installed), so one instance can serve a worker pool.
+    Every request goes through `_request`, which paces API calls with a
+    shared token bucket and retries rate-limited and failed requests.
+    """
 
-    def __init__(self, token: str, address: str = DEFAULT_TFE_ADDRESS):
+    def __init__(
+        self,
+        token: str,
+        address: str = DEFAULT_TFE_ADDRESS,
+        max_connections: int = 10,
+        rate_limit: float = HCP_RATE_LIMIT,
+        max_retries: int = HCP_MAX_RETRIES,
+    ):
         if not token:
             raise ValueError("HCP Terraform API token is required")
+        limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_connections,
+        )
         self._client = httpx.Client(
             base_url=address.rstrip("/"),
             headers={
@@ -291,75 +1127,230 @@ class HCPTerraformClient:
                 "Content-Type": "application/vnd.api+json",
             },
             timeout=30.0,
+            limits=limits,
+            http2=HTTP2_AVAILABLE,
+        )
+        # Log-read URLs are pre-signed archivist links on another host; they
+        # get their own pool and must never receive the API token.
+        self._log_client = httpx.Client(
+            timeout=30.0, limits=limits, http2=HTTP2_AVAILABLE
         )
+        self._bucket = TokenBucket(rate_limit)
+        self.max_retries = max_retries
 
-    def get_plan_logs(self, plan_id: str) -> dict[str, Any]:
-        """Fetch plan logs from HCP Terraform API."""
+    def _observe_rate_limit(self, response: httpx.Response) -> None:
+        """Follow the X-RateLimit-* headers HCP sends with API responses."""
+        headers = response.headers
         try:
-            resp = self._client.get(f"/api/v2/plans/{plan_id}")
-            resp.raise_for_status()
-            plan_data = resp.json()
-
-            log_url = (
-                plan_data.get("data", {}).get("attributes", {}).get("log-read-url")
-            )
-            if not log_url:
-                return {"success": False, "error": "No log URL available"}
+            if "x-ratelimit-limit" in headers:
+                self._bucket.set_rate(float(headers["x-ratelimit-limit"]))
+            if float(headers.get("x-ratelimit-remaining", 1)) < 1:
+                self._bucket.pause(float(headers.get("x-ratelimit-reset", 1)))
+        except ValueError:
+            pass
+
+    def _request(
+        self,
+        url: str,
+        params: dict[str, Any] | None = None,
+        log: bool = False,
+        stream: bool = False,
+    ) -> httpx.Response:
+        """GET `url` with bounded retries and return the final response.
+
+        API requests (`log` false) take a token from the rate-limit bucket
+        first; log reads use the archivist pool and are not paced. 429, 502,
+        503 and 504 responses and transport errors are retried up to
+        `max_retries` times, unless the server asks for a wait longer than
+        HCP_RETRY_MAX_WAIT. Error statuses are returned, not raised;
+        transport errors are raised once retries run out. With `stream`, the
+        caller must close the response.
+        """
+        client = self._log_client if log else self._client
+        attempt = 0
+        while True:
+            if not log:
+                self._bucket.acquire()
+            request = client.build_request("GET", url, params=params)
+            try:
+                response = client.send(request, stream=stream)
+            except httpx.TransportError:
+                if attempt >= self.max_retries:
+                    raise
+                delay = _retry_delay(None, attempt)
+            else:
+                if not log:
+                    self._observe_rate_limit(response)
+                if (
+                    response.status_code not in _RETRY_STATUSES
+                    or attempt >= self.max_retries
+                ):
+                    return response
+                delay = _retry_delay(response, attempt)
+                if delay > HCP_RETRY_MAX_WAIT:
+                    return response
+                response.close()
+                if response.status_code == 429 and not log:
+                    self._bucket.pause(delay)
+            with TIMINGS.span("hcp.retry_wait", attempt=attempt + 1):
+                time.sleep(delay)
+            attempt += 1
+
+    def _get_json(
+        self, path: str, params: dict[str, Any] | None = None
+    ) -> dict[str, Any]:
+        """GET an API path (or absolute `links.next` URL) as {"success", "data"}.
 
-            log_resp = httpx.get(log_url, timeout=30.0)
-            log_resp.raise_for_status()
-            return {"success": True, "logs": log_resp.text}
+        Retries happen in `_request`. Rate-limited (429) and unavailable
+        (503) responses that outlast them also carry the number of seconds
+        to back off under "retry_after".
+        """
+        try:
+            with TIMINGS.span("hcp.request", path=str(httpx.URL(path).path)):
+                resp = self._request(path, params)
+            resp.raise_for_status()
+            return {"success": True, "data": resp.json()}
         except httpx.HTTPStatusError as e:
-            return {
+            error = {
                 "success": False,
-                "error": f"HTTP {e.response.status_code}: {e.response.text[:200]}",
+                "error": _http_error_message(e),
+                "status": e.response.status_code,
             }
-        except httpx.TimeoutException as e:
-            return {"success": False, "error": f"Request timed out: {e}"}
+            if e.response.status_code in (429, 503):
+                error["retry_after"] = _retry_after(e.response, POLL_INTERVAL)
+            return error
         except httpx.RequestError as e:
-            return {"success": False, "error": f"Network error: {e}"}
+            return {"success": False, "error": _http_error_message(e)}
 
-    def get_apply_logs(self, apply_id: str) -> dict[str, Any]:
-        """Fetch apply logs from HCP Terraform API."""
-        try:
-            resp = self._client.get(f"/api/v2/applies/{apply_id}")
-            resp.raise_for_status()
-            apply_data = resp.json()
+    def _iter_pages(
+        self,
+        path: str,
+        params: dict[str, Any] | None = None,
+        included: dict[tuple[str, str], dict[str, Any]] | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """Yield JSON:API resources across pages by following `links.next`.
+
+        Sideloaded resources (`include=`) are collected into `included`,
+        keyed by (type, id), before each page's resources are yielded.
+        Raises HCPTerraformError if a page request fails.
+        """
+        url: str | None = path
+        while url:
+            result = self._get_json(url, params)
+            if not result.get("success"):
+                raise HCPTerraformError(result.get("error"), result.get("status"))
+            body = result["data"]
+            if included is not None:
+                for resource in body.get("included") or []:
+                    included[(resource.get("type"), resource.get("id"))] = resource
+            yield from body.get("data") or []
+            url = (body.get("links") or {}).get("next")
+            # The next link already carries the query string
+            params = None
+
+    def iter_workspaces(
+        self, organization: str, page_size: int = 100
+    ) -> Iterator[dict[str, Any]]:
+        """Yield every workspace in an organization, one page at a time."""
+        yield from self._iter_pages(
+            f"/api/v2/organizations/{organization}/workspaces",
+            {"page[size]": page_size},
+        )
 
-            log_url = (
-                apply_data.get("data", {}).get("attributes", {}).get("log-read-url")
-            )
-            if not log_url:
-                return {"success": False, "error": "No log URL available"}
+    def get_workspace(self, organization: str, workspace: str) -> dict[str, Any]:
+        """Get a workspace by name."""
+        return self._get_json(
+            f"/api/v2/organizations/{organization}/workspaces/{workspace}"
+        )
 
-            log_resp = httpx.get(log_url, timeout=30.0)
-            log_resp.raise_for_status()
-            return {"success": True, "logs": log_resp.text}
-        except httpx.HTTPStatusError as e:
-            return {
-                "success": False,
-                "error": f"HTTP {e.response.status_code}: {e.response.text[:200]}",
-            }
-        except httpx.TimeoutException as e:
-            return {"success": False, "error": f"Request timed out: {e}"}
-        except httpx.RequestError as e:
-            return {"success": False, "error": f"Network error: {e}"}
+    def iter_current_outputs(self, workspace_id: str) -> Iterator[dict[str, Any]]:
+        """Yield the outputs of a workspace's current state version.
 
-    def get_run(self, run_id: str) -> dict[str, Any]:
-        """Get run details including plan/apply IDs."""
+        Uses current-state-version-outputs, which needs only output read
+        access. Raises HCPTerraformError if a request fails.
+        """
+        yield from self._iter_pages(
+            f"/api/v2/workspaces/{workspace_id}/current-state-version-outputs"
+        )
+
+    def get_log_url(self, kind: str, log_id: str) -> dict[str, Any]:
+        """Resolve the pre-signed log-read-url of a plan or apply.
+
+        `kind` is "plan" or "apply"; the result carries the URL under "url".
+        """
+        result = self._get_json(f"/api/v2/{_LOG_ENDPOINTS[kind]}/{log_id}")
+        if not result.get("success"):
+            return result
+        log_url = (
+            result["data"].get("data", {}).get("attributes", {}).get("log-read-url")
+        )
+        if not log_url:
+            return {"success": False, "error": "No log URL available"}
+        return {"success": True, "url": log_url}
+
+    def iter_log_lines(self, log_url: str) -> Iterator[str]:
+        """Stream a log body line by line over the pooled log client.
+
+        Memory stays flat regardless of log size. Raises HCPTerraformError if
+        the download fails, including part-way through.
+        """
+        try:
+            with (
+                TIMINGS.span("hcp.log_download"),
+                contextlib.closing(
+                    self._request(log_url, log=True, stream=True)
+                ) as resp,
+            ):
+                if resp.is_error:
+                    # The error message quotes the body; read it while open
+                    resp.read()
+                resp.raise_for_status()
+                yield from resp.iter_lines()
+        except (httpx.HTTPStatusError, httpx.RequestError) as e:
+            raise HCPTerraformError(_http_error_message(e)) from e
+
+    def read_log_chunk(self, log_url: str, offset: int, limit: int) -> bytes:
+        """Read up to `limit` bytes of a log starting at byte `offset`.
+
+        Archivist log URLs accept offset/limit query parameters, which lets a
+        log be tailed while the plan or apply is still writing it. Raises
+        HCPTerraformError on failure.
+        """
         try:
-            resp = self._client.get(f"/api/v2/runs/{run_id}")
+            with TIMINGS.span("hcp.log_chunk"):
+                resp = self._request(
+                    log_url, {"offset": offset, "limit": limit}, log=True
+                )
             resp.raise_for_status()
-            return {"success": True, "data": resp.json()}
-        except httpx.HTTPStatusError as e:
-            return {
-                "success": False,
-                "error": f"HTTP {e.response.status_code}: {e.response.text[:200]}",
-            }
-        except httpx.TimeoutException as e:
-            return {"success": False, "error": f"Request timed out: {e}"}
-        except httpx.RequestError as e:
-            return {"success": False, "error": f"Network error: {e}"}
+            return resp.content
+        except (httpx.HTTPStatusError, httpx.RequestError) as e:
+            raise HCPTerraformError(_http_error_message(e)) from e
+
+    def _get_logs(self, kind: str, log_id: str) -> dict[str, Any]:
+        url = self.get_log_url(kind, log_id)
+        if not url.get("success"):
+            return url
+        try:
+            return {"success": True, "logs": "\n".join(self.iter_log_lines(url["url"]))}
+        except HCPTerraformError as e:
+            return {"success": False, "error": str(e)}
+
+    def get_plan_logs(self, plan_id: str) -> dict[str, Any]:
+        """Fetch plan logs from HCP Terraform API."""
+        return self._get_logs("plan", plan_id)
+
+    def get_apply_logs(self, apply_id: str) -> dict[str, Any]:
+        """Fetch apply logs from HCP Terraform API."""
+        return self._get_logs("apply", apply_id)
+
+    def get_run(self, run_id: str, include: str | None = None) -> dict[str, Any]:
+        """Get run details including plan/apply IDs.
+
+        `include` sideloads related resources, e.g. "plan,apply" for their
+        log-read-urls, under the body's "included".
+        """
+        params = {"include": include} if include else None
+        return self._get_json(f"/api/v2/runs/{run_id}", params)
 
     def list_runs(
         self,
@@ -373,56 +1364,878 @@ class HCPTerraformClient:
         This method exists because the MCP server's list_runs tool is broken
         (returns empty/malformed data for all queries).
         """
-        try:
-            params: dict[str, Any] = {
-                "filter[organization][name]": organization,
-                "filter[workspace][name]": workspace,
-                "page[size]": page_size,
-            }
-            if status_filter:
-                params["filter[status]"] = status_filter
+        params: dict[str, Any] = {
+            "filter[organization][name]": organization,
+            "filter[workspace][name]": workspace,
+            "page[size]": page_size,
+        }
+        if status_filter:
+            params["filter[status]"] = status_filter
+        return self._get_json("/api/v2/runs", params)
 
-            resp = self._client.get("/api/v2/runs", params=params)
-            resp.raise_for_status()
-            return {"success": True, "data": resp.json()}
-        except httpx.HTTPStatusError as e:
-            return {
-                "success": False,
-                "error": f"HTTP {e.response.status_code}: {e.response.text[:200]}",
-            }
-        except httpx.TimeoutException as e:
-            return {"success": False, "error": f"Request timed out: {e}"}
-        except httpx.RequestError as e:
-            return {"success": False, "error": f"Network error: {e}"}
+    def iter_runs(
+        self,
+        organization: str,
+        workspace: str,
+        page_size: int = 100,
+        status_filter: str | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """Yield a workspace's runs, newest first, across every page.
+
+        Pages are fetched lazily, so a consumer that stops early (e.g. at a
+        created-at cutoff) never requests the rest. Raises
+        HCPTerraformError if a page request fails.
+        """
+        params: dict[str, Any] = {
+            "filter[organization][name]": organization,
+            "filter[workspace][name]": workspace,
+            "page[size]": page_size,
+        }
+        if status_filter:
+            params["filter[status]"] = status_filter
+        yield from self._iter_pages("/api/v2/runs", params)
+
+    def iter_org_runs(
+        self,
+        organization: str,
+        params: dict[str, Any] | None = None,
+        included: dict[tuple[str, str], dict[str, Any]] | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """Yield runs across every workspace of an organization.
+
+        `params` carries filters such as filter[status_group]=non_final.
+        Raises HCPTerraformError if a page request fails.
+        """
+        yield from self._iter_pages(
+            f"/api/v2/organizations/{organization}/runs", params, included
+        )
 
     def close(self):
+        """Close the HTTP clients."""
+        self._client.close()
+        self._log_client.close()
+
+
+class RegistryClient:
+    """Public Terraform Registry client, used to enumerate provider docs.
+
+    The MCP search_providers tool only returns top matches, so bulk
+    prefetching lists a provider version's documents here and still
+    fetches their content through MCP get_provider_details.
+    """
+
+    def __init__(self, address: str = REGISTRY_ADDRESS):
+        self._client = httpx.Client(base_url=address, timeout=30.0)
+
+    def _get(self, path: str, params: dict[str, Any] | None = None) -> Any:
+        try:
+            resp = self._client.get(path, params=params)
+            resp.raise_for_status()
+            return resp.json()
+        except (httpx.HTTPStatusError, httpx.RequestError) as e:
+            raise HCPTerraformError(_http_error_message(e)) from e
+
+    def latest_version(self, namespace: str, provider: str) -> tuple[str, str]:
+        """Return (version, provider-version id) of a provider's latest release.
+
+        Raises HCPTerraformError if the provider or version cannot be found.
+        """
+        version = self._get(f"/v1/providers/{namespace}/{provider}").get("version")
+        body = self._get(
+            f"/v2/providers/{namespace}/{provider}",
+            {"include": "provider-versions"},
+        )
+        for item in body.get("included") or []:
+            if item.get("attributes", {}).get("version") == version:
+                return version, item["id"]
+        raise HCPTerraformError(f"No registry release found for {namespace}/{provider}")
+
+    def iter_docs(self, provider_version_id: str, category: str) -> Iterator[dict]:
+        """Yield the document listings of one category for a provider version."""
+        page = 1
+        while True:
+            body = self._get(
+                "/v2/provider-docs",
+                {
+                    "filter[provider-version]": provider_version_id,
+                    "filter[category]": category,
+                    "filter[language]": "hcl",
+                    "page[number]": page,
+                },
+            )
+            docs = body.get("data") or []
+            yield from docs
+            if not docs or not (body.get("links") or {}).get("next"):
+                return
+            page += 1
+
+    def close(self) -> None:
         """Close the HTTP client."""
         self._client.close()
 
 
+class LogTailer:
+    """Incrementally read a plan or apply log while it is being written.
+
+    Tracks the byte offset already consumed and hands back only complete
+    new lines. The log is finished once the ETX (0x03) end marker arrives.
+    """
+
+    def __init__(
+        self,
+        hcp_client: HCPTerraformClient,
+        kind: str,
+        log_id: str,
+        chunk_size: int = LOG_CHUNK_SIZE,
+    ):
+        self.kind = kind
+        self.log_id = log_id
+        self.offset = 0
+        self.done = False
+        self._hcp = hcp_client
+        self._chunk_size = chunk_size
+        self._url: str | None = None
+        self._partial = b""
+
+    def _resolve_url(self) -> str:
+        result = self._hcp.get_log_url(self.kind, self.log_id)
+        if not result.get("success"):
+            raise HCPTerraformError(result.get("error"))
+        self._url = result["url"]
+        return self._url
+
+    def _read(self) -> bytes:
+        url = self._url or self._resolve_url()
+        try:
+            return self._hcp.read_log_chunk(url, self.offset, self._chunk_size)
+        except HCPTerraformError:
+            # Pre-signed log URLs expire; re-resolve once before giving up
+            url = self._resolve_url()
+            return self._hcp.read_log_chunk(url, self.offset, self._chunk_size)
+
+    def poll(self) -> list[str]:
+        """Return the complete lines appended since the last poll.
+
+        Raises HCPTerraformError if the log cannot be read.
+        """
+        lines: list[str] = []
+        while not self.done:
+            chunk = self._read()
+            if not chunk:
+                break
+            self.offset += len(chunk)
+            full_read = len(chunk) >= self._chunk_size
+            if b"\x03" in chunk:
+                chunk = chunk[: chunk.index(b"\x03")]
+                self.done = True
+            *complete, self._partial = (self._partial + chunk).split(b"\n")
+            lines.extend(line.decode("utf-8", errors="replace") for line in complete)
+            if not full_read:
+                break
+        if self.done and self._partial:
+            lines.append(self._partial.decode("utf-8", errors="replace"))
+            self._partial = b""
+        return lines
+
+
+class PollScheduler:
+    """Decide when each watched run is polled next.
+
+    A run that just changed status is polled again after `fast_interval`.
+    While it sits unchanged in a queued or planning state the delay doubles,
+    with jitter, up to `max_interval`; other states are polled every
+    `interval`. A server-requested Retry-After pauses every run.
+    """
+
+    BACKOFF_STATES = frozenset({"pending", "plan_queued", "planning"})
+
+    def __init__(
+        self,
+        interval: float = POLL_INTERVAL,
+        max_interval: float = MAX_POLL_INTERVAL,
+        fast_interval: float = FAST_POLL_INTERVAL,
+    ):
+        self.interval = interval
+        self.max_interval = max(max_interval, interval)
+        self.fast_interval = min(fast_interval, interval)
+        self._due: dict[str, float] = {}
+        self._delays: dict[str, float] = {}
+        self._not_before = 0.0
+
+    def __len__(self) -> int:
+        return len(self._due)
+
+    def add(self, key: str) -> None:
+        """Schedule `key` to be polled immediately."""
+        self._due[key] = time.monotonic()
+
+    def remove(self, key: str) -> None:
+        """Stop polling `key`."""
+        self._due.pop(key, None)
+        self._delays.pop(key, None)
+
+    def wait(self) -> str:
+        """Sleep until the next run is due and return its key."""
+        key = min(self._due, key=self._due.__getitem__)
+        delay = max(self._due[key], self._not_before) - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+        return key
+
+    def record(self, key: str, status: str, changed: bool) -> float:
+        """Schedule the next poll of `key` after observing `status`.
+
+        Returns the delay chosen, in seconds.
+        """
+        if changed:
+            delay = self.fast_interval
+        elif status in self.BACKOFF_STATES:
+            previous = self._delays.get(key, self.fast_interval)
+            delay = min(previous * 2, self.max_interval)
+        else:
+            delay = self.interval
+        self._delays[key] = delay
+        if not changed and status in self.BACKOFF_STATES:
+            delay = min(delay * random.uniform(0.8, 1.2), self.max_interval)
+        self._due[key] = time.monotonic() + delay
+        return delay
+
+    def defer(self, seconds: float) -> None:
+        """Hold off every poll for `seconds` (e.g. after HTTP 429)."""
+        self._not_before = max(self._not_before, time.monotonic() + seconds)
+
+
+def cache_dir() -> Path:
+    """Per-user cache directory ($XDG_CACHE_HOME/terraform-mcp), created on use."""
+    base = os.environ.get("XDG_CACHE_HOME") or str(Path.home() / ".cache")
+    path = Path(base) / "terraform-mcp"
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+def _phase_seconds(
+    timestamps: dict[str, str], start_key: str, end_keys: tuple[str, ...]
+) -> float | None:
+    """Seconds between a status timestamp and the first end timestamp present."""
+    start = timestamps.get(start_key)
+    end = next((timestamps[key] for key in end_keys if timestamps.get(key)), None)
+    if not start or not end:
+        return None
+    return (parse_since(end) - parse_since(start)).total_seconds()
+
+
+def _percentile(values: list[float], pct: float) -> float | None:
+    """Linearly interpolated percentile of `values` (pct in 0-100)."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * pct / 100
+    low = int(rank)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+class RunHistoryStore:
+    """Local SQLite mirror of run metadata, keyed by run id.
+
+    Holds only what duration and failure analytics need: status, the
+    status-timestamps map, resource counts and plan-only/destroy flags.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS runs (
+            id TEXT PRIMARY KEY,
+            organization TEXT NOT NULL,
+            workspace TEXT NOT NULL,
+            status TEXT NOT NULL,
+            created_at TEXT NOT NULL,
+            plan_only INTEGER NOT NULL,
+            is_destroy INTEGER NOT NULL,
+            additions INTEGER,
+            changes INTEGER,
+            destructions INTEGER,
+            status_timestamps TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS runs_by_workspace
+            ON runs (organization, workspace, created_at);
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._db = sqlite3.connect(path)
+        self._db.executescript(self.SCHEMA)
+
+    def resume_point(self, organization: str, workspace: str) -> str | None:
+        """created-at to sync back to: the newest run, or the oldest unfinished.
+
+        Runs that were still in progress at the last sync are fetched again
+        so their final status and timestamps are recorded.
+        """
+        newest, oldest_open = self._db.execute(
+            f"""
+            SELECT MAX(created_at),
+                   MIN(CASE WHEN status NOT IN ({",".join("?" * len(TERMINAL_STATES))})
+                       THEN created_at END)
+            FROM runs WHERE organization = ? AND workspace = ?
+            """,
+            (*sorted(TERMINAL_STATES), organization, workspace),
+        ).fetchone()
+        return oldest_open or newest
+
+    def upsert(
+        self, organization: str, workspace: str, runs: list[dict[str, Any]]
+    ) -> None:
+        """Insert or refresh JSON:API run objects in one transaction."""
+        rows = []
+        for run in runs:
+            attrs = run.get("attributes", {})
+            rows.append(
+                (
+                    run.get("id"),
+                    organization,
+                    workspace,
+                    attrs.get("status", ""),
+                    attrs.get("created-at", ""),
+                    int(bool(attrs.get("plan-only"))),
+                    int(bool(attrs.get("is-destroy"))),
+                    attrs.get("resource-additions"),
+                    attrs.get("resource-changes"),
+                    attrs.get("resource-destructions"),
+                    json.dumps(attrs.get("status-timestamps") or {}),
+                )
+            )
+        with self._db:
+            self._db.executemany(
+                "INSERT OR REPLACE INTO runs VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+
+    def stats(
+        self,
+        organization: str,
+        workspaces: list[str] | None = None,
+        since: str | None = None,
+    ) -> list[dict[str, Any]]:
+        """Per-workspace run counts, error rate and p50/p95 phase durations.
+
+        Durations are in seconds and only count phases that completed;
+        the error rate is errored runs over finished runs.
+        """
+        query = "SELECT workspace, status, status_timestamps FROM runs WHERE organization = ?"
+        params: list[Any] = [organization]
+        if workspaces:
+            query += f" AND workspace IN ({','.join('?' * len(workspaces))})"
+            params.extend(workspaces)
+        if since:
+            query += " AND created_at >= ?"
+            params.append(since)
+
+        grouped: dict[str, dict[str, list]] = {}
+        for workspace, status, timestamps_json in self._db.execute(query, params):
+            group = grouped.setdefault(
+                workspace, {"statuses": [], "plan": [], "apply": []}
+            )
+            group["statuses"].append(status)
+            timestamps = json.loads(timestamps_json)
+            plan = _phase_seconds(
+                timestamps, "planning-at", ("planned-at", "planned-and-finished-at")
+            )
+            apply = _phase_seconds(timestamps, "applying-at", ("applied-at",))
+            if plan is not None:
+                group["plan"].append(plan)
+            if apply is not None:
+                group["apply"].append(apply)
+
+        rows = []
+        for workspace in sorted(grouped):
+            group = grouped[workspace]
+            finished = [s for s in group["statuses"] if s in TERMINAL_STATES]
+            errored = finished.count("errored")
+            rows.append(
+                {
+                    "workspace": workspace,
+                    "runs": len(group["statuses"]),
+                    "errored": errored,
+                    "error_rate": round(errored / len(finished), 3)
+                    if finished
+                    else None,
+                    "plan_p50": _percentile(group["plan"], 50),
+                    "plan_p95": _percentile(group["plan"], 95),
+                    "apply_p50": _percentile(group["apply"], 50),
+                    "apply_p95": _percentile(group["apply"], 95),
+                }
+            )
+        return rows
+
+    def close(self) -> None:
+        """Close the database."""
+        self._db.close()
+
+
+class RunCache:
+    """On-disk cache of terminal runs and their plan/apply logs.
+
+    Runs in a terminal state never change, so their JSON and logs are
+    stored gzip-compressed under immutable keys (run, plan and apply ids)
+    and served without touching the network. Reads refresh a file's mtime;
+    writes evict the least recently used files once the total size exceeds
+    `max_bytes`.
+    """
+
+    def __init__(self, root: Path, max_bytes: int = RUN_CACHE_MAX_BYTES):
+        self.root = root
+        self.max_bytes = max_bytes
+        root.mkdir(parents=True, exist_ok=True)
+
+    def _hit(self, name: str) -> Path | None:
+        path = self.root / name
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        return path
+
+    def _commit(self, tmp: str, name: str) -> None:
+        os.replace(tmp, self.root / name)
+        self._evict()
+
+    def _evict(self) -> None:
+        entries = []
+        for path in self.root.glob("*.gz"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+
+    def get_run(self, run_id: str) -> dict[str, Any] | None:
+        """Return a cached terminal run object, or None."""
+        path = self._hit(f"run-{run_id}.json.gz")
+        if path is None:
+            return None
+        try:
+            with gzip.open(path, "rt", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            path.unlink(missing_ok=True)
+            return None
+
+    def put_run(self, run: dict[str, Any]) -> None:
+        """Cache a run object if, and only if, it has reached a terminal state."""
+        if not run.get("id"):
+            return
+        if run.get("attributes", {}).get("status") not in TERMINAL_STATES:
+            return
+        fd, tmp = tempfile.mkstemp(dir=self.root, suffix=".tmp")
+        with os.fdopen(fd, "wb") as raw, gzip.open(raw, "wt", encoding="utf-8") as f:
+            json.dump(run, f)
+        self._commit(tmp, f"run-{run['id']}.json.gz")
+
+    def get_outputs(self, state_version_id: str) -> dict[str, Any] | None:
+        """Return the cached (redacted) outputs of a state version, or None."""
+        path = self._hit(f"outputs-{state_version_id}.json.gz")
+        if path is None:
+            return None
+        try:
+            with gzip.open(path, "rt", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            path.unlink(missing_ok=True)
+            return None
+
+    def put_outputs(self, state_version_id: str, outputs: dict[str, Any]) -> None:
+        """Cache a state version's outputs; state versions never change.
+
+        Callers MUST redact sensitive values first: the cache is plain
+        gzip on disk.
+        """
+        fd, tmp = tempfile.mkstemp(dir=self.root, suffix=".tmp")
+        with os.fdopen(fd, "wb") as raw, gzip.open(raw, "wt", encoding="utf-8") as f:
+            json.dump(outputs, f)
+        self._commit(tmp, f"outputs-{state_version_id}.json.gz")
+
+    def iter_log(self, kind: str, log_id: str) -> Iterator[str] | None:
+        """Return the cached raw lines of a plan/apply log, or None on a miss.
+
+        The entry is decoded once up front: a corrupt or truncated file is
+        removed and reported as a miss, so the log is downloaded again.
+        Should reading still fail later, it raises HCPTerraformError.
+        """
+        path = self._hit(f"{kind}-{log_id}.log.gz")
+        if path is None:
+            return None
+        try:
+            with gzip.open(path, "rt", encoding="utf-8") as f:
+                for _ in f:
+                    pass
+        except (OSError, EOFError, ValueError):
+            path.unlink(missing_ok=True)
+            return None
+
+        def lines() -> Iterator[str]:
+            try:
+                with gzip.open(path, "rt", encoding="utf-8") as f:
+                    for line in f:
+                        yield line.rstrip("\n")
+            except (OSError, EOFError, ValueError) as e:
+                path.unlink(missing_ok=True)
+                raise HCPTerraformError(f"Unreadable cached log: {e}") from e
+
+        return lines()
+
+    def tee_log(self, kind: str, log_id: str, lines: Iterable[str]) -> Iterator[str]:
+        """Yield `lines` while writing them to the cache.
+
+        The entry is only committed once the whole log has been read and
+        its ETX (0x03) end marker seen. An interrupted download, or a log
+        that a run reported terminal before it was fully flushed, leaves
+        nothing behind.
+        """
+        fd, tmp = tempfile.mkstemp(dir=self.root, suffix=".tmp")
+        complete = False
+        try:
+            with (
+                os.fdopen(fd, "wb") as raw,
+                gzip.open(raw, "wt", encoding="utf-8") as out,
+            ):
+                for line in lines:
+                    out.write(line + "\n")
+                    complete = complete or "\x03" in line
+                    yield line
+        finally:
+            if complete:
+                self._commit(tmp, f"{kind}-{log_id}.log.gz")
+            else:
+                Path(tmp).unlink(missing_ok=True)
+
+
+class DocsCache:
+    """Local provider documentation cache with a full-text index.
+
+    Documents are keyed by namespace/provider/version/doc-id and never
+    change once fetched. Search results (which doc a slug resolves to) are
+    kept for `ttl` seconds, since "latest" moves when a provider ships. The
+    index uses SQLite FTS5 when available and falls back to LIKE matching.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS docs (
+            namespace TEXT NOT NULL,
+            provider TEXT NOT NULL,
+            version TEXT NOT NULL,
+            doc_id TEXT NOT NULL,
+            category TEXT,
+            title TEXT,
+            description TEXT,
+            content TEXT,
+            PRIMARY KEY (namespace, provider, version, doc_id)
+        );
+        CREATE TABLE IF NOT EXISTS searches (
+            namespace TEXT NOT NULL,
+            provider TEXT NOT NULL,
+            doc_type TEXT NOT NULL,
+            slug TEXT NOT NULL,
+            version TEXT NOT NULL,
+            results TEXT NOT NULL,
+            fetched_at REAL NOT NULL,
+            PRIMARY KEY (namespace, provider, doc_type, slug)
+        );
+    """
+
+    def __init__(self, path: Path, ttl: float = DOCS_CACHE_TTL):
+        self.ttl = ttl
+        self._db = sqlite3.connect(path)
+        self._db.executescript(self.SCHEMA)
+        try:
+            self._db.execute(
+                "CREATE VIRTUAL TABLE IF NOT EXISTS docs_fts USING fts5("
+                "namespace UNINDEXED, provider UNINDEXED, version UNINDEXED, "
+                "doc_id UNINDEXED, title, description, content)"
+            )
+            self.fts = True
+        except sqlite3.OperationalError:
+            self.fts = False
+
+    def get_search(
+        self, namespace: str, provider: str, doc_type: str, slug: str
+    ) -> dict[str, Any] | None:
+        """Return a fresh cached search as {"version", "results"}, or None."""
+        row = self._db.execute(
+            "SELECT version, results FROM searches WHERE namespace = ? AND "
+            "provider = ? AND doc_type = ? AND slug = ? AND fetched_at > ?",
+            (namespace, provider, doc_type, slug.lower(), time.time() - self.ttl),
+        ).fetchone()
+        if row is None:
+            return None
+        return {"version": row[0], "results": json.loads(row[1])}
+
+    def put_search(
+        self,
+        namespace: str,
+        provider: str,
+        doc_type: str,
+        slug: str,
+        version: str,
+        results: list[dict[str, Any]],
+    ) -> None:
+        """Record search results and the documents they point at."""
+        with self._db:
+            self._record_search(namespace, provider, doc_type, slug, version, results)
+
+    def put_listing(
+        self,
+        namespace: str,
+        provider: str,
+        doc_type: str,
+        version: str,
+        entries: list[dict[str, Any]],
+    ) -> None:
+        """Record a full document listing, each entry resolving its own title."""
+        with self._db:
+            for entry in entries:
+                self._record_search(
+                    namespace, provider, doc_type, entry["title"], version, [entry]
+                )
+
+    def _record_search(
+        self,
+        namespace: str,
+        provider: str,
+        doc_type: str,
+        slug: str,
+        version: str,
+        results: list[dict[str, Any]],
+    ) -> None:
+        self._db.execute(
+            "INSERT OR REPLACE INTO searches VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (
+                namespace,
+                provider,
+                doc_type,
+                slug.lower(),
+                version,
+                json.dumps(results),
+                time.time(),
+            ),
+        )
+        self._db.executemany(
+            "INSERT OR IGNORE INTO docs (namespace, provider, version, doc_id, "
+            "category, title, description) VALUES (?, ?, ?, ?, ?, ?, ?)",
+            [
+                (
+                    namespace,
+                    provider,
+                    version,
+                    str(entry.get("id")),
+                    entry.get("category"),
+                    entry.get("title"),
+                    entry.get("description"),
+                )
+                for entry in results
+                if entry.get("id")
+            ],
+        )
+
+    def get_content(
+        self, namespace: str, provider: str, version: str, doc_id: str
+    ) -> str | None:
+        """Return a document's cached markdown, or None if not fetched yet."""
+        row = self._db.execute(
+            "SELECT content FROM docs WHERE namespace = ? AND provider = ? AND "
+            "version = ? AND doc_id = ?",
+            (namespace, provider, version, str(doc_id)),
+        ).fetchone()
+        return row[0] if row else None
+
+    def put_content(
+        self, namespace: str, provider: str, version: str, doc_id: str, content: str
+    ) -> None:
+        """Store a document's markdown and (re)index it."""
+        key = (namespace, provider, version, str(doc_id))
+        with self._db:
+            self._db.execute(
+                "INSERT OR IGNORE INTO docs (namespace, provider, version, doc_id) "
+                "VALUES (?, ?, ?, ?)",
+                key,
+            )
+            self._db.execute(
+                "UPDATE docs SET content = ? WHERE namespace = ? AND provider = ? "
+                "AND version = ? AND doc_id = ?",
+                (content, *key),
+            )
+            if self.fts:
+                self._db.execute(
+                    "DELETE FROM docs_fts WHERE namespace = ? AND provider = ? "
+                    "AND version = ? AND doc_id = ?",
+                    key,
+                )
+                self._db.execute(
+                    "INSERT INTO docs_fts SELECT namespace, provider, version, "
+                    "doc_id, title, description, content FROM docs WHERE "
+                    "namespace = ? AND provider = ? AND version = ? AND doc_id = ?",
+                    key,
+                )
+
+    def search(
+        self, query: str, provider: str | None = None, limit: int = 10
+    ) -> list[dict[str, Any]]:
+        """Full-text search over every cached document."""
+        columns = "namespace, provider, version, doc_id, title"
+        params: list[Any] = []
+        if self.fts:
+            sql = (
+                f"SELECT {columns}, snippet(docs_fts, 6, '[', ']', '...', 12) "
+                "FROM docs_fts WHERE docs_fts MATCH ?"
+            )
+            params.append(query)
+        else:
+            sql = (
+                f"SELECT {columns}, substr(content, 1, 120) FROM docs "
+                "WHERE content IS NOT NULL AND (title LIKE ? OR content LIKE ?)"
+            )
+            params.extend([f"%{query}%"] * 2)
+        if provider:
+            sql += " AND provider = ?"
+            params.append(provider)
+        sql += " ORDER BY rank LIMIT ?" if self.fts else " LIMIT ?"
+        params.append(limit)
+        keys = ("namespace", "provider", "version", "doc_id", "title", "snippet")
+        return [dict(zip(keys, row)) for row in self._db.execute(sql, params)]
+
+    def close(self) -> None:
+        """Close the database."""
+        self._db.close()
+
+
+# First characters of a JSON text; anything else (e.g. markdown) is kept raw
+_JSON_START = frozenset('{["0123456789')
+
+
+def _json_loads(text: str) -> Any:
+    """Decode JSON with orjson when it is installed; raises ValueError."""
+    if orjson is not None:
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            pass  # e.g. integers beyond 64 bits; json decides
+    return json.loads(text)
+
+
+def _decode_content(result: Any) -> list[Any] | None:
+    """Decode the text items of an MCP result's content, each exactly once.
+
+    Returns None when there is no content wrapper. Text that cannot be
+    JSON, such as markdown, is kept as is without a parse attempt; one
+    warning covers any JSON-looking text that still fails to parse.
+    """
+    if not isinstance(result, dict) or not isinstance(result.get("content"), list):
+        return None
+    bodies = []
+    invalid = False
+    for item in result["content"]:
+        if not (isinstance(item, dict) and item.get("type") == "text"):
+            continue
+        text = item.get("text")
+        if not isinstance(text, str):
+            continue
+        head = text.lstrip()[:5]
+        if (
+            head[:1] in _JSON_START
+            or (head[:1] == "-" and head[1:2].isdigit())
+            or head in ("true", "false", "null")
+        ):
+            try:
+                bodies.append(_json_loads(text))
+                continue
+            except ValueError:
+                invalid = True
+        bodies.append(text)
+    if invalid:
+        warnings.warn("MCP response text is not valid JSON, using raw text")
+    return bodies
+
+
 def unwrap_result(data: dict[str, Any]) -> Any:
     """Unwrap MCP result structure to return just the data."""
     if not data.get("success"):
         return data
 
-    result = data.get("result", {})
+    result = data.get("result", {})
+
+    # Handle MCP content wrapper: {"content": [{"type": "text", "text": "..."}]}
+    bodies = _decode_content(result)
+    if bodies is None:
+        return result
+    if len(bodies) == 1:
+        return bodies[0]
+    return bodies
+
+
+class Resource:
+    """One resource of a listing, as a slotted record over the decoded JSON.
+
+    `attributes` and `relationships` reference the decoded payload instead
+    of copying it. Flat items without an attributes object (as some MCP
+    tools return) serve as their own attributes.
+    """
+
+    __slots__ = ("id", "type", "attributes", "relationships")
+
+    def __init__(self, item: dict[str, Any]):
+        self.id: str = item.get("id", "")
+        self.type: str = item.get("type", "")
+        attributes = item.get("attributes")
+        self.attributes: dict[str, Any] = (
+            attributes if isinstance(attributes, dict) else item
+        )
+        self.relationships: dict[str, Any] = item.get("relationships") or {}
+
+
+def iter_resources(data: Any) -> Iterator[Resource]:
+    """Yield the resources of a decoded listing body.
 
-    # Handle MCP content wrapper: {"content": [{"type": "text", "text": "..."}]}
-    if "content" in result and isinstance(result["content"], list):
-        texts = []
-        for item in result["content"]:
-            if isinstance(item, dict) and item.get("type") == "text" and "text" in item:
-                try:
-                    texts.append(json.loads(item["text"]))
-                except json.JSONDecodeError:
-                    warnings.warn("MCP response text is not valid JSON, using raw text")
-                    texts.append(item["text"])
+    Accepts a bare list, a JSON:API {"data": [...]} or {"items": [...]};
+    any other non-empty object is taken as a single resource. A "data" or
+    "items" key that does not hold a list yields nothing, with a warning.
+    """
+    if isinstance(data, list):
+        items = data
+    elif isinstance(data, dict):
+        key = next((key for key in ("data", "items") if key in data), None)
+        items = data[key] if key else [data] if data else []
+        if not isinstance(items, list):
+            warnings.warn(
+                f"Expected list in data['{key}'], got {type(items).__name__}. "
+                "Using empty list.",
+                stacklevel=2,
+            )
+            return
+    else:
+        return
+    for item in items:
+        if isinstance(item, dict):
+            yield Resource(item)
 
-        if len(texts) == 1:
-            return texts[0]
-        return texts
 
-    return result
+def decode_resources(result: dict[str, Any]) -> Iterator[Resource]:
+    """Yield the resources of a successful MCP listing result.
+
+    Every content item is parsed once and normalized by `iter_resources`
+    as it is consumed. Raises ValueError if an item is not a JSON object
+    or list.
+    """
+    payload = result.get("result", {})
+    bodies = _decode_content(payload)
+    for body in [payload] if bodies is None else bodies:
+        if not isinstance(body, (dict, list)):
+            raise ValueError(f"Unexpected response format: {type(body).__name__}")
+        yield from iter_resources(body)
 
 
 def parse_provider_search_markdown(
@@ -473,25 +2286,44 @@ def parse_provider_search_markdown(
     return entries
 
 
+def _json_dumps(data: Any) -> str:
+    """Compact single-line JSON, encoded by orjson when it is installed."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS).decode()
+        except TypeError:
+            pass  # e.g. integers beyond 64 bits, which json handles
+    return json.dumps(data, separators=(",", ":"))
+
+
 def format_output(data: Any, fmt: str) -> str:
-    """Format output according to specified format."""
+    """Format output according to specified format.
+
+    jsonl puts each item of a list on its own line; anything else is one
+    line.
+    """
     if fmt == "json":
-        return json.dumps(data, separators=(",", ":"))
+        return _json_dumps(data)
+    elif fmt == "jsonl":
+        items = data if isinstance(data, list) else [data]
+        return "\n".join(_json_dumps(item) for item in items)
     elif fmt == "yaml":
         return yaml.dump(data, default_flow_style=False, sort_keys=False)
     else:  # compact
         return yaml.dump(data, default_flow_style=True, sort_keys=False)
 
 
-def format_terraform_logs(raw_logs: str) -> str:
-    """Format Terraform JSON logs as human-readable markdown.
+def iter_format_terraform_logs(raw_lines: Iterable[str]) -> Iterator[str]:
+    """Format Terraform JSON log lines as human-readable markdown, lazily.
 
     Parses JSON diagnostic messages and formats them for reduced token usage.
-    Non-JSON lines are passed through as-is.
+    Non-JSON lines are passed through as-is. Yields one entry per input line
+    (a diagnostic entry may itself span several lines), so a streamed log is
+    formatted without ever being held in memory.
     """
-    lines = []
-    for line in raw_logs.split("\n"):
-        line = line.strip()
+    for line in raw_lines:
+        # Archivist logs are framed by STX/ETX control characters
+        line = line.strip().strip("\x02\x03")
         if not line:
             continue
 
@@ -521,7 +2353,7 @@ def format_terraform_logs(raw_logs: str) -> str:
                             formatted += f"\n  File: {filename}:{line_num}:{col}"
                     if detail:
                         formatted += f"\n  Detail: {detail}"
-                    lines.append(formatted)
+                    yield formatted
 
                 elif msg_type == "change_summary":
                     # Format plan/apply summary
@@ -531,37 +2363,212 @@ def format_terraform_logs(raw_logs: str) -> str:
                     change = changes.get("change", 0)
                     remove = changes.get("remove", 0)
                     if op == "plan":
-                        lines.append(
+                        yield (
                             f"Plan: {add} to add, {change} to change, {remove} to destroy"
                         )
                     elif op == "apply":
-                        lines.append(
+                        yield (
                             f"Apply complete: {add} added, {change} changed, {remove} destroyed"
                         )
                     else:
-                        lines.append(message)
+                        yield message
 
                 elif msg_type == "version":
                     # Terraform version info
                     tf_version = obj.get("terraform", "")
-                    lines.append(f"Terraform v{tf_version}")
+                    yield f"Terraform v{tf_version}"
 
                 elif msg_type == "resource_drift" or msg_type == "planned_change":
                     # Resource changes - just use the message
-                    lines.append(message)
+                    yield message
 
                 elif message:
                     # Other messages - just print the message
-                    lines.append(message)
+                    yield message
 
             except json.JSONDecodeError:
                 # Not valid JSON, include as-is
-                lines.append(line)
+                yield line
         else:
             # Non-JSON line, include as-is
-            lines.append(line)
+            yield line
+
+
+def format_terraform_logs(raw_logs: str) -> str:
+    """Format Terraform JSON logs as human-readable markdown.
+
+    Parses JSON diagnostic messages and formats them for reduced token usage.
+    Non-JSON lines are passed through as-is.
+    """
+    return "\n".join(iter_format_terraform_logs(raw_logs.split("\n")))
+
 
-    return "\n".join(lines)
+def iter_run_log(
+    hcp_client: HCPTerraformClient,
+    kind: str,
+    log_id: str,
+    cache: RunCache | None = None,
+    log_url: str | None = None,
+) -> Iterator[str]:
+    """Yield the raw lines of a plan or apply log as they download.
+
+    Pass `cache` only for logs of terminal runs: they are served from it
+    when present and written to it while downloading otherwise. A known
+    `log_url` saves the request that resolves it. Raises HCPTerraformError
+    if the log cannot be fetched.
+    """
+    lines = cache.iter_log(kind, log_id) if cache else None
+    if lines is None:
+        if log_url is None:
+            url = hcp_client.get_log_url(kind, log_id)
+            if not url.get("success"):
+                raise HCPTerraformError(url.get("error"))
+            log_url = url["url"]
+        lines = hcp_client.iter_log_lines(log_url)
+        if cache:
+            lines = cache.tee_log(kind, log_id, lines)
+    yield from lines
+
+
+def print_run_log(
+    hcp_client: HCPTerraformClient,
+    kind: str,
+    log_id: str,
+    cache: RunCache | None = None,
+    log_url: str | None = None,
+) -> None:
+    """Stream a plan or apply log to stdout, formatting each line as it arrives.
+
+    Nothing is buffered beyond the current line, so memory stays flat for
+    logs of any size. Failures are reported inline like the section output.
+    `cache` and `log_url` are as for `iter_run_log`.
+    """
+    _print_log_lines(kind, iter_run_log(hcp_client, kind, log_id, cache, log_url))
+
+
+def _print_log_lines(kind: str, lines: Iterable[str]) -> None:
+    """Format raw log lines to stdout, reporting a failed fetch inline."""
+    write = sys.stdout.write
+    try:
+        for entry in iter_format_terraform_logs(lines):
+            write(entry + "\n")
+    except HCPTerraformError as e:
+        print(f"[Could not fetch {kind} logs: {e}]")
+    sys.stdout.flush()
+
+
+def _spool_log(lines: Iterable[str]) -> tempfile.SpooledTemporaryFile:
+    """Buffer a log downloading in the background until it can be printed.
+
+    Up to LOG_SPOOL_BYTES stay in memory; beyond that the spool moves to
+    an anonymous temporary file, so prefetching a huge log stays cheap.
+    """
+    spool = tempfile.SpooledTemporaryFile(
+        max_size=LOG_SPOOL_BYTES, mode="w+", encoding="utf-8"
+    )
+    try:
+        for line in lines:
+            spool.write(line + "\n")
+    except BaseException:
+        spool.close()
+        raise
+    spool.seek(0)
+    return spool
+
+
+def _iter_spooled_log(future: Future[tempfile.SpooledTemporaryFile]) -> Iterator[str]:
+    """Yield the lines of a spooled log once its download has finished.
+
+    Raises HCPTerraformError if the download failed.
+    """
+    with future.result() as spool:
+        for line in spool:
+            yield line.rstrip("\n")
+
+
+def _bump(counts: dict[str, int], key: str) -> None:
+    counts[key] = counts.get(key, 0) + 1
+
+
+class LogSummary:
+    """Structured digest of a Terraform JSON log, built in one pass.
+
+    Instead of one text line per planned change, `feed` tallies changes by
+    action, resource type and module, and keeps only the addresses that
+    will be destroyed or replaced, plus drift counts, failed applies,
+    diagnostics and Terraform's own change summary.
+    """
+
+    def __init__(self):
+        self.actions: dict[str, int] = {}
+        self.resource_types: dict[str, dict[str, int]] = {}
+        self.modules: dict[str, dict[str, int]] = {}
+        self.destroy: list[str] = []
+        self.replace: list[str] = []
+        self.drift: dict[str, int] = {}
+        self.failed: list[str] = []
+        self.diagnostics: list[dict[str, str]] = []
+        self.change_summary: dict[str, Any] | None = None
+
+    def _planned_change(self, change: dict[str, Any]) -> None:
+        action = change.get("action", "unknown")
+        if action == "noop":
+            return
+        resource = change.get("resource") or {}
+        address = resource.get("addr", "")
+        _bump(self.actions, action)
+        resource_type = resource.get("resource_type", "unknown")
+        _bump(self.resource_types.setdefault(resource_type, {}), action)
+        module = resource.get("module") or "(root)"
+        _bump(self.modules.setdefault(module, {}), action)
+        if action == "delete":
+            self.destroy.append(address)
+        elif action == "replace":
+            self.replace.append(address)
+
+    def feed(self, line: str) -> None:
+        """Account for one raw log line; non-JSON lines are ignored."""
+        line = line.strip().strip("\x02\x03")
+        if not line.startswith("{"):
+            return
+        try:
+            obj = json.loads(line)
+        except json.JSONDecodeError:
+            return
+        msg_type = obj.get("type")
+        if msg_type == "planned_change":
+            self._planned_change(obj.get("change") or {})
+        elif msg_type == "resource_drift":
+            _bump(self.drift, (obj.get("change") or {}).get("action", "unknown"))
+        elif msg_type == "apply_errored":
+            hook = obj.get("hook") or {}
+            self.failed.append((hook.get("resource") or {}).get("addr", ""))
+        elif msg_type == "change_summary":
+            self.change_summary = obj.get("changes")
+        elif msg_type == "diagnostic":
+            diag = obj.get("diagnostic") or {}
+            entry = {
+                "severity": diag.get("severity", obj.get("@level", "")),
+                "summary": diag.get("summary", obj.get("@message", "")),
+            }
+            if diag.get("address"):
+                entry["address"] = diag["address"]
+            self.diagnostics.append(entry)
+
+    def as_dict(self) -> dict[str, Any]:
+        """The digest, leaving out anything that did not occur."""
+        digest = {
+            "change_summary": self.change_summary,
+            "actions": self.actions,
+            "resource_types": self.resource_types,
+            "modules": self.modules,
+            "destroy": self.destroy,
+            "replace": self.replace,
+            "drift": self.drift,
+            "failed": self.failed,
+            "diagnostics": self.diagnostics,
+        }
+        return {key: value for key, value in digest.items() if value}
 
 
 def get_default_org() -> str:
@@ -582,12 +2589,193 @@ def _truncate_message(msg: str, max_len: int) -> str:
     return msg[: max_len - 3] + "..."
 
 
+def _workspace_attributes(data: Any) -> dict[str, Any]:
+    """Workspace attributes from a REST or MCP workspace response.
+
+    REST responses wrap the workspace as {"data": {"attributes": {...}}};
+    MCP get_workspace_details nests them one level deeper, under
+    attributes.workspace, next to the README.
+    """
+    if not isinstance(data, dict):
+        return {}
+    if isinstance(data.get("data"), dict):
+        data = data["data"]
+    attrs = data.get("attributes", {})
+    if isinstance(attrs.get("workspace"), dict):
+        attrs = attrs["workspace"]
+    return attrs
+
+
+def _print_stream_row(row: dict[str, Any], fmt: str) -> None:
+    """Print one row of a streamed listing as soon as it is ready.
+
+    json and jsonl emit one object per line; yaml emits a block sequence
+    item so the whole stream still parses as one YAML document; compact
+    emits flow style.
+    """
+    if fmt in ("json", "jsonl"):
+        line = _json_dumps(row)
+    elif fmt == "yaml":
+        line = yaml.dump([row], default_flow_style=False, sort_keys=False).rstrip()
+    else:
+        line = yaml.dump(row, default_flow_style=True, sort_keys=False).rstrip()
+    print(line, flush=True)
+
+
+def _workspace_detail_row(
+    client: MCPClient,
+    hcp_client: HCPTerraformClient,
+    org: str,
+    workspace: Resource,
+    engine: str,
+) -> dict[str, Any]:
+    """Detail and latest-run summary for one listed workspace.
+
+    Listings usually already carry the detail attributes, in which case only
+    the latest-run lookup is made.
+    """
+    attrs = workspace.attributes
+    name = attrs.get("name", "")
+    row: dict[str, Any] = {"name": name, "id": workspace.id}
+
+    if "execution-mode" not in attrs:
+        if engine == "api":
+            result = hcp_client.get_workspace(org, name)
+            data = result.get("data")
+        else:
+            result = client.call_tool(
+                "get_workspace_details",
+                {"terraform_org_name": org, "workspace_name": name},
+            )
+            data = unwrap_result(result)
+        if not result.get("success"):
+            row["error"] = result.get("error")
+            return row
+        attrs = _workspace_attributes(data)
+
+    vcs = attrs.get("vcs-repo") or {}
+    row.update(
+        {
+            "terraform_version": attrs.get("terraform-version", ""),
+            "execution_mode": attrs.get("execution-mode", ""),
+            "auto_apply": attrs.get("auto-apply", False),
+            "vcs_repo": vcs.get("display-identifier") or vcs.get("identifier", ""),
+        }
+    )
+
+    # MCP list_runs is broken, so the latest run always comes from the API
+    runs = hcp_client.list_runs(org, name, page_size=1)
+    if not runs.get("success"):
+        row["latest_run_error"] = runs.get("error")
+        return row
+    latest = next(iter_resources(runs.get("data", {})), None)
+    if latest:
+        row["latest_run"] = {
+            "id": latest.id,
+            "status": latest.attributes.get("status", ""),
+            "created_at": latest.attributes.get("created-at", ""),
+        }
+    else:
+        row["latest_run"] = None
+    return row
+
+
+def _workspace_status_detail(
+    client: MCPClient,
+    hcp_client: HCPTerraformClient,
+    org: str,
+    items: Iterable[Resource],
+    args: argparse.Namespace,
+    fmt: str,
+) -> int:
+    """Fan out detail and latest-run lookups, printing rows as they finish."""
+    engine = getattr(args, "engine", "mcp")
+    concurrency = max(1, getattr(args, "concurrency", 8))
+
+    if fmt not in ("json", "jsonl"):
+        print(f"organization: {org}")
+        print("workspaces:", flush=True)
+
+    errors = 0
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        futures = [
+            pool.submit(_workspace_detail_row, client, hcp_client, org, ws, engine)
+            for ws in items
+        ]
+        for future in as_completed(futures):
+            row = future.result()
+            if "error" in row:
+                errors += 1
+            _print_stream_row(row, fmt)
+
+    if fmt not in ("json", "jsonl"):
+        print(f"count: {len(futures)}")
+    return 1 if errors else 0
+
+
+def _workspace_brief_row(workspace: Resource) -> dict[str, Any]:
+    """Name, id, Terraform version and update time of a listed workspace."""
+    attrs = workspace.attributes
+    return {
+        "name": attrs.get("name", ""),
+        "id": workspace.id,
+        "terraform_version": attrs.get("terraform-version", ""),
+        "updated_at": attrs.get("updated-at", ""),
+    }
+
+
+def _stream_workspaces(hcp_client: HCPTerraformClient, org: str, fmt: str) -> int:
+    """Print the organization's workspaces page by page as they arrive."""
+    lines = fmt in ("json", "jsonl")
+    if not lines:
+        print(f"organization: {org}")
+        print("workspaces:", flush=True)
+    count = 0
+    try:
+        for ws in hcp_client.iter_workspaces(org):
+            _print_stream_row(_workspace_brief_row(Resource(ws)), fmt)
+            count += 1
+    except HCPTerraformError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    if not lines:
+        print(f"count: {count}")
+    return 0
+
+
 def workflow_workspace_status(
-    client: MCPStdioClient, args: argparse.Namespace, fmt: str
+    client: MCPClient,
+    args: argparse.Namespace,
+    fmt: str,
+    hcp_client: HCPTerraformClient | None = None,
 ) -> int:
     """Show workspace status overview."""
     org = get_default_org()
     workspace_name = getattr(args, "workspace", None)
+    detail = getattr(args, "detail", False)
+
+    if workspace_name and detail:
+        print("Error: --detail applies to the all-workspaces listing", file=sys.stderr)
+        return 1
+
+    if detail and hcp_client is None:
+        print("Error: TFE_TOKEN required for --detail", file=sys.stderr)
+        return 1
+
+    engine = getattr(args, "engine", "mcp")
+    if detail and engine == "api":
+        try:
+            items = [Resource(ws) for ws in hcp_client.iter_workspaces(org)]
+        except HCPTerraformError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            return 1
+        return _workspace_status_detail(client, hcp_client, org, items, args, fmt)
+
+    if not workspace_name and engine == "api":
+        if hcp_client is None:
+            print("Error: TFE_TOKEN required for --engine api", file=sys.stderr)
+            return 1
+        return _stream_workspaces(hcp_client, org, fmt)
 
     if workspace_name:
         # Single workspace detail
@@ -609,20 +2797,17 @@ def workflow_workspace_status(
             return 1
 
         # Extract key fields
+        attrs = _workspace_attributes(data)
         output = {
             "workspace": workspace_name,
             "organization": org,
             "workspace_id": data.get("id", ""),
-            "terraform_version": data.get("attributes", {}).get(
-                "terraform-version", ""
-            ),
-            "execution_mode": data.get("attributes", {}).get("execution-mode", ""),
-            "auto_apply": data.get("attributes", {}).get("auto-apply", False),
-            "working_directory": data.get("attributes", {}).get(
-                "working-directory", ""
-            ),
-            "vcs_repo": data.get("attributes", {}).get("vcs-repo", {}),
-            "updated_at": data.get("attributes", {}).get("updated-at", ""),
+            "terraform_version": attrs.get("terraform-version", ""),
+            "execution_mode": attrs.get("execution-mode", ""),
+            "auto_apply": attrs.get("auto-apply", False),
+            "working_directory": attrs.get("working-directory", ""),
+            "vcs_repo": attrs.get("vcs-repo", {}),
+            "updated_at": attrs.get("updated-at", ""),
         }
 
         print(format_output(output, fmt))
@@ -641,57 +2826,20 @@ def workflow_workspace_status(
             print(f"Error: {result.get('error')}", file=sys.stderr)
             return 1
 
-        data = unwrap_result(result)
-
-        # Validate data type before processing
-        if not isinstance(data, (dict, list)):
-            print(
-                f"Error: Unexpected response format: {type(data).__name__}",
-                file=sys.stderr,
-            )
+        try:
+            items = list(decode_resources(result))
+        except ValueError as e:
+            print(f"Error: {e}", file=sys.stderr)
             return 1
 
-        # Handle various response structures from MCP
-        if isinstance(data, list):
-            items = data
-        elif isinstance(data, dict) and "data" in data:
-            if isinstance(data["data"], list):
-                items = data["data"]
-            else:
-                warnings.warn(
-                    f"Expected list in data['data'], got {type(data['data']).__name__}. Using empty list.",
-                    stacklevel=2,
-                )
-                items = []
-        elif isinstance(data, dict) and "items" in data:
-            if isinstance(data["items"], list):
-                items = data["items"]
-            else:
-                warnings.warn(
-                    f"Expected list in data['items'], got {type(data['items']).__name__}. Using empty list.",
-                    stacklevel=2,
-                )
-                items = []
-        elif isinstance(data, dict):
-            items = [data]  # Single workspace response
-        else:
-            print(
-                "Error: Could not extract workspace list from response", file=sys.stderr
-            )
-            return 1
+        if detail:
+            return _workspace_status_detail(client, hcp_client, org, items, args, fmt)
 
         # Format as brief list
-        workspaces = []
-        for ws in items:
-            attrs = ws.get("attributes", {}) if isinstance(ws, dict) else {}
-            workspaces.append(
-                {
-                    "name": attrs.get("name", ws.get("name", "")),
-                    "id": ws.get("id", ""),
-                    "terraform_version": attrs.get("terraform-version", ""),
-                    "updated_at": attrs.get("updated-at", ""),
-                }
-            )
+        workspaces = [_workspace_brief_row(ws) for ws in items]
+        if fmt == "jsonl":
+            print(format_output(workspaces, fmt))
+            return 0
 
         output = {
             "organization": org,
@@ -719,21 +2867,150 @@ def _is_mcp_list_runs_broken(data: Any) -> bool:
     return False
 
 
-def _extract_runs_from_api_response(data: Any) -> list[dict]:
-    """Extract runs list from API response data."""
-    if isinstance(data, list):
-        return data
-    if isinstance(data, dict):
-        if "data" in data and isinstance(data["data"], list):
-            return data["data"]
-        if "items" in data and isinstance(data["items"], list):
-            return data["items"]
-    return []
+def _fetch_run(
+    client: MCPClient,
+    hcp_client: HCPTerraformClient | None,
+    run_id: str,
+    engine: str = "mcp",
+    cache: RunCache | None = None,
+    include: str | None = None,
+) -> dict[str, Any]:
+    """Fetch a run via MCP get_run_details or, for engine "api", the HCP API.
+
+    Either way the result carries the bare JSON:API run object (id,
+    attributes, relationships) under "run". With a `cache`, terminal runs
+    are answered from it and stored in it after a fetch. For engine "api",
+    resources sideloaded per `include` come back under "included".
+    """
+    cached = cache.get_run(run_id) if cache else None
+    if cached is not None:
+        return {"success": True, "run": cached}
+
+    included: list[dict[str, Any]] = []
+    if engine == "api":
+        if hcp_client is None:
+            return {"success": False, "error": "TFE_TOKEN required for --engine api"}
+        result = hcp_client.get_run(run_id, include=include)
+        if not result.get("success"):
+            return result
+        data = result.get("data", {})
+        if isinstance(data, dict):
+            included = data.get("included") or []
+    else:
+        result = client.call_tool("get_run_details", {"run_id": run_id})
+        if not result.get("success"):
+            return result
+        data = unwrap_result(result)
+
+    if not isinstance(data, dict):
+        return {"success": False, "error": "Unexpected response format"}
+
+    # Navigate into the run object (response wraps it in {"data": {...}})
+    run_data = data.get("data", data)
+    if isinstance(run_data, dict) and run_data.get("type") == "runs":
+        data = run_data
+    if cache:
+        cache.put_run(data)
+    result = {"success": True, "run": data}
+    if included:
+        result["included"] = included
+    return result
+
+
+def parse_since(value: str) -> dt.datetime:
+    """Parse a --since value: ISO 8601 or a relative age like 90m, 12h, 7d.
+
+    Naive timestamps are taken as UTC. Raises ValueError when unparseable.
+    """
+    units = {"m": 60, "h": 3600, "d": 86400, "w": 604800}
+    if value[:-1].isdigit() and value[-1:] in units:
+        age = dt.timedelta(seconds=int(value[:-1]) * units[value[-1]])
+        return dt.datetime.now(dt.timezone.utc) - age
+    parsed = dt.datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=dt.timezone.utc)
+    return parsed
+
+
+def _run_row(run: Resource) -> dict[str, Any]:
+    """Flatten a run into the list-runs row shape."""
+    attrs = run.attributes
+    return {
+        "id": run.id,
+        "status": attrs.get("status", ""),
+        "message": _truncate_message(attrs.get("message", "") or "", 80),
+        "created_at": attrs.get("created-at", ""),
+        "plan_only": attrs.get("plan-only", False),
+        "is_destroy": attrs.get("is-destroy", False),
+    }
 
 
-def workflow_list_runs(
-    client: MCPStdioClient, args: argparse.Namespace, fmt: str
+def _print_run_table_row(run: dict[str, Any]) -> None:
+    """Print one list-runs row in the compact table layout."""
+    # Parse and format created_at
+    created = run["created_at"][:16].replace("T", " ") if run["created_at"] else ""
+    # First line of message only
+    msg = run["message"].split("\n")[0][:40]
+    status = run["status"]
+    # Add markers for special runs
+    if run["is_destroy"]:
+        status += " 🗑"
+    elif run["plan_only"]:
+        status += " 📋"
+    print(f"{run['id']:<24} {status:<12} {created:<17} {msg}")
+
+
+def _stream_runs(
+    org: str,
+    workspace: str,
+    status_filter: str | None,
+    since: dt.datetime | None,
+    fmt: str,
 ) -> int:
+    """Stream every run of a workspace (optionally back to `since`).
+
+    Rows are printed as each page arrives: table rows for compact/yaml,
+    JSON Lines otherwise. Always uses the direct API, since the MCP
+    list_runs tool cannot page.
+    """
+    token = os.environ.get("TFE_TOKEN")
+    address = os.environ.get("TFE_ADDRESS", DEFAULT_TFE_ADDRESS)
+    if not token:
+        print("Error: TFE_TOKEN required for --all/--since", file=sys.stderr)
+        return 1
+
+    table = fmt in ("compact", "yaml")
+    if table:
+        print(f"Workspace: {workspace} ({org})")
+        print()
+        print(f"{'ID':<24} {'STATUS':<12} {'CREATED':<17} MESSAGE")
+        print("-" * 80)
+
+    count = 0
+    hcp_client = HCPTerraformClient(token, address)
+    try:
+        for run in hcp_client.iter_runs(org, workspace, status_filter=status_filter):
+            row = _run_row(Resource(run))
+            if since and row["created_at"] and parse_since(row["created_at"]) < since:
+                # Runs are listed newest first; everything after is older
+                break
+            if table:
+                _print_run_table_row(row)
+            else:
+                _print_stream_row(row, fmt)
+            count += 1
+    except HCPTerraformError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    finally:
+        hcp_client.close()
+
+    if table:
+        print(f"\nRuns: {count}")
+    return 0
+
+
+def workflow_list_runs(client: MCPClient, args: argparse.Namespace, fmt: str) -> int:
     """List recent runs for a workspace."""
     org = get_default_org()
     workspace = getattr(args, "workspace", None)
@@ -743,29 +3020,43 @@ def workflow_list_runs(
     limit = getattr(args, "limit", 10)
     status_filter = getattr(args, "status", None)
 
-    # Try MCP first
-    params: dict[str, Any] = {
-        "terraform_org_name": org,
-        "workspace_name": workspace,
-        "pageSize": limit,
-    }
-    if status_filter:
-        params["status"] = [status_filter]
+    since_arg = getattr(args, "since", None)
+    if getattr(args, "all", False) or since_arg:
+        try:
+            since = parse_since(since_arg) if since_arg else None
+        except ValueError:
+            print(f"Error: invalid --since value '{since_arg}'", file=sys.stderr)
+            return 1
+        return _stream_runs(org, workspace, status_filter, since, fmt)
+
+    engine = getattr(args, "engine", "mcp")
+    items: list[Resource] = []
+    use_api = engine == "api"
+
+    if not use_api:
+        # Try MCP first
+        params: dict[str, Any] = {
+            "terraform_org_name": org,
+            "workspace_name": workspace,
+            "pageSize": limit,
+        }
+        if status_filter:
+            params["status"] = [status_filter]
 
-    result = client.call_tool("list_runs", params)
-    items: list[dict] = []
-    used_fallback = False
+        result = client.call_tool("list_runs", params)
 
-    if result.get("success"):
-        data = unwrap_result(result)
-        if _is_mcp_list_runs_broken(data):
-            # MCP server bug: returns {"data":{"type":""}} - fall back to direct API
-            used_fallback = True
-        elif isinstance(data, (dict, list)):
-            items = _extract_runs_from_api_response(data)
-
-    # Fall back to direct HCP API if MCP failed or returned broken data
-    if not items and (not result.get("success") or used_fallback):
+        if result.get("success"):
+            data = unwrap_result(result)
+            if _is_mcp_list_runs_broken(data):
+                # MCP server bug: returns {"data":{"type":""}} - fall back to direct API
+                use_api = True
+            else:
+                items = list(iter_resources(data))
+        else:
+            use_api = True
+
+    # Direct HCP API: requested, or MCP failed / returned broken data
+    if not items and use_api:
         token = os.environ.get("TFE_TOKEN")
         address = os.environ.get("TFE_ADDRESS", DEFAULT_TFE_ADDRESS)
         if not token:
@@ -779,23 +3070,11 @@ def workflow_list_runs(
                 print(f"Error: {api_result.get('error')}", file=sys.stderr)
                 return 1
             api_data = api_result.get("data", {})
-            items = _extract_runs_from_api_response(api_data)
+            items = list(iter_resources(api_data))
         finally:
             hcp_client.close()
 
-    runs = []
-    for run in items:
-        attrs = run.get("attributes", {}) if isinstance(run, dict) else {}
-        runs.append(
-            {
-                "id": run.get("id", ""),
-                "status": attrs.get("status", ""),
-                "message": _truncate_message(attrs.get("message", "") or "", 80),
-                "created_at": attrs.get("created-at", ""),
-                "plan_only": attrs.get("plan-only", False),
-                "is_destroy": attrs.get("is-destroy", False),
-            }
-        )
+    runs = [_run_row(run) for run in items]
 
     # Use compact table format by default, YAML/JSON for explicit format requests
     if fmt == "compact" or fmt == "yaml":
@@ -807,19 +3086,9 @@ def workflow_list_runs(
         print(f"{'ID':<24} {'STATUS':<12} {'CREATED':<17} MESSAGE")
         print("-" * 80)
         for run in runs:
-            # Parse and format created_at
-            created = (
-                run["created_at"][:16].replace("T", " ") if run["created_at"] else ""
-            )
-            # First line of message only
-            msg = run["message"].split("\n")[0][:40]
-            status = run["status"]
-            # Add markers for special runs
-            if run["is_destroy"]:
-                status += " 🗑"
-            elif run["plan_only"]:
-                status += " 📋"
-            print(f"{run['id']:<24} {status:<12} {created:<17} {msg}")
+            _print_run_table_row(run)
+    elif fmt == "jsonl":
+        print(format_output(runs, fmt))
     else:
         # JSON format - structured output
         output = {
@@ -834,48 +3103,67 @@ def workflow_list_runs(
 
 
 def workflow_list_providers(
-    client: MCPStdioClient, args: argparse.Namespace, fmt: str
+    client: MCPClient,
+    args: argparse.Namespace,
+    fmt: str,
+    docs_cache: DocsCache | None = None,
 ) -> int:
     """List/search available providers."""
     search = getattr(args, "search", None) or ""
     namespace = getattr(args, "namespace", None) or "hashicorp"
+    term = search if search else "aws"  # Default search term
 
-    # Use search_providers with overview type to list
-    result = client.call_tool(
-        "search_providers",
-        {
-            "provider_name": search if search else "aws",  # Default search term
-            "provider_namespace": namespace,
-            "service_slug": search if search else "aws",
-            "provider_document_type": "overview",
-        },
+    cached = (
+        docs_cache.get_search(namespace, term, "providers", term)
+        if docs_cache
+        else None
     )
+    if cached is not None:
+        providers = cached["results"]
+    else:
+        # Use search_providers with overview type to list
+        result = client.call_tool(
+            "search_providers",
+            {
+                "provider_name": term,
+                "provider_namespace": namespace,
+                "service_slug": term,
+                "provider_document_type": "overview",
+            },
+        )
 
-    if not result.get("success"):
-        print(f"Error: {result.get('error')}", file=sys.stderr)
-        return 1
-
-    data = unwrap_result(result)
+        if not result.get("success"):
+            print(f"Error: {result.get('error')}", file=sys.stderr)
+            return 1
 
-    # Validate data type
-    if not isinstance(data, (dict, list)):
-        print(
-            f"Error: Unexpected response format: {type(data).__name__}", file=sys.stderr
-        )
-        return 1
+        data = unwrap_result(result)
 
-    # Format as list
-    items = data if isinstance(data, list) else [data]
-    providers = []
-    for item in items:
-        if isinstance(item, dict):
-            providers.append(
-                {
-                    "name": item.get("title", ""),
-                    "id": item.get("id", ""),
-                    "category": item.get("category", ""),
-                }
+        # Validate data type
+        if not isinstance(data, (dict, list)):
+            print(
+                f"Error: Unexpected response format: {type(data).__name__}",
+                file=sys.stderr,
             )
+            return 1
+
+        # Format as list
+        items = data if isinstance(data, list) else [data]
+        providers = []
+        for item in items:
+            if isinstance(item, dict):
+                providers.append(
+                    {
+                        "name": item.get("title", ""),
+                        "id": item.get("id", ""),
+                        "category": item.get("category", ""),
+                    }
+                )
+        if docs_cache:
+            docs_cache.put_search(namespace, term, "providers", term, "", providers)
+
+    if fmt == "jsonl":
+        print(format_output(providers, fmt))
+        return 0
 
     output = {
         "search": search,
@@ -888,23 +3176,146 @@ def workflow_list_providers(
     return 0
 
 
+def _search_version(text: str) -> str:
+    """Provider version named in a search_providers markdown header."""
+    match = re.search(r"\bversion:\s*(\S+)", text)
+    return match.group(1) if match else "latest"
+
+
+def _prefetch_provider_docs(
+    client: MCPClient,
+    docs_cache: DocsCache,
+    namespace: str,
+    provider: str,
+    categories: list[str],
+    concurrency: int,
+    fmt: str,
+) -> int:
+    """Bulk-populate the docs cache for a provider's latest version.
+
+    The registry lists every document of each category; content not yet
+    cached is fetched through MCP get_provider_details with up to
+    `concurrency` requests in flight on the one session.
+    """
+    registry = RegistryClient()
+    try:
+        version, provider_version_id = registry.latest_version(namespace, provider)
+        listings = {
+            category: list(registry.iter_docs(provider_version_id, category))
+            for category in categories
+        }
+    except HCPTerraformError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    finally:
+        registry.close()
+
+    todo = []
+    total = 0
+    for category, docs in listings.items():
+        entries = [
+            {
+                "id": str(doc.get("id")),
+                "title": doc.get("attributes", {}).get("title", ""),
+                "category": category,
+                "description": "",
+            }
+            for doc in docs
+        ]
+        docs_cache.put_listing(namespace, provider, category, version, entries)
+        total += len(entries)
+        todo.extend(
+            entry
+            for entry in entries
+            if docs_cache.get_content(namespace, provider, version, entry["id"]) is None
+        )
+
+    print(
+        f"{namespace}/{provider} {version}: {total} documents, {len(todo)} to fetch",
+        file=sys.stderr,
+    )
+    fetched = failed = 0
+    in_flight: deque[tuple[dict[str, Any], Future]] = deque()
+    pending = iter(todo)
+    while True:
+        for entry in pending:
+            in_flight.append(
+                (
+                    entry,
+                    client.submit_tool(
+                        "get_provider_details", {"provider_doc_id": entry["id"]}
+                    ),
+                )
+            )
+            if len(in_flight) >= concurrency:
+                break
+        if not in_flight:
+            break
+        entry, future = in_flight.popleft()
+        result = client._await(future)
+        if result is None:
+            error = client._timeout_error("get_provider_details")
+            print(f"  {entry['id']}: {error}", file=sys.stderr)
+            content = None
+        else:
+            content = unwrap_result(result)
+        if isinstance(content, str):
+            docs_cache.put_content(namespace, provider, version, entry["id"], content)
+            fetched += 1
+        else:
+            failed += 1
+        if (fetched + failed) % 100 == 0:
+            print(f"  {fetched + failed}/{len(todo)}", file=sys.stderr)
+
+    output = {
+        "provider": provider,
+        "namespace": namespace,
+        "version": version,
+        "documents": total,
+        "fetched": fetched,
+        "already_cached": total - len(todo),
+        "failed": failed,
+    }
+    print(format_output(output, fmt))
+    return 1 if failed else 0
+
+
 def workflow_provider_docs(
-    client: MCPStdioClient, args: argparse.Namespace, fmt: str
+    client: MCPClient,
+    args: argparse.Namespace,
+    fmt: str,
+    docs_cache: DocsCache | None = None,
 ) -> int:
     """Look up provider documentation."""
     provider = args.provider
     resource = getattr(args, "resource", None)
     data_source = getattr(args, "data_source", None)
     list_resources = getattr(args, "list_resources", False)
+    prefetch = getattr(args, "prefetch", False)
+    query = getattr(args, "query", None)
 
     # Validate mutually exclusive arguments
-    if sum(bool(x) for x in [resource, data_source, list_resources]) > 1:
+    modes = [resource, data_source, list_resources, prefetch, query]
+    if sum(bool(x) for x in modes) > 1:
         print(
-            "Error: Only one of --resource, --data-source, or --list-resources can be used",
+            "Error: Only one of --resource, --data-source, --list-resources, "
+            "--prefetch or --query can be used",
             file=sys.stderr,
         )
         return 1
 
+    if query:
+        if docs_cache is None:
+            print("Error: --query searches the local cache", file=sys.stderr)
+            return 1
+        try:
+            matches = docs_cache.search(query, provider)
+        except sqlite3.OperationalError as e:
+            print(f"Error: Invalid search query: {e}", file=sys.stderr)
+            return 1
+        print(format_output(matches, fmt))
+        return 0 if matches else 1
+
     # Determine namespace (default to hashicorp for common providers)
     namespace = getattr(args, "namespace", None)
 
@@ -926,6 +3337,27 @@ def workflow_provider_docs(
     elif not namespace:
         namespace = "hashicorp"  # Default fallback
 
+    if prefetch:
+        if docs_cache is None:
+            print(
+                "Error: --prefetch cannot be combined with --no-cache", file=sys.stderr
+            )
+            return 1
+        categories = []
+        if getattr(args, "resources", False):
+            categories.append("resources")
+        if getattr(args, "data_sources", False):
+            categories.append("data-sources")
+        return _prefetch_provider_docs(
+            client,
+            docs_cache,
+            namespace,
+            provider,
+            categories or ["resources"],
+            max(1, getattr(args, "concurrency", 8)),
+            fmt,
+        )
+
     # Determine document type
     if list_resources:
         doc_type = "resources"
@@ -940,38 +3372,55 @@ def workflow_provider_docs(
         doc_type = "overview"
         service_slug = provider
 
-    # Search for provider docs
-    result = client.call_tool(
-        "search_providers",
-        {
-            "provider_name": provider,
-            "provider_namespace": namespace,
-            "service_slug": service_slug,
-            "provider_document_type": doc_type,
-        },
+    cached = (
+        docs_cache.get_search(namespace, provider, doc_type, service_slug)
+        if docs_cache and not list_resources
+        else None
     )
+    if cached is not None:
+        data = cached["results"]
+        version = cached["version"]
+    else:
+        # Search for provider docs
+        result = client.call_tool(
+            "search_providers",
+            {
+                "provider_name": provider,
+                "provider_namespace": namespace,
+                "service_slug": service_slug,
+                "provider_document_type": doc_type,
+            },
+        )
 
-    if not result.get("success"):
-        print(f"Error: {result.get('error')}", file=sys.stderr)
-        return 1
-
-    data = unwrap_result(result)
+        if not result.get("success"):
+            print(f"Error: {result.get('error')}", file=sys.stderr)
+            return 1
 
-    # Handle markdown response from search_providers
-    # The MCP server returns markdown text, not JSON
-    if isinstance(data, str):
-        parsed_entries = parse_provider_search_markdown(data, service_slug)
-        if not parsed_entries:
+        data = unwrap_result(result)
+        version = "latest"
+
+        # Handle markdown response from search_providers
+        # The MCP server returns markdown text, not JSON
+        if isinstance(data, str):
+            version = _search_version(data)
+            parsed_entries = parse_provider_search_markdown(data, service_slug)
+            if not parsed_entries:
+                print(
+                    f"No documentation found for {provider}/{service_slug}",
+                    file=sys.stderr,
+                )
+                return 1
+            data = parsed_entries
+            if docs_cache:
+                docs_cache.put_search(
+                    namespace, provider, doc_type, service_slug, version, data
+                )
+        elif not isinstance(data, (dict, list)):
             print(
-                f"No documentation found for {provider}/{service_slug}", file=sys.stderr
+                f"Error: Unexpected response format: {type(data).__name__}",
+                file=sys.stderr,
             )
             return 1
-        data = parsed_entries
-    elif not isinstance(data, (dict, list)):
-        print(
-            f"Error: Unexpected response format: {type(data).__name__}", file=sys.stderr
-        )
-        return 1
 
     # If listing resources, just show the search results
     if list_resources:
@@ -1000,19 +3449,27 @@ def workflow_provider_docs(
         print(f"No documentation found for {provider}/{service_slug}", file=sys.stderr)
         return 1
 
-    # Fetch full documentation
-    detail_result = client.call_tool(
-        "get_provider_details",
-        {
-            "provider_doc_id": str(doc_id),
-        },
+    doc_data = (
+        docs_cache.get_content(namespace, provider, version, str(doc_id))
+        if docs_cache
+        else None
     )
+    if doc_data is None:
+        # Fetch full documentation
+        detail_result = client.call_tool(
+            "get_provider_details",
+            {
+                "provider_doc_id": str(doc_id),
+            },
+        )
 
-    if not detail_result.get("success"):
-        print(f"Error: {detail_result.get('error')}", file=sys.stderr)
-        return 1
+        if not detail_result.get("success"):
+            print(f"Error: {detail_result.get('error')}", file=sys.stderr)
+            return 1
 
-    doc_data = unwrap_result(detail_result)
+        doc_data = unwrap_result(detail_result)
+        if docs_cache and isinstance(doc_data, str):
+            docs_cache.put_content(namespace, provider, version, str(doc_id), doc_data)
 
     # Output the documentation
     if fmt == "yaml":
@@ -1044,69 +3501,94 @@ def workflow_provider_docs(
     return 0
 
 
-def workflow_run_outputs(
-    client: MCPStdioClient, args: argparse.Namespace, fmt: str
+SENSITIVE_PLACEHOLDER = "<sensitive>"
+
+
+def _workspace_outputs(
+    hcp_client: HCPTerraformClient,
+    org: str,
+    workspace: str,
+    cache: RunCache | None = None,
+) -> dict[str, Any]:
+    """Read a workspace's current state version outputs, sensitive ones redacted.
+
+    The workspace lookup names the current state version; its outputs are
+    immutable, so with a `cache` they are fetched once per state version.
+    Returns a row with "workspace", "state_version_id" and "outputs", or
+    with "error".
+    """
+    result = hcp_client.get_workspace(org, workspace)
+    if not result.get("success"):
+        return {"workspace": workspace, "error": result.get("error")}
+    ws = result["data"].get("data") or {}
+    relationships = ws.get("relationships") or {}
+    state_version = (relationships.get("current-state-version") or {}).get("data")
+    if not state_version:
+        return {"workspace": workspace, "error": "No state versions yet"}
+    sv_id = state_version["id"]
+
+    outputs = cache.get_outputs(sv_id) if cache else None
+    if outputs is None:
+        outputs = {}
+        try:
+            for output in hcp_client.iter_current_outputs(ws["id"]):
+                attrs = output.get("attributes", {})
+                outputs[attrs.get("name")] = (
+                    SENSITIVE_PLACEHOLDER
+                    if attrs.get("sensitive")
+                    else attrs.get("value")
+                )
+        except HCPTerraformError as e:
+            return {"workspace": workspace, "error": str(e)}
+        if cache:
+            cache.put_outputs(sv_id, outputs)
+    return {"workspace": workspace, "state_version_id": sv_id, "outputs": outputs}
+
+
+def _print_workspace_outputs(
+    hcp_client: HCPTerraformClient,
+    args: argparse.Namespace,
+    fmt: str,
+    cache: RunCache | None,
 ) -> int:
-    """View terraform outputs from a run."""
+    """Fetch outputs for every --workspace concurrently, in the given order."""
     org = get_default_org()
-    run_id = getattr(args, "run_id", None)
-    workspace = getattr(args, "workspace", None)
-
-    # If workspace provided, get latest successful run
-    if not run_id and workspace:
-        result = client.call_tool(
-            "list_runs",
-            {
-                "terraform_org_name": org,
-                "workspace_name": workspace,
-                "pageSize": 10,
-                "status": ["applied"],
-            },
+    workspaces = args.workspace
+    concurrency = max(1, min(getattr(args, "concurrency", 8), len(workspaces)))
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        rows = list(
+            pool.map(
+                lambda ws: _workspace_outputs(hcp_client, org, ws, cache), workspaces
+            )
         )
-        if not result.get("success"):
-            print(f"Error: {result.get('error')}", file=sys.stderr)
-            return 1
 
-        data = unwrap_result(result)
+    errors = 0
+    for row in rows:
+        if "error" in row:
+            errors += 1
+            print(f"Error: {row['workspace']}: {row['error']}", file=sys.stderr)
+    found = [row for row in rows if "error" not in row]
+    if found:
+        print(format_output(found[0] if len(workspaces) == 1 else found, fmt))
+    return 1 if errors else 0
 
-        # Validate data type
-        if not isinstance(data, (dict, list)):
-            print(
-                f"Error: Unexpected response format: {type(data).__name__}",
-                file=sys.stderr,
-            )
-            return 1
 
-        # Handle various response structures
-        if isinstance(data, list):
-            items = data
-        elif isinstance(data, dict) and "data" in data:
-            if isinstance(data["data"], list):
-                items = data["data"]
-            else:
-                warnings.warn(
-                    f"Expected list in data['data'], got {type(data['data']).__name__}. Using empty list.",
-                    stacklevel=2,
-                )
-                items = []
-        elif isinstance(data, dict) and "items" in data:
-            if isinstance(data["items"], list):
-                items = data["items"]
-            else:
-                warnings.warn(
-                    f"Expected list in data['items'], got {type(data['items']).__name__}. Using empty list.",
-                    stacklevel=2,
-                )
-                items = []
-        else:
-            items = []
+def workflow_run_outputs(
+    client: MCPClient,
+    args: argparse.Namespace,
+    fmt: str,
+    hcp_client: HCPTerraformClient | None = None,
+    run_cache: RunCache | None = None,
+) -> int:
+    """View terraform outputs from a run, or from workspaces' current state."""
+    run_id = getattr(args, "run_id", None)
+    workspaces = getattr(args, "workspace", None)
 
-        if not items:
-            print(
-                f"No successful runs found for workspace '{workspace}'", file=sys.stderr
-            )
+    if not run_id and workspaces:
+        if hcp_client is None:
+            print("Error: TFE_TOKEN required for --workspace", file=sys.stderr)
             return 1
-        run_id = items[0].get("id")
+        return _print_workspace_outputs(hcp_client, args, fmt, run_cache)
 
     if not run_id:
         print("Error: Either run_id or --workspace is required", file=sys.stderr)
@@ -1152,35 +3634,151 @@ def workflow_run_outputs(
     return 0
 
 
+def _log_read_urls(included: Iterable[dict[str, Any]]) -> dict[str, str]:
+    """Map "plan"/"apply" to the log-read-urls of sideloaded plans/applies."""
+    urls = {}
+    for resource in included:
+        kind = _LOG_KINDS.get(resource.get("type", ""))
+        url = (resource.get("attributes") or {}).get("log-read-url")
+        if kind and url:
+            urls[kind] = url
+    return urls
+
+
+def _run_log_ids(run: dict[str, Any], only: str | None = None) -> dict[str, str]:
+    """Map "plan"/"apply" to the IDs of the logs run-details shows, in order.
+
+    The apply log is shown for both successful and errored runs (errors
+    during apply have status "errored", not "applied"). `only` restricts
+    the result to one of the two.
+    """
+    status = run.get("attributes", {}).get("status", "unknown")
+    relationships = run.get("relationships") or {}
+    log_ids = {}
+    for kind in ("plan", "apply"):
+        if only and kind != only:
+            continue
+        if kind == "apply" and status not in ("applied", "errored"):
+            continue
+        log_id = relationships.get(kind, {}).get("data", {}).get("id")
+        if log_id:
+            log_ids[kind] = log_id
+    return log_ids
+
+
+def _digest_run_log(
+    hcp_client: HCPTerraformClient,
+    kind: str,
+    log_id: str,
+    cache: RunCache | None = None,
+    log_url: str | None = None,
+) -> dict[str, Any]:
+    """Download one log through a LogSummary; raises HCPTerraformError."""
+    digest = LogSummary()
+    for line in iter_run_log(hcp_client, kind, log_id, cache, log_url):
+        digest.feed(line)
+    return digest.as_dict()
+
+
+def _print_run_log_summary(
+    hcp_client: HCPTerraformClient,
+    run: dict[str, Any],
+    fmt: str,
+    log_ids: dict[str, str],
+    log_urls: dict[str, str],
+    log_cache: RunCache | None = None,
+) -> int:
+    """Print run-details --summary: the run plus digests of its logs.
+
+    The logs are downloaded and digested concurrently.
+    """
+    output = _run_summary(run.get("id", ""), run.get("attributes", {}))
+    failed = False
+    with ThreadPoolExecutor(max_workers=max(1, len(log_ids))) as pool:
+        futures = {
+            kind: pool.submit(
+                _digest_run_log,
+                hcp_client,
+                kind,
+                log_id,
+                log_cache,
+                log_urls.get(kind),
+            )
+            for kind, log_id in log_ids.items()
+        }
+        for kind, future in futures.items():
+            try:
+                output[kind] = future.result()
+            except HCPTerraformError as e:
+                print(f"Error: could not fetch {kind} logs: {e}", file=sys.stderr)
+                failed = True
+
+    print(format_output(output, fmt))
+    return 1 if failed else 0
+
+
+def _fetch_run_with_log_urls(
+    client: MCPClient,
+    hcp_client: HCPTerraformClient,
+    run_id: str,
+    engine: str,
+    run_cache: RunCache | None = None,
+) -> tuple[dict[str, Any], dict[str, str]]:
+    """Fetch a run and the log-read-urls of its plan and apply together.
+
+    One API request sideloads both, whatever the engine: the MCP engine
+    only falls back to get_run_details (and so to the container) when that
+    request fails, and then leaves the URLs to `iter_run_log`. Cached runs
+    skip the URL lookup; their logs are normally cached too, and
+    `iter_run_log` resolves the URL itself if not.
+    """
+    result = _fetch_run(
+        client, hcp_client, run_id, "api", run_cache, include="plan,apply"
+    )
+    if engine == "api" or result.get("success"):
+        return result, _log_read_urls(result.get("included") or [])
+    return _fetch_run(client, hcp_client, run_id, engine, run_cache), {}
+
+
 def workflow_run_details(
-    client: MCPStdioClient,
+    client: MCPClient,
     hcp_client: HCPTerraformClient,
     args: argparse.Namespace,
     fmt: str,
+    run_cache: RunCache | None = None,
 ) -> int:
-    """View details and logs for a completed run."""
+    """View details and logs for a completed run.
+
+    The run metadata, the log URLs and the plan and apply logs are fetched
+    concurrently; the apply log is spooled until the plan log has been
+    printed, so output keeps its order. `--only plan|apply` skips the other
+    log entirely.
+    """
     run_id = args.run_id
+    engine = getattr(args, "engine", "mcp")
+    only = getattr(args, "only", None)
 
     # Get run details
-    result = client.call_tool("get_run_details", {"run_id": run_id})
+    result, log_urls = _fetch_run_with_log_urls(
+        client, hcp_client, run_id, engine, run_cache
+    )
 
     if not result.get("success"):
         print(f"Error: {result.get('error')}", file=sys.stderr)
         return 1
 
-    data = unwrap_result(result)
-    if not isinstance(data, dict):
-        print("Error: Unexpected response format", file=sys.stderr)
-        return 1
-
-    # Navigate into the run object (response wraps it in {"data": {...}})
-    run_data = data.get("data", data)
-    if isinstance(run_data, dict) and run_data.get("type") == "runs":
-        data = run_data
-
+    data = result["run"]
     attrs = data.get("attributes", {})
     status = attrs.get("status", "unknown")
     message = attrs.get("message", "") or ""
+    log_ids = _run_log_ids(data, only)
+    # Logs of an unfinished run are still growing and must not be cached
+    log_cache = run_cache if status in TERMINAL_STATES else None
+
+    if getattr(args, "summary", False):
+        return _print_run_log_summary(
+            hcp_client, data, fmt, log_ids, log_urls, log_cache
+        )
 
     # Print run summary
     print(f"Run: {run_id}")
@@ -1192,155 +3790,349 @@ def workflow_run_details(
     print("-" * 50)
 
     # Get and display logs
-    relationships = data.get("relationships", {})
-    if not relationships:
+    if not data.get("relationships"):
         print("[No relationships data - logs unavailable]", file=sys.stderr)
         return 0
 
-    plan_rel = relationships.get("plan", {}).get("data", {})
-    apply_rel = relationships.get("apply", {}).get("data", {})
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        # Every log after the first downloads while the first one prints
+        spooled = {
+            kind: pool.submit(
+                _spool_log,
+                iter_run_log(hcp_client, kind, log_id, log_cache, log_urls.get(kind)),
+            )
+            for kind, log_id in list(log_ids.items())[1:]
+        }
+        for kind, log_id in log_ids.items():
+            print(f"\n=== {kind.capitalize()} Output ===")
+            if kind in spooled:
+                _print_log_lines(kind, _iter_spooled_log(spooled[kind]))
+            else:
+                print_run_log(hcp_client, kind, log_id, log_cache, log_urls.get(kind))
 
-    if plan_rel.get("id"):
-        print("\n=== Plan Output ===")
-        log_result = hcp_client.get_plan_logs(plan_rel["id"])
-        if log_result.get("success"):
-            formatted = format_terraform_logs(log_result.get("logs", ""))
-            print(formatted)
-        else:
-            print(f"[Could not fetch plan logs: {log_result.get('error')}]")
+    return 0
 
-    # Show apply logs for both successful and errored runs
-    # (errors during apply have status "errored" not "applied")
-    if apply_rel.get("id") and status in ("applied", "errored"):
+
+def _poll_tailer(tailer: LogTailer) -> None:
+    """Print lines newly appended to a tailed log; stop following on errors."""
+    try:
+        lines = tailer.poll()
+    except HCPTerraformError as e:
+        print(f"[Could not follow {tailer.kind} logs: {e}]", file=sys.stderr)
+        tailer.done = True
+        return
+    for line in iter_format_terraform_logs(lines):
+        print(line)
+    sys.stdout.flush()
+
+
+def _follow_run_logs(
+    hcp_client: HCPTerraformClient,
+    run: dict[str, Any],
+    tailers: dict[str, LogTailer],
+) -> None:
+    """Tail the plan log, then the apply log, of an in-progress run.
+
+    Tailers are created lazily in `tailers` (keyed by "plan"/"apply") once
+    the corresponding phase has started; the apply log is only followed
+    after the plan log has reached its end marker.
+    """
+    attrs = run.get("attributes", {})
+    status = attrs.get("status", "unknown")
+    timestamps = attrs.get("status-timestamps") or {}
+    relationships = run.get("relationships") or {}
+
+    plan_id = relationships.get("plan", {}).get("data", {}).get("id")
+    plan_started = status == "planning" or "planning-at" in timestamps
+    if (
+        plan_id
+        and "plan" not in tailers
+        and (plan_started or status in TERMINAL_STATES)
+    ):
+        print("\n=== Plan Output ===")
+        tailers["plan"] = LogTailer(hcp_client, "plan", plan_id)
+    if "plan" in tailers and not tailers["plan"].done:
+        _poll_tailer(tailers["plan"])
+
+    apply_id = relationships.get("apply", {}).get("data", {}).get("id")
+    apply_started = status in ("applying", "applied") or "applying-at" in timestamps
+    plan_finished = "plan" not in tailers or tailers["plan"].done
+    if apply_id and apply_started and plan_finished and "apply" not in tailers:
         print("\n=== Apply Output ===")
-        log_result = hcp_client.get_apply_logs(apply_rel["id"])
-        if log_result.get("success"):
-            formatted = format_terraform_logs(log_result.get("logs", ""))
-            print(formatted)
+        tailers["apply"] = LogTailer(hcp_client, "apply", apply_id)
+    if "apply" in tailers and not tailers["apply"].done:
+        _poll_tailer(tailers["apply"])
+
+
+def _drain_run_logs(
+    hcp_client: HCPTerraformClient,
+    run: dict[str, Any],
+    tailers: dict[str, LogTailer],
+    attempts: int = 10,
+) -> None:
+    """Keep tailing a finished run until every started log has ended.
+
+    The run can reach a terminal state slightly before its logs are
+    flushed, so poll a bounded number of times waiting for the end marker.
+    """
+    for _ in range(attempts):
+        _follow_run_logs(hcp_client, run, tailers)
+        if all(tailer.done for tailer in tailers.values()):
+            return
+        time.sleep(1)
+
+
+def _latest_run_id(
+    client: MCPClient,
+    hcp_client: HCPTerraformClient | None,
+    org: str,
+    workspace: str,
+    engine: str = "mcp",
+) -> dict[str, Any]:
+    """Resolve the latest run of a workspace as {"success", "run_id"}."""
+    if engine == "api":
+        if hcp_client is None:
+            return {"success": False, "error": "TFE_TOKEN required for --engine api"}
+        result = hcp_client.list_runs(org, workspace, page_size=1)
+        if not result.get("success"):
+            return result
+        runs = iter_resources(result.get("data"))
+    else:
+        result = client.call_tool(
+            "list_runs",
+            {
+                "terraform_org_name": org,
+                "workspace_name": workspace,
+                "pageSize": 1,
+            },
+        )
+        if not result.get("success"):
+            return result
+        runs = decode_resources(result)
+
+    try:
+        latest = next(runs, None)
+    except ValueError as e:
+        return {"success": False, "error": str(e)}
+    if latest is None:
+        return {"success": False, "error": f"No runs found for workspace '{workspace}'"}
+    return {"success": True, "run_id": latest.id}
+
+
+def _active_org_runs(hcp_client: HCPTerraformClient | None, org: str) -> dict[str, Any]:
+    """List the organization's non-final runs as {"success", "runs"}.
+
+    "runs" maps run id to a label naming its workspace.
+    """
+    if hcp_client is None:
+        return {"success": False, "error": "TFE_TOKEN required for --org-active"}
+    included: dict[tuple[str, str], dict[str, Any]] = {}
+    params = {"filter[status_group]": "non_final", "include": "workspace"}
+    try:
+        runs = list(hcp_client.iter_org_runs(org, params, included))
+    except HCPTerraformError as e:
+        return {"success": False, "error": str(e)}
+    labels = {}
+    for run in runs:
+        ws = (run.get("relationships") or {}).get("workspace", {}).get("data") or {}
+        name = (
+            included.get(("workspaces", ws.get("id")), {})
+            .get("attributes", {})
+            .get("name")
+        )
+        labels[run.get("id")] = f"{name} ({run.get('id')})" if name else run.get("id")
+    return {"success": True, "runs": labels}
+
+
+def _plan_summary(attrs: dict[str, Any]) -> str:
+    """Render a run's resource counts as " | Plan: +a ~c -d", or ""."""
+    additions = attrs.get("resource-additions", 0)
+    changes = attrs.get("resource-changes", 0)
+    destructions = attrs.get("resource-destructions", 0)
+    if additions or changes or destructions:
+        return f" | Plan: +{additions} ~{changes} -{destructions}"
+    return ""
+
+
+def _run_summary(run_id: str, attrs: dict[str, Any]) -> dict[str, Any]:
+    """Summarize a run for watch-run's final output and run-details --summary."""
+    return {
+        "run_id": run_id,
+        "status": attrs.get("status", "unknown"),
+        "message": _truncate_message(attrs.get("message", "") or "", 200),
+        "resource_additions": attrs.get("resource-additions", 0),
+        "resource_changes": attrs.get("resource-changes", 0),
+        "resource_destructions": attrs.get("resource-destructions", 0),
+    }
+
+
+def _watch_many(
+    client: MCPClient,
+    hcp_client: HCPTerraformClient,
+    runs: dict[str, str],
+    engine: str,
+    scheduler: PollScheduler,
+    max_wait: int,
+    fmt: str,
+) -> int:
+    """Watch several runs (run id -> label) in one shared poll loop."""
+    start_time = time.time()
+    last_status: dict[str, str] = {}
+    summaries: dict[str, dict[str, Any]] = {}
+    for run_id in runs:
+        scheduler.add(run_id)
+
+    print(f"Watching {len(runs)} runs", file=sys.stderr)
+    print("-" * 50, file=sys.stderr)
+
+    while scheduler:
+        if time.time() - start_time > max_wait:
+            print(f"Timeout: Runs did not complete within {max_wait}s", file=sys.stderr)
+            return 1
+
+        run_id = scheduler.wait()
+        result = _fetch_run(client, hcp_client, run_id, engine)
+        timestamp = time.strftime("%H:%M:%S")
+
+        if not result.get("success"):
+            if "retry_after" in result:
+                print(
+                    f"[{timestamp}] Rate limited; pausing {result['retry_after']:.0f}s",
+                    file=sys.stderr,
+                )
+                scheduler.defer(result["retry_after"])
+                continue
+            print(
+                f"[{timestamp}] {runs[run_id]}: {result.get('error')}", file=sys.stderr
+            )
+            summaries[run_id] = {"run_id": run_id, "error": result.get("error")}
+            scheduler.remove(run_id)
+            continue
+
+        attrs = result["run"].get("attributes", {})
+        status = attrs.get("status", "unknown")
+        changed = status != last_status.get(run_id)
+        if changed:
+            print(
+                f"[{timestamp}] {runs[run_id]}: {status}{_plan_summary(attrs)}",
+                file=sys.stderr,
+            )
+            last_status[run_id] = status
+
+        if status in TERMINAL_STATES:
+            summaries[run_id] = _run_summary(run_id, attrs)
+            scheduler.remove(run_id)
         else:
-            print(f"[Could not fetch apply logs: {log_result.get('error')}]")
+            scheduler.record(run_id, status, changed)
 
-    return 0
+    print("-" * 50, file=sys.stderr)
+    output = [summaries[run_id] for run_id in runs]
+    if fmt != "compact":
+        print(format_output(output, fmt))
+    return 0 if all(row.get("status") in SUCCESS_STATES for row in output) else 1
 
 
 def workflow_watch_run(
-    client: MCPStdioClient,
+    client: MCPClient,
     hcp_client: HCPTerraformClient,
     args: argparse.Namespace,
     fmt: str,
+    run_cache: RunCache | None = None,
 ) -> int:
-    """Watch a run's progress with live updates."""
+    """Watch one or more runs' progress with live updates."""
     org = get_default_org()
     run_id = getattr(args, "run_id", None)
-    workspace = getattr(args, "workspace", None)
-    show_logs = getattr(args, "logs", False)
+    workspaces = getattr(args, "workspace", None) or []
+    if isinstance(workspaces, str):
+        workspaces = [workspaces]
+    org_active = getattr(args, "org_active", False)
+    follow = getattr(args, "follow", False)
+    show_logs = getattr(args, "logs", False) or follow
+    engine = getattr(args, "engine", "mcp")
     poll_interval = getattr(args, "interval", POLL_INTERVAL)
+    max_interval = getattr(args, "max_interval", MAX_POLL_INTERVAL)
     max_wait = getattr(args, "timeout", 3600)
     start_time = time.time()
 
     # Validate poll_interval (minimum 1 second)
     poll_interval = max(poll_interval, 1)
+    # Live log tailing needs steady polls, so don't back off while following
+    scheduler = PollScheduler(poll_interval, poll_interval if follow else max_interval)
 
-    # If workspace provided, get latest run
-    if not run_id and workspace:
-        result = client.call_tool(
-            "list_runs",
-            {
-                "terraform_org_name": org,
-                "workspace_name": workspace,
-                "pageSize": 1,
-            },
-        )
-        if not result.get("success"):
-            print(f"Error: {result.get('error')}", file=sys.stderr)
+    if org_active or len(workspaces) > 1:
+        if run_id:
+            print(
+                "Error: run_id cannot be combined with several workspaces",
+                file=sys.stderr,
+            )
             return 1
-
-        data = unwrap_result(result)
-        if isinstance(data, list):
-            items = data
-        elif isinstance(data, dict):
-            if "data" in data:
-                if isinstance(data["data"], list):
-                    items = data["data"]
-                else:
-                    warnings.warn(
-                        f"Expected list in data['data'], got {type(data['data']).__name__}. Using empty list.",
-                        stacklevel=2,
-                    )
-                    items = []
-            elif "items" in data:
-                if isinstance(data["items"], list):
-                    items = data["items"]
-                else:
-                    warnings.warn(
-                        f"Expected list in data['items'], got {type(data['items']).__name__}. Using empty list.",
-                        stacklevel=2,
-                    )
-                    items = []
-            else:
-                items = [data] if data else []
+        if show_logs:
+            print(
+                "Error: --logs/--follow require a single run; use run-details per run",
+                file=sys.stderr,
+            )
+            return 1
+        if org_active:
+            result = _active_org_runs(hcp_client, org)
+            if not result.get("success"):
+                print(f"Error: {result.get('error')}", file=sys.stderr)
+                return 1
+            runs = result["runs"]
+            if not runs:
+                print(f"No active runs in organization '{org}'", file=sys.stderr)
+                return 0
         else:
-            items = []
+            runs = {}
+            for workspace in workspaces:
+                result = _latest_run_id(client, hcp_client, org, workspace, engine)
+                if not result.get("success"):
+                    print(f"Error: {result.get('error')}", file=sys.stderr)
+                    return 1
+                runs[result["run_id"]] = f"{workspace} ({result['run_id']})"
+        return _watch_many(client, hcp_client, runs, engine, scheduler, max_wait, fmt)
 
-        if not items:
-            print(f"No runs found for workspace '{workspace}'", file=sys.stderr)
+    # If workspace provided, get latest run
+    if not run_id and workspaces:
+        result = _latest_run_id(client, hcp_client, org, workspaces[0], engine)
+        if not result.get("success"):
+            print(f"Error: {result.get('error')}", file=sys.stderr)
             return 1
-        run_id = items[0].get("id")
+        run_id = result["run_id"]
 
     if not run_id:
-        print("Error: Either run_id or --workspace is required", file=sys.stderr)
+        print(
+            "Error: Either run_id, --workspace or --org-active is required",
+            file=sys.stderr,
+        )
         return 1
 
-    terminal_states = {
-        "applied",
-        "errored",
-        "discarded",
-        "canceled",
-        "force_canceled",
-        "planned_and_finished",
-        "policy_soft_failed",
-    }
-
-    # Check if run is already in terminal state
-    result = client.call_tool("get_run_details", {"run_id": run_id})
-    if result.get("success"):
-        data = unwrap_result(result)
-        if isinstance(data, dict):
-            run_data = data.get("data", data)
-            if isinstance(run_data, dict) and run_data.get("type") == "runs":
-                data = run_data
-            attrs = data.get("attributes", {})
-            status = attrs.get("status", "unknown")
-            if status in terminal_states:
-                print(
-                    f"Run {run_id} is already complete (status: {status})",
-                    file=sys.stderr,
-                )
-                print(
-                    f"Use 'run-details {run_id}' to view formatted logs",
-                    file=sys.stderr,
-                )
-                if not show_logs:
-                    # Just show summary and exit
-                    output = {
-                        "run_id": run_id,
-                        "status": status,
-                        "message": _truncate_message(
-                            attrs.get("message", "") or "", 200
-                        ),
-                        "resource_additions": attrs.get("resource-additions", 0),
-                        "resource_changes": attrs.get("resource-changes", 0),
-                        "resource_destructions": attrs.get("resource-destructions", 0),
-                    }
-                    print(format_output(output, fmt))
-                    success_states = {"applied", "planned_and_finished"}
-                    return 0 if status in success_states else 1
+    # Check if run is already in terminal state
+    result = _fetch_run(client, hcp_client, run_id, engine, run_cache)
+    if result.get("success"):
+        data = result["run"]
+        attrs = data.get("attributes", {})
+        status = attrs.get("status", "unknown")
+        if status in TERMINAL_STATES:
+            print(
+                f"Run {run_id} is already complete (status: {status})",
+                file=sys.stderr,
+            )
+            print(
+                f"Use 'run-details {run_id}' to view formatted logs",
+                file=sys.stderr,
+            )
+            if not show_logs:
+                # Just show summary and exit
+                print(format_output(_run_summary(run_id, attrs), fmt))
+                return 0 if status in SUCCESS_STATES else 1
 
     print(f"Watching run: {run_id}", file=sys.stderr)
     print(f"Poll interval: {poll_interval}s", file=sys.stderr)
     print("-" * 50, file=sys.stderr)
 
     last_status = None
+    tailers: dict[str, LogTailer] = {}
+    scheduler.add(run_id)
 
     while True:
         # Check for timeout
@@ -1348,45 +4140,40 @@ def workflow_watch_run(
             print(f"Timeout: Run did not complete within {max_wait}s", file=sys.stderr)
             return 1
 
-        result = client.call_tool("get_run_details", {"run_id": run_id})
+        scheduler.wait()
+        result = _fetch_run(client, hcp_client, run_id, engine, run_cache)
 
         if not result.get("success"):
+            if "retry_after" in result:
+                scheduler.defer(result["retry_after"])
+                continue
             print(f"Error: {result.get('error')}", file=sys.stderr)
             return 1
 
-        data = unwrap_result(result)
-        if not isinstance(data, dict):
-            print("Error: Unexpected response format", file=sys.stderr)
-            return 1
-
-        # Navigate into the run object (response wraps it in {"data": {...}})
-        run_data = data.get("data", data)
-        if isinstance(run_data, dict) and run_data.get("type") == "runs":
-            data = run_data
-
+        data = result["run"]
         attrs = data.get("attributes", {})
         status = attrs.get("status", "unknown")
 
         # Print status update if changed
-        if status != last_status:
+        changed = status != last_status
+        if changed:
             timestamp = time.strftime("%H:%M:%S")
-            plan_summary = ""
-
-            # Try to get plan/apply counts
-            additions = attrs.get("resource-additions", 0)
-            changes = attrs.get("resource-changes", 0)
-            destructions = attrs.get("resource-destructions", 0)
-            if additions or changes or destructions:
-                plan_summary = f" | Plan: +{additions} ~{changes} -{destructions}"
-
-            print(f"[{timestamp}] Status: {status}{plan_summary}", file=sys.stderr)
+            print(
+                f"[{timestamp}] Status: {status}{_plan_summary(attrs)}",
+                file=sys.stderr,
+            )
             last_status = status
 
+        if follow and status not in TERMINAL_STATES:
+            _follow_run_logs(hcp_client, data, tailers)
+
         # Check for terminal state
-        if status in terminal_states:
+        if status in TERMINAL_STATES:
+            if follow:
+                _drain_run_logs(hcp_client, data, tailers)
             print("-" * 50, file=sys.stderr)
 
-            # Get and display logs if requested
+            # Get and display logs if requested (skipping any already tailed)
             if show_logs:
                 relationships = data.get("relationships", {})
                 if not relationships:
@@ -1395,62 +4182,585 @@ def workflow_watch_run(
                     plan_rel = relationships.get("plan", {}).get("data", {})
                     apply_rel = relationships.get("apply", {}).get("data", {})
 
-                    if plan_rel.get("id"):
+                    if plan_rel.get("id") and "plan" not in tailers:
                         print("\n=== Plan Output ===")
-                        log_result = hcp_client.get_plan_logs(plan_rel["id"])
-                        if log_result.get("success"):
-                            formatted = format_terraform_logs(
-                                log_result.get("logs", "")
-                            )
-                            print(formatted)
-                        else:
-                            print(
-                                f"[Could not fetch plan logs: {log_result.get('error')}]"
-                            )
+                        print_run_log(hcp_client, "plan", plan_rel["id"], run_cache)
 
                     # Show apply logs for both successful and errored runs
-                    if apply_rel.get("id") and status in ("applied", "errored"):
+                    if (
+                        apply_rel.get("id")
+                        and status in ("applied", "errored")
+                        and "apply" not in tailers
+                    ):
                         print("\n=== Apply Output ===")
-                        log_result = hcp_client.get_apply_logs(apply_rel["id"])
-                        if log_result.get("success"):
-                            formatted = format_terraform_logs(
-                                log_result.get("logs", "")
-                            )
-                            print(formatted)
-                        else:
-                            print(
-                                f"[Could not fetch apply logs: {log_result.get('error')}]"
-                            )
+                        print_run_log(hcp_client, "apply", apply_rel["id"], run_cache)
 
             # Final output
-            output = {
-                "run_id": run_id,
-                "status": status,
-                "message": _truncate_message(attrs.get("message", "") or "", 200),
-                "resource_additions": attrs.get("resource-additions", 0),
-                "resource_changes": attrs.get("resource-changes", 0),
-                "resource_destructions": attrs.get("resource-destructions", 0),
-            }
-
             if fmt != "compact":
-                print(format_output(output, fmt))
+                print(format_output(_run_summary(run_id, attrs), fmt))
 
             # Success states return 0, failure states return 1
-            success_states = {"applied", "planned_and_finished"}
-            return 0 if status in success_states else 1
+            return 0 if status in SUCCESS_STATES else 1
 
-        time.sleep(poll_interval)
+        scheduler.record(run_id, status, changed)
 
 
-def main():
+def _fetch_runs_since(
+    hcp_client: HCPTerraformClient,
+    organization: str,
+    workspace: str,
+    resume_from: str | None,
+) -> list[dict[str, Any]]:
+    """Collect a workspace's runs, newest first, back to `resume_from`.
+
+    The run at `resume_from` itself is included so it can be refreshed.
+    Raises HCPTerraformError if a page request fails.
+    """
+    runs = []
+    for run in hcp_client.iter_runs(organization, workspace):
+        created = run.get("attributes", {}).get("created-at", "")
+        if resume_from and created < resume_from:
+            break
+        runs.append(run)
+    return runs
+
+
+def workflow_run_history(
+    hcp_client: HCPTerraformClient | None,
+    args: argparse.Namespace,
+    fmt: str,
+) -> int:
+    """Mirror run metadata into a local SQLite store, or report stats from it."""
+    org = get_default_org()
+    action = getattr(args, "action", "stats")
+    workspaces = getattr(args, "workspaces", None) or []
+    db_path = getattr(args, "db", None) or cache_dir() / "run-history.sqlite3"
+    store = RunHistoryStore(Path(db_path))
+
+    try:
+        if action == "stats":
+            since_arg = getattr(args, "since", None)
+            try:
+                since = parse_since(since_arg) if since_arg else None
+            except ValueError:
+                print(f"Error: invalid --since value '{since_arg}'", file=sys.stderr)
+                return 1
+            cutoff = (
+                since.astimezone(dt.timezone.utc).strftime("%Y-%m-%dT%H:%M:%S")
+                if since
+                else None
+            )
+            rows = store.stats(org, workspaces, cutoff)
+            if not rows:
+                print("No synced runs; run 'run-history sync' first", file=sys.stderr)
+                return 1
+            print(format_output(rows, fmt))
+            return 0
+
+        if hcp_client is None:
+            print("Error: TFE_TOKEN required for run-history sync", file=sys.stderr)
+            return 1
+        if getattr(args, "all", False):
+            try:
+                workspaces = [
+                    ws.get("attributes", {}).get("name")
+                    for ws in hcp_client.iter_workspaces(org)
+                ]
+            except HCPTerraformError as e:
+                print(f"Error: {e}", file=sys.stderr)
+                return 1
+        if not workspaces:
+            print("Error: name workspaces to sync or pass --all", file=sys.stderr)
+            return 1
+
+        # Resume points are read up front: the SQLite connection stays on
+        # this thread, workers only talk to the API.
+        resume = {ws: store.resume_point(org, ws) for ws in workspaces}
+        concurrency = max(1, getattr(args, "concurrency", 8))
+        failed = 0
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            futures = {
+                pool.submit(_fetch_runs_since, hcp_client, org, ws, resume[ws]): ws
+                for ws in workspaces
+            }
+            for future in as_completed(futures):
+                ws = futures[future]
+                try:
+                    runs = future.result()
+                except HCPTerraformError as e:
+                    print(f"Error: {ws}: {e}", file=sys.stderr)
+                    failed += 1
+                    continue
+                store.upsert(org, ws, runs)
+                print(f"{ws}: {len(runs)} runs synced", file=sys.stderr)
+        return 1 if failed else 0
+    finally:
+        store.close()
+
+
+def _created_at(run: dict[str, Any]) -> dt.datetime | None:
+    """A run's created-at as an aware datetime, or None if absent."""
+    created = (run.get("attributes") or {}).get("created-at")
+    return parse_since(created) if created else None
+
+
+def _search_match(
+    run: dict[str, Any],
+    pattern: re.Pattern[str] | None,
+    until: dt.datetime | None,
+) -> bool:
+    """Whether a run inside the --since window passes the remaining filters."""
+    created = _created_at(run)
+    if until and created and created > until:
+        return False
+    message = (run.get("attributes") or {}).get("message") or ""
+    return pattern is None or pattern.search(message) is not None
+
+
+def _search_row(run: dict[str, Any], workspace: str) -> dict[str, Any]:
+    """A list-runs row tagged with the run's workspace."""
+    return {"workspace": workspace, **_run_row(Resource(run))}
+
+
+def _search_org_runs(
+    hcp_client: HCPTerraformClient,
+    org: str,
+    status: str | None,
+    pattern: re.Pattern[str] | None,
+    since: dt.datetime,
+    until: dt.datetime | None,
+) -> Iterator[dict[str, Any]]:
+    """Yield matching runs from the organization-wide runs listing.
+
+    Runs come newest first across every workspace, so paging stops at the
+    first run older than `since`. Workspace names are sideloaded and
+    collected across pages. Raises HCPTerraformError if a page fails.
+    """
+    included: dict[tuple[str, str], dict[str, Any]] = {}
+    params: dict[str, Any] = {"include": "workspace", "page[size]": 100}
+    if status:
+        params["filter[status]"] = status
+    for run in hcp_client.iter_org_runs(org, params, included):
+        created = _created_at(run)
+        if created and created < since:
+            return
+        if not _search_match(run, pattern, until):
+            continue
+        ws = (run.get("relationships") or {}).get("workspace", {}).get("data") or {}
+        name = (
+            included.get(("workspaces", ws.get("id")), {})
+            .get("attributes", {})
+            .get("name", ws.get("id", ""))
+        )
+        yield _search_row(run, name)
+
+
+def _search_workspace_runs(
+    hcp_client: HCPTerraformClient,
+    org: str,
+    workspace: str,
+    status: str | None,
+    pattern: re.Pattern[str] | None,
+    since: dt.datetime,
+    until: dt.datetime | None,
+) -> list[dict[str, Any]]:
+    """Collect one workspace's matching runs back to `since`.
+
+    Raises HCPTerraformError if a page request fails.
+    """
+    rows = []
+    for run in hcp_client.iter_runs(org, workspace, status_filter=status):
+        created = _created_at(run)
+        if created and created < since:
+            break
+        if _search_match(run, pattern, until):
+            rows.append(_search_row(run, workspace))
+    return rows
+
+
+def _print_search_table_row(row: dict[str, Any]) -> None:
+    """Print one search-runs row: the list-runs layout behind a workspace."""
+    print(f"{row['workspace'][:32]:<33}", end="")
+    _print_run_table_row(row)
+
+
+def workflow_search_runs(
+    hcp_client: HCPTerraformClient | None,
+    args: argparse.Namespace,
+    fmt: str,
+) -> int:
+    """Find runs across every workspace of the organization.
+
+    Filters by status, a message regex and a created-at window. The
+    organization-wide runs listing answers in one paged query; where it is
+    not available (HTTP 404), the workspace list is fetched once and each
+    workspace's runs are listed concurrently. Matches stream out as they
+    are found: table rows for compact/yaml, JSON Lines otherwise.
+    """
+    if hcp_client is None:
+        print("Error: TFE_TOKEN required for search-runs", file=sys.stderr)
+        return 1
+    org = get_default_org()
+    status = getattr(args, "status", None)
+    window = {}
+    for option in ("since", "until"):
+        value = getattr(args, option, None)
+        try:
+            window[option] = parse_since(value) if value else None
+        except ValueError:
+            print(f"Error: invalid --{option} value '{value}'", file=sys.stderr)
+            return 1
+    since = window["since"] or parse_since("24h")
+    until = window["until"]
+    message = getattr(args, "message", None)
+    try:
+        pattern = re.compile(message, re.IGNORECASE) if message else None
+    except re.error as e:
+        print(f"Error: invalid --message pattern: {e}", file=sys.stderr)
+        return 1
+
+    table = fmt in ("compact", "yaml")
+    count = 0
+
+    def emit(row: dict[str, Any]) -> None:
+        nonlocal count
+        if table:
+            _print_search_table_row(row)
+        else:
+            _print_stream_row(row, fmt)
+        count += 1
+
+    if table:
+        print(f"Organization: {org}")
+        print()
+        print(f"{'WORKSPACE':<33}{'ID':<24} {'STATUS':<12} {'CREATED':<17} MESSAGE")
+        print("-" * 113)
+
+    failed = 0
+    try:
+        for row in _search_org_runs(hcp_client, org, status, pattern, since, until):
+            emit(row)
+    except HCPTerraformError as e:
+        if e.status != 404:
+            print(f"Error: {e}", file=sys.stderr)
+            return 1
+        # No organization-wide listing (older Terraform Enterprise): fan out
+        try:
+            workspaces = [
+                ws.get("attributes", {}).get("name")
+                for ws in hcp_client.iter_workspaces(org)
+            ]
+        except HCPTerraformError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            return 1
+        concurrency = max(1, getattr(args, "concurrency", 8))
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            futures = {
+                pool.submit(
+                    _search_workspace_runs,
+                    hcp_client,
+                    org,
+                    ws,
+                    status,
+                    pattern,
+                    since,
+                    until,
+                ): ws
+                for ws in workspaces
+            }
+            for future in as_completed(futures):
+                try:
+                    rows = future.result()
+                except HCPTerraformError as e:
+                    print(f"Error: {futures[future]}: {e}", file=sys.stderr)
+                    failed += 1
+                    continue
+                for row in rows:
+                    emit(row)
+                sys.stdout.flush()
+
+    if table:
+        print(f"\nMatches: {count}")
+    return 1 if failed else 0
+
+
+def _parse_batch_line(line: str) -> tuple[str, dict[str, Any]]:
+    """Parse one batch request line into (tool name, arguments).
+
+    Raises ValueError describing what is wrong with the line.
+    """
+    try:
+        request = json.loads(line)
+    except json.JSONDecodeError as e:
+        raise ValueError(f"Invalid JSON: {e}") from e
+    if not isinstance(request, dict) or not isinstance(request.get("name"), str):
+        raise ValueError('Expected an object with a "name" string')
+    arguments = request.get("arguments", {})
+    if not isinstance(arguments, dict):
+        raise ValueError('"arguments" must be an object')
+    return request["name"], arguments
+
+
+def workflow_batch(client: MCPClient, args: argparse.Namespace, fmt: str) -> int:
+    """Run a JSONL stream of tool calls over one MCP session.
+
+    Each input line is {"name": ..., "arguments": {...}}. Up to
+    `--max-in-flight` calls are pipelined; results stream out as JSON Lines
+    in completion order, each tagged with its input line number.
+    """
+    source = getattr(args, "file", None) or "-"
+    max_in_flight = max(1, getattr(args, "max_in_flight", 8))
+    timeout = getattr(client, "request_timeout", MCP_REQUEST_TIMEOUT)
+    # Each call maps to its line number, tool name and own deadline
+    in_flight: dict[Future, tuple[int, str, float]] = {}
+    # Done-callbacks fire on the reader thread in reply order, so results
+    # leave this queue in true completion order even when replies coincide.
+    completed: queue.Queue[Future] = queue.Queue()
+    failed = 0
+
+    def emit(line_no: int, name: str | None, result: dict[str, Any]) -> None:
+        nonlocal failed
+        row: dict[str, Any] = {"line": line_no, "name": name}
+        if result.get("success"):
+            row.update(success=True, result=unwrap_result(result))
+        else:
+            failed += 1
+            row.update(success=False, error=result.get("error"))
+        _print_stream_row(row, "jsonl")
+
+    def drain(block_until: int) -> None:
+        # Wait until at most `block_until` calls remain outstanding
+        while len(in_flight) > block_until:
+            deadline = min(due for _, _, due in in_flight.values())
+            try:
+                future = completed.get(timeout=max(0.0, deadline - time.monotonic()))
+            except queue.Empty:
+                now = time.monotonic()
+                for future, (line_no, name, due) in list(in_flight.items()):
+                    if due <= now:
+                        del in_flight[future]
+                        future.cancel()
+                        error = f"MCP request '{name}' timed out after {timeout:g}s"
+                        emit(line_no, name, {"success": False, "error": error})
+                continue
+            entry = in_flight.pop(future, None)
+            if entry is None:
+                continue  # already reported as timed out
+            line_no, name, _ = entry
+            emit(line_no, name, future.result())
+
+    try:
+        stream = (
+            contextlib.nullcontext(sys.stdin)
+            if source == "-"
+            else Path(source).open(encoding="utf-8")
+        )
+    except OSError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    with stream as lines:
+        for line_no, line in enumerate(lines, start=1):
+            if not line.strip():
+                continue
+            try:
+                name, arguments = _parse_batch_line(line)
+            except ValueError as e:
+                emit(line_no, None, {"success": False, "error": str(e)})
+                continue
+            drain(max_in_flight - 1)
+            future = client.submit_tool(name, arguments)
+            in_flight[future] = (line_no, name, time.monotonic() + timeout)
+            future.add_done_callback(completed.put)
+        drain(0)
+
+    return 1 if failed else 0
+
+
+def workflow_broker(args: argparse.Namespace, fmt: str) -> int:
+    """Start, stop, inspect or run the long-lived MCP broker."""
+    session = SessionManager()
+    path = broker_socket_path(session._get_env())
+    action = args.action
+
+    if action == "serve":
+        try:
+            client = session.get_client(use_broker=False)
+            return MCPBroker(client, path, args.idle_timeout).serve()
+        finally:
+            session.cleanup()
+
+    broker = BrokerClient.connect(path)
+
+    if action == "status":
+        if broker is None:
+            print("Broker not running", file=sys.stderr)
+            return 1
+        try:
+            result = broker.status()
+        finally:
+            broker.close()
+        if "error" in result:
+            print(f"Error: {result['error'].get('message')}", file=sys.stderr)
+            return 1
+        print(format_output(result.get("result", {}), fmt))
+        return 0
+
+    if action == "stop":
+        if broker is None:
+            print("Broker not running", file=sys.stderr)
+            return 0
+        try:
+            broker.shutdown()
+        finally:
+            broker.close()
+        print("Broker stopped", file=sys.stderr)
+        return 0
+
+    # start
+    if broker is not None:
+        broker.close()
+        print(f"Broker already running: {path}", file=sys.stderr)
+        return 0
+
+    log_path = path.with_suffix(".log")
+    with open(log_path, "ab") as log:
+        subprocess.Popen(
+            [
+                sys.executable,
+                str(Path(__file__).resolve()),
+                "broker",
+                "serve",
+                "--idle-timeout",
+                str(args.idle_timeout),
+            ],
+            stdin=subprocess.DEVNULL,
+            stdout=log,
+            stderr=log,
+            start_new_session=True,
+        )
+
+    deadline = time.monotonic() + BROKER_START_TIMEOUT
+    while time.monotonic() < deadline:
+        broker = BrokerClient.connect(path)
+        if broker is not None:
+            broker.close()
+            print(f"Broker started: {path}", file=sys.stderr)
+            return 0
+        time.sleep(0.25)
+
+    print(f"Error: Broker did not start; see {log_path}", file=sys.stderr)
+    return 1
+
+
+def _docker_image_present(image: str) -> bool:
+    """Whether `image` is already in the local Docker image store."""
+    probe = subprocess.run(
+        ["docker", "image", "inspect", image],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    return probe.returncode == 0
+
+
+def _timed_session(tools_cache: ToolSchemaCache | None) -> dict[str, Any]:
+    """Start a fresh container and time it through initialize and tools/list.
+
+    The initialize time covers `docker run` up to the server's first
+    reply. Returns seconds per phase, or {"error": ...} on failure.
+    """
+    session = SessionManager()
+    try:
+        start = time.perf_counter()
+        client = session.get_client(use_broker=False)
+        result = client.initialize()
+        initialized = time.perf_counter()
+        if "error" in result:
+            return {"error": result["error"].get("message", str(result["error"]))}
+        tools = client.fetch_tools()
+        listed = time.perf_counter()
+        if not tools.get("success"):
+            return {"error": tools.get("error")}
+    finally:
+        session.cleanup()
+    if tools_cache:
+        tools_cache.store(tools["tools"])
+    return {
+        "initialize_seconds": round(initialized - start, 3),
+        "tools_list_seconds": round(listed - initialized, 3),
+        "total_seconds": round(listed - start, 3),
+        "tools": len(tools["tools"]),
+    }
+
+
+def workflow_warmup(
+    args: argparse.Namespace,
+    fmt: str,
+    tools_cache: ToolSchemaCache | None = None,
+) -> int:
+    """Pull the MCP image if absent and prove a container reaches tools/list.
+
+    Two sessions are timed back to back: the cold start is the first
+    container after the pull, the warm start a repeat with the image and
+    page cache hot. With --broker a warm broker is left running.
+    """
+    report: dict[str, Any] = {"image": DOCKER_IMAGE, "pulled": False}
+    if not _docker_image_present(DOCKER_IMAGE):
+        print(f"Pulling {DOCKER_IMAGE}...", file=sys.stderr)
+        start = time.perf_counter()
+        pull = subprocess.run(
+            ["docker", "pull", DOCKER_IMAGE],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            text=True,
+        )
+        if pull.returncode != 0:
+            print(f"Error: docker pull failed: {pull.stderr.strip()}", file=sys.stderr)
+            return 1
+        report["pulled"] = True
+        report["pull_seconds"] = round(time.perf_counter() - start, 3)
+
+    for phase in ("cold_start", "warm_start"):
+        timing = _timed_session(tools_cache)
+        if "error" in timing:
+            label = phase.replace("_", " ")
+            print(f"Error: {label} failed: {timing['error']}", file=sys.stderr)
+            return 1
+        report[phase] = timing
+
+    if args.broker:
+        broker_args = argparse.Namespace(action="start", idle_timeout=args.idle_timeout)
+        if workflow_broker(broker_args, fmt) != 0:
+            return 1
+        report["broker"] = str(broker_socket_path(SessionManager()._get_env()))
+
+    print(format_output(report, fmt))
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         description="Terraform MCP Gateway - invoke Terraform tools without MCP context overhead",
     )
     parser.add_argument(
         "--format",
-        choices=["json", "yaml", "compact"],
+        choices=["json", "jsonl", "yaml", "compact"],
         default="yaml",
-        help="Output format (default: yaml)",
+        help="Output format (default: yaml); jsonl streams listings row by row",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Bypass the local caches of finished runs, logs and provider docs",
+    )
+    parser.add_argument(
+        "--timings",
+        action="store_true",
+        help="Time each phase and print a summary to stderr",
+    )
+    parser.add_argument(
+        "--timings-file",
+        metavar="FILE",
+        help="Time each phase and append one JSONL record to FILE",
     )
     subparsers = parser.add_subparsers(dest="command", help="Commands")
 
@@ -1468,11 +4778,86 @@ def main():
         "arguments", nargs="?", default="{}", help="JSON arguments"
     )
 
+    # batch (many raw tool calls over one session)
+    batch_parser = subparsers.add_parser(
+        "batch", help="Run JSONL tool calls over one MCP session"
+    )
+    batch_parser.add_argument(
+        "file",
+        nargs="?",
+        default="-",
+        help='JSONL file of {"name", "arguments"} requests (default: stdin)',
+    )
+    batch_parser.add_argument(
+        "--max-in-flight",
+        "-j",
+        type=int,
+        default=8,
+        help="Tool calls pipelined at once (default: 8)",
+    )
+
+    # broker
+    broker_parser = subparsers.add_parser(
+        "broker", help="Manage a long-lived MCP server shared across invocations"
+    )
+    broker_parser.add_argument(
+        "action",
+        choices=["start", "stop", "status", "serve"],
+        help="start in background, stop, show status, or serve in foreground",
+    )
+    broker_parser.add_argument(
+        "--idle-timeout",
+        type=int,
+        default=BROKER_IDLE_TIMEOUT,
+        help=f"Exit after this many idle seconds (default: {BROKER_IDLE_TIMEOUT})",
+    )
+
+    # warmup
+    warmup_parser = subparsers.add_parser(
+        "warmup", help="Pull the MCP image if needed and time container startup"
+    )
+    warmup_parser.add_argument(
+        "--broker",
+        action="store_true",
+        help="Leave a warm broker running afterwards",
+    )
+    warmup_parser.add_argument(
+        "--idle-timeout",
+        type=int,
+        default=BROKER_IDLE_TIMEOUT,
+        help=f"Broker idle seconds before exit (default: {BROKER_IDLE_TIMEOUT})",
+    )
+
     # workspace-status
     ws_parser = subparsers.add_parser("workspace-status", help="Show workspace status")
     ws_parser.add_argument(
         "workspace", nargs="?", help="Workspace name (optional, lists all if omitted)"
     )
+    ws_parser.add_argument(
+        "--all",
+        "-a",
+        action="store_true",
+        help="List all workspaces (the default when no name is given)",
+    )
+    ws_parser.add_argument(
+        "--detail",
+        action="store_true",
+        help="With --all: add execution mode, auto-apply, VCS repo and latest run, "
+        "streaming one row per workspace",
+    )
+    ws_parser.add_argument(
+        "--concurrency",
+        "-c",
+        type=int,
+        default=8,
+        help="Parallel lookups for --detail (default: 8)",
+    )
+    ws_parser.add_argument(
+        "--engine",
+        choices=["mcp", "api"],
+        default="mcp",
+        help="List workspaces via the MCP server or directly from the HCP API",
+    )
 
     # list-runs
     runs_parser = subparsers.add_parser(
@@ -1485,22 +4870,58 @@ def main():
     runs_parser.add_argument(
         "--status", help="Filter by status (e.g., applied, errored, planning)"
     )
+    runs_parser.add_argument(
+        "--all",
+        action="store_true",
+        help="Page through every run, streaming rows as they arrive (direct API)",
+    )
+    runs_parser.add_argument(
+        "--since",
+        help="Stream runs created since an ISO 8601 timestamp or age (e.g. 7d, 12h)",
+    )
+    runs_parser.add_argument(
+        "--engine",
+        choices=["mcp", "api"],
+        default="mcp",
+        help="Fetch runs via the MCP server or directly from the HCP API (no Docker)",
+    )
 
     # watch-run
     watch_parser = subparsers.add_parser("watch-run", help="Watch a run's progress")
     watch_parser.add_argument("run_id", nargs="?", help="Run ID to watch")
     watch_parser.add_argument(
-        "--workspace", "-w", help="Watch latest run for workspace"
+        "--workspace",
+        "-w",
+        action="append",
+        help="Watch latest run for workspace (repeat to watch several)",
+    )
+    watch_parser.add_argument(
+        "--org-active",
+        action="store_true",
+        help="Watch every non-final run in the organization",
     )
     watch_parser.add_argument(
         "--logs", "-l", action="store_true", help="Show plan/apply logs when complete"
     )
+    watch_parser.add_argument(
+        "--follow",
+        "-f",
+        action="store_true",
+        help="Stream plan/apply logs live while the run progresses (implies --logs)",
+    )
     watch_parser.add_argument(
         "--interval",
         "-i",
         type=int,
-        default=5,
-        help="Poll interval in seconds (default: 5)",
+        default=POLL_INTERVAL,
+        help=f"Steady-state poll interval in seconds (default: {POLL_INTERVAL})",
+    )
+    watch_parser.add_argument(
+        "--max-interval",
+        type=int,
+        default=MAX_POLL_INTERVAL,
+        help="Backoff cap for pending/planning runs in seconds "
+        f"(default: {MAX_POLL_INTERVAL})",
     )
     watch_parser.add_argument(
         "--timeout",
@@ -1509,6 +4930,12 @@ def main():
         default=3600,
         help="Maximum wait time in seconds (default: 3600)",
     )
+    watch_parser.add_argument(
+        "--engine",
+        choices=["mcp", "api"],
+        default="mcp",
+        help="Fetch runs via the MCP server or directly from the HCP API (no Docker)",
+    )
 
     # run-outputs
     outputs_parser = subparsers.add_parser(
@@ -1516,7 +4943,16 @@ def main():
     )
     outputs_parser.add_argument("run_id", nargs="?", help="Run ID")
     outputs_parser.add_argument(
-        "--workspace", "-w", help="Get outputs from latest successful run"
+        "--workspace",
+        "-w",
+        nargs="+",
+        help="Get outputs from these workspaces' current state versions",
+    )
+    outputs_parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=8,
+        help="Workspaces fetched in parallel (default: 8)",
     )
 
     # run-details
@@ -1524,6 +4960,80 @@ def main():
         "run-details", help="View details and formatted logs for a completed run"
     )
     details_parser.add_argument("run_id", help="Run ID to inspect")
+    details_parser.add_argument(
+        "--engine",
+        choices=["mcp", "api"],
+        default="mcp",
+        help=(
+            "Always read the run from the HCP API; mcp falls back to the MCP "
+            "server only when that request fails"
+        ),
+    )
+    details_parser.add_argument(
+        "--summary",
+        action="store_true",
+        help="Print change counts and destroy/replace addresses instead of logs",
+    )
+    details_parser.add_argument(
+        "--only",
+        choices=["plan", "apply"],
+        help="Fetch and show only the plan or only the apply log",
+    )
+
+    # run-history
+    history_parser = subparsers.add_parser(
+        "run-history", help="Sync run metadata locally and report duration stats"
+    )
+    history_parser.add_argument(
+        "action",
+        choices=["sync", "stats"],
+        help="sync: mirror runs from the API; stats: report from the local store",
+    )
+    history_parser.add_argument(
+        "workspaces", nargs="*", help="Workspaces to sync or report on"
+    )
+    history_parser.add_argument(
+        "--all", "-a", action="store_true", help="Sync every workspace in the org"
+    )
+    history_parser.add_argument(
+        "--since", help="stats: only runs created since a timestamp or age (e.g. 30d)"
+    )
+    history_parser.add_argument(
+        "--concurrency",
+        "-c",
+        type=int,
+        default=8,
+        help="Workspaces synced in parallel (default: 8)",
+    )
+    history_parser.add_argument(
+        "--db", help="SQLite file (default: $XDG_CACHE_HOME/terraform-mcp/...)"
+    )
+
+    # search-runs
+    search_parser = subparsers.add_parser(
+        "search-runs", help="Search runs across every workspace in the org"
+    )
+    search_parser.add_argument(
+        "--status", help="Comma-separated statuses (e.g. errored,canceled)"
+    )
+    search_parser.add_argument(
+        "--message", "-m", help="Case-insensitive regex matched against run messages"
+    )
+    search_parser.add_argument(
+        "--since",
+        default="24h",
+        help="Runs created since an ISO 8601 timestamp or age (default: 24h)",
+    )
+    search_parser.add_argument(
+        "--until", help="Runs created before an ISO 8601 timestamp or age"
+    )
+    search_parser.add_argument(
+        "--concurrency",
+        "-c",
+        type=int,
+        default=8,
+        help="Workspaces listed in parallel without an org runs listing (default: 8)",
+    )
 
     # list-providers
     list_prov_parser = subparsers.add_parser(
@@ -1551,24 +5061,76 @@ def main():
     provider_parser.add_argument(
         "--list-resources", "-l", action="store_true", help="List available resources"
     )
+    provider_parser.add_argument(
+        "--prefetch",
+        action="store_true",
+        help="Bulk-download the provider's docs into the local cache",
+    )
+    provider_parser.add_argument(
+        "--resources",
+        action="store_true",
+        help="--prefetch: include resources (the default)",
+    )
+    provider_parser.add_argument(
+        "--data-sources",
+        action="store_true",
+        help="--prefetch: include data sources",
+    )
+    provider_parser.add_argument(
+        "--concurrency",
+        "-c",
+        type=int,
+        default=8,
+        help="--prefetch: documents fetched in parallel (default: 8)",
+    )
+    provider_parser.add_argument(
+        "--query", "-q", help="Full-text search the locally cached docs (offline)"
+    )
 
+    return parser
+
+
+def main():
+    parser = build_parser()
     args = parser.parse_args()
 
     if not args.command:
         parser.print_help()
         sys.exit(1)
 
+    timings = args.timings_file or ("stderr" if args.timings else None)
+    if timings is None:
+        timings = os.environ.get("TFE_MCP_TIMINGS") or None
+        if timings in ("1", "true", "yes"):
+            timings = "stderr"
+    if timings:
+        TIMINGS.enable()
+
+    if args.command == "broker":
+        try:
+            sys.exit(workflow_broker(args, args.format))
+        except EnvironmentError as e:
+            print(f"Configuration error: {e}", file=sys.stderr)
+            sys.exit(1)
+
     session = SessionManager()
     hcp_client = None
 
     try:
-        client = session.get_client()
+        # Lazy: the container only starts if a command issues an MCP request
+        tools_cache = None if args.no_cache else ToolSchemaCache(cache_dir())
+        client = LazyMCPClient(session, tools_cache)
+        run_cache = None if args.no_cache else RunCache(cache_dir() / "runs")
 
         # Create HCP client for direct API calls
         token = os.environ.get("TFE_TOKEN")
         address = os.environ.get("TFE_ADDRESS", DEFAULT_TFE_ADDRESS)
         if token:
-            hcp_client = HCPTerraformClient(token, address)
+            hcp_client = HCPTerraformClient(
+                token,
+                address,
+                max_connections=max(1, getattr(args, "concurrency", 10)),
+            )
 
         if args.command == "list-tools":
             result = client.list_tools()
@@ -1605,8 +5167,14 @@ def main():
                 print(f"Error: {result.get('error', 'Unknown error')}", file=sys.stderr)
                 sys.exit(1)
 
+        elif args.command == "batch":
+            sys.exit(workflow_batch(client, args, args.format))
+
+        elif args.command == "warmup":
+            sys.exit(workflow_warmup(args, args.format, tools_cache))
+
         elif args.command == "workspace-status":
-            sys.exit(workflow_workspace_status(client, args, args.format))
+            sys.exit(workflow_workspace_status(client, args, args.format, hcp_client))
 
         elif args.command == "list-runs":
             sys.exit(workflow_list_runs(client, args, args.format))
@@ -1615,22 +5183,45 @@ def main():
             if not hcp_client:
                 print("Error: TFE_TOKEN required for watch-run", file=sys.stderr)
                 sys.exit(1)
-            sys.exit(workflow_watch_run(client, hcp_client, args, args.format))
+            sys.exit(
+                workflow_watch_run(client, hcp_client, args, args.format, run_cache)
+            )
 
         elif args.command == "run-outputs":
-            sys.exit(workflow_run_outputs(client, args, args.format))
+            sys.exit(
+                workflow_run_outputs(client, args, args.format, hcp_client, run_cache)
+            )
 
         elif args.command == "run-details":
             if not hcp_client:
                 print("Error: TFE_TOKEN required for run-details", file=sys.stderr)
                 sys.exit(1)
-            sys.exit(workflow_run_details(client, hcp_client, args, args.format))
+            sys.exit(
+                workflow_run_details(client, hcp_client, args, args.format, run_cache)
+            )
 
-        elif args.command == "list-providers":
-            sys.exit(workflow_list_providers(client, args, args.format))
+        elif args.command == "run-history":
+            sys.exit(workflow_run_history(hcp_client, args, args.format))
 
-        elif args.command == "provider-docs":
-            sys.exit(workflow_provider_docs(client, args, args.format))
+        elif args.command == "search-runs":
+            sys.exit(workflow_search_runs(hcp_client, args, args.format))
+
+        elif args.command in ("list-providers", "provider-docs"):
+            docs_cache = (
+                None
+                if args.no_cache
+                else DocsCache(cache_dir() / "provider-docs.sqlite3")
+            )
+            workflow = (
+                workflow_list_providers
+                if args.command == "list-providers"
+                else workflow_provider_docs
+            )
+            try:
+                sys.exit(workflow(client, args, args.format, docs_cache))
+            finally:
+                if docs_cache:
+                    docs_cache.close()
 
     except EnvironmentError as e:
         print(f"Configuration error: {e}", file=sys.stderr)
@@ -1642,6 +5233,8 @@ def main():
         session.cleanup()
         if hcp_client:
             hcp_client.close()
+        if timings:
+            TIMINGS.report(timings, args.command)
 
 
 if __name__ == "__main__":
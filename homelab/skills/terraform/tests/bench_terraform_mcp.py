@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+# /// script
+# requires-python = ">=3.11"
+# dependencies = ["pytest", "pytest-benchmark", "httpx", "pyyaml"]
+# ///
+"""Offline benchmarks for terraform_mcp.py against local fake servers.
+
+Not collected by the regular suite; run with `task bench`. The MCP side
+talks to fake_mcp_server.py over real stdio pipes and the API side to
+fake_hcp_server.py over real HTTP, so transport and parsing costs are
+included while Docker and the network are not.
+"""
+
+import contextlib
+import os
+import subprocess
+import sys
+import tracemalloc
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+TESTS_DIR = Path(__file__).parent
+sys.path.insert(0, str(TESTS_DIR.parent / "scripts"))
+sys.path.insert(0, str(TESTS_DIR))
+
+import terraform_mcp
+from fake_hcp_server import FakeHCPServer
+from terraform_mcp import HCPTerraformClient, MCPStdioClient, print_run_log
+
+FAKE_MCP_SERVER = TESTS_DIR / "fake_mcp_server.py"
+
+
+def spawn_fake_mcp(delay: float = 0.0) -> subprocess.Popen:
+    return subprocess.Popen(
+        [sys.executable, str(FAKE_MCP_SERVER), "--delay", str(delay)],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+    )
+
+
+@pytest.fixture
+def mcp_client():
+    client = MCPStdioClient(spawn_fake_mcp())
+    client.initialize()
+    yield client
+    client.close()
+
+
+@pytest.fixture
+def gateway_env(monkeypatch, tmp_path):
+    """Run main() against the fake servers instead of Docker and HCP."""
+    with FakeHCPServer(run_count=50) as server:
+        monkeypatch.setenv("TFE_TOKEN", "fake-token")
+        monkeypatch.setenv("TFE_ADDRESS", server.address)
+        monkeypatch.setenv("TFE_ORG", "fzymgc-house")
+        monkeypatch.setenv("TFE_MCP_BROKER", "0")
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+        monkeypatch.setattr(
+            terraform_mcp.SessionManager,
+            "_spawn_container",
+            lambda self: spawn_fake_mcp(),
+        )
+        yield server
+
+
+def run_command(monkeypatch, *argv: str) -> int:
+    monkeypatch.setattr(sys, "argv", ["terraform_mcp.py", "--no-cache", *argv])
+    with (
+        open(os.devnull, "w") as devnull,
+        contextlib.redirect_stdout(devnull),
+        pytest.raises(SystemExit) as exit_info,
+    ):
+        terraform_mcp.main()
+    return exit_info.value.code
+
+
+class TestCommandLatency:
+    """End-to-end latency of one gateway invocation, session setup included."""
+
+    def test_tool_command(self, benchmark, gateway_env, monkeypatch):
+        code = benchmark.pedantic(
+            run_command,
+            args=(monkeypatch, "tool", "list_workspaces", "{}"),
+            rounds=10,
+        )
+        assert code == 0
+
+    def test_run_details_api_engine(self, benchmark, gateway_env, monkeypatch):
+        run_id = gateway_env.runs[0]["id"]
+        code = benchmark.pedantic(
+            run_command,
+            args=(monkeypatch, "run-details", run_id, "--engine", "api"),
+            rounds=10,
+        )
+        assert code == 0
+
+    def test_list_runs_all(self, benchmark, gateway_env, monkeypatch):
+        code = benchmark.pedantic(
+            run_command,
+            args=(monkeypatch, "--format", "json", "list-runs", "ws", "--all"),
+            rounds=10,
+        )
+        assert code == 0
+
+
+class TestPipelinedThroughput:
+    """Tool calls over one warm session, sequential versus pipelined."""
+
+    CALLS = 16
+
+    @pytest.fixture
+    def slow_client(self):
+        client = MCPStdioClient(spawn_fake_mcp(delay=0.02))
+        client.initialize()
+        yield client
+        client.close()
+
+    def test_single_call(self, benchmark, mcp_client):
+        result = benchmark(mcp_client.call_tool, "list_workspaces", {})
+        assert result["success"]
+
+    def test_sequential(self, benchmark, slow_client):
+        def run():
+            for _ in range(self.CALLS):
+                slow_client.call_tool("list_workspaces", {})
+
+        benchmark.pedantic(run, rounds=5)
+
+    def test_pipelined(self, benchmark, slow_client):
+        def run():
+            futures = [
+                slow_client.submit_tool("list_workspaces", {})
+                for _ in range(self.CALLS)
+            ]
+            return [future.result() for future in futures]
+
+        results = benchmark.pedantic(run, rounds=5)
+        assert all("result" in result for result in results)
+
+
+class TestApiEngine:
+    """HCP API paging and log streaming over local HTTP."""
+
+    def test_paginate_runs(self, benchmark):
+        with FakeHCPServer(run_count=1000) as server:
+            hcp = HCPTerraformClient("fake-token", server.address)
+            try:
+                runs = benchmark(lambda: list(hcp.iter_runs("org", "ws")))
+            finally:
+                hcp.close()
+        assert len(runs) == 1000
+
+    def test_large_log_memory(self, benchmark):
+        """Streaming a large log keeps peak memory far below the log size."""
+        with FakeHCPServer(run_count=1, log_lines=100_000) as server:
+            hcp = HCPTerraformClient("fake-token", server.address)
+
+            def stream():
+                with (
+                    open(os.devnull, "w") as devnull,
+                    contextlib.redirect_stdout(devnull),
+                ):
+                    print_run_log(hcp, "plan", "plan-fake000000")
+
+            try:
+                benchmark.pedantic(stream, rounds=3)
+                tracemalloc.start()
+                stream()
+                _, peak = tracemalloc.get_traced_memory()
+                tracemalloc.stop()
+            finally:
+                hcp.close()
+        benchmark.extra_info["log_bytes"] = len(server.log)
+        benchmark.extra_info["peak_bytes"] = peak
+        assert peak < len(server.log) / 4
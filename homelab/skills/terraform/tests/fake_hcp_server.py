@@ -0,0 +1,183 @@
+"""Local stand-in for the HCP Terraform API, driven by the captured fixtures.
+
+Serves the endpoints the gateway's direct API engine uses:
+
+- GET /api/v2/runs/:id
+- GET /api/v2/runs (filter[...], page[number], page[size])
+- GET /api/v2/organizations/:org/runs
+- GET /api/v2/plans/:id and /api/v2/applies/:id
+- GET /logs/:id, honoring offset/limit like archivist log-read URLs
+
+The runs in fixtures/list_runs_api.json are cloned out to `run_count` runs,
+newest first, and every plan and apply log is `log_lines` lines of
+Terraform JSON log output framed by STX/ETX.
+"""
+
+import copy
+import datetime as dt
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Self
+from urllib.parse import parse_qs, urlencode, urlsplit
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+
+def fixture_runs(run_count: int) -> list[dict[str, Any]]:
+    """Clone the captured runs out to `run_count`, newest first."""
+    fixture = json.loads((FIXTURES_DIR / "list_runs_api.json").read_text())
+    templates = fixture["data"]["data"]
+    newest = dt.datetime(2026, 1, 1, tzinfo=dt.UTC)
+    runs = []
+    for i in range(run_count):
+        run = copy.deepcopy(templates[i % len(templates)])
+        run["id"] = f"run-fake{i:06d}"
+        created = newest - dt.timedelta(minutes=10 * i)
+        run["attributes"]["created-at"] = created.strftime("%Y-%m-%dT%H:%M:%S.000Z")
+        relationships = run["relationships"]
+        relationships["plan"]["data"]["id"] = f"plan-fake{i:06d}"
+        relationships["apply"]["data"]["id"] = f"apply-fake{i:06d}"
+        runs.append(run)
+    return runs
+
+
+def terraform_log(lines: int) -> bytes:
+    """A Terraform JSON log of `lines` lines, framed like archivist output."""
+    records = []
+    for i in range(lines):
+        address = f"aws_instance.web[{i}]"
+        records.append(
+            json.dumps(
+                {
+                    "@level": "info",
+                    "@message": f"{address}: Refreshing state... [id=i-{i:08x}]",
+                    "@module": "terraform.ui",
+                    "@timestamp": "2026-01-01T00:00:00.000000Z",
+                    "type": "refresh_start",
+                }
+            )
+        )
+    return ("\x02" + "\n".join(records) + "\n\x03").encode()
+
+
+class FakeHCPServer:
+    """Threaded HTTP server mimicking HCP Terraform; use as a context manager.
+
+    `address` is the base URL to hand to HCPTerraformClient. `requests`
+    counts requests served per path prefix (e.g. "runs", "logs").
+    """
+
+    def __init__(self, run_count: int = 15, log_lines: int = 200):
+        self.runs = fixture_runs(run_count)
+        self.runs_by_id = {run["id"]: run for run in self.runs}
+        self.log = terraform_log(log_lines)
+        self.requests: dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def address(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def __enter__(self) -> Self:
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
+
+    def _count(self, kind: str) -> None:
+        with self._lock:
+            self.requests[kind] = self.requests.get(kind, 0) + 1
+
+    def _page(self, path: str, query: dict[str, str]) -> dict[str, Any]:
+        size = int(query.get("page[size]", 20))
+        number = int(query.get("page[number]", 1))
+        runs = self.runs
+        if status := query.get("filter[status]"):
+            wanted = set(status.split(","))
+            runs = [run for run in runs if run["attributes"]["status"] in wanted]
+        pages = max(1, -(-len(runs) // size))
+        links: dict[str, str | None] = {"next": None}
+        if number < pages:
+            next_query = {**query, "page[number]": str(number + 1)}
+            links["next"] = f"{self.address}{path}?{urlencode(next_query)}"
+        return {
+            "data": runs[(number - 1) * size : number * size],
+            "links": links,
+            "meta": {
+                "pagination": {
+                    "current-page": number,
+                    "page-size": size,
+                    "total-pages": pages,
+                    "total-count": len(runs),
+                }
+            },
+        }
+
+    def _log_resource(self, kind: str, resource_id: str) -> dict[str, Any]:
+        return {
+            "data": {
+                "id": resource_id,
+                "type": kind,
+                "attributes": {
+                    "status": "finished",
+                    "log-read-url": f"{self.address}/logs/{resource_id}",
+                },
+            }
+        }
+
+    def route(self, path: str, query: dict[str, str]) -> tuple[int, Any]:
+        """Return (status, JSON body or raw bytes) for a GET request."""
+        parts = path.strip("/").split("/")
+        if parts[0] == "logs" and len(parts) == 2:
+            self._count("logs")
+            offset = int(query.get("offset", 0))
+            limit = int(query.get("limit", len(self.log)))
+            return 200, self.log[offset : offset + limit]
+        if parts[:2] != ["api", "v2"]:
+            return 404, {"errors": [{"status": "404", "title": "not found"}]}
+        rest = parts[2:]
+        self._count(rest[0] if rest else "")
+        if rest == ["runs"] or (
+            len(rest) == 3 and rest[0] == "organizations" and rest[2] == "runs"
+        ):
+            return 200, self._page(path, query)
+        if len(rest) == 2 and rest[0] == "runs" and rest[1] in self.runs_by_id:
+            return 200, {"data": self.runs_by_id[rest[1]]}
+        if len(rest) == 2 and rest[0] in ("plans", "applies"):
+            return 200, self._log_resource(rest[0], rest[1])
+        return 404, {"errors": [{"status": "404", "title": "not found"}]}
+
+    def _handler_class(self) -> type[BaseHTTPRequestHandler]:
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                url = urlsplit(self.path)
+                query = {k: v[-1] for k, v in parse_qs(url.query).items()}
+                status, body = server.route(url.path, query)
+                if isinstance(body, bytes):
+                    payload, content_type = body, "text/plain"
+                else:
+                    payload = json.dumps(body).encode()
+                    content_type = "application/vnd.api+json"
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
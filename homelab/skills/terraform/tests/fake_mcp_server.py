@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+# /// script
+# requires-python = ">=3.11"
+# ///
+"""Stand-in for the terraform-mcp-server container, replaying fixtures.
+
+Speaks newline-delimited JSON-RPC on stdin/stdout like the real server.
+tools/call answers with the captured result in fixtures/<tool>.json;
+get_run_details is synthesized from the runs in list_runs_api.json. Calls
+are answered from worker threads, so pipelined requests overlap the same
+way they do against the container.
+
+    python fake_mcp_server.py [--delay SECONDS]
+"""
+
+import argparse
+import json
+import sys
+import threading
+import time
+from pathlib import Path
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+
+def load_results() -> dict[str, dict]:
+    """Map tool name to its captured MCP result."""
+    results = {}
+    for path in sorted(FIXTURES_DIR.glob("*.json")):
+        fixture = json.loads(path.read_text())
+        if "result" in fixture:
+            results[path.stem] = fixture["result"]
+    return results
+
+
+def load_runs() -> dict[str, dict]:
+    """Map run id to its JSON:API object from the captured API listing."""
+    fixture = json.loads((FIXTURES_DIR / "list_runs_api.json").read_text())
+    return {run["id"]: run for run in fixture["data"]["data"]}
+
+
+class FakeMCPServer:
+    """Answer JSON-RPC requests from fixture data."""
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.results = load_results()
+        self.runs = load_runs()
+        self._write_lock = threading.Lock()
+
+    def tools(self) -> list[dict]:
+        names = sorted({*self.results, "get_run_details"})
+        return [
+            {"name": name, "description": f"Fixture-backed {name}", "inputSchema": {}}
+            for name in names
+        ]
+
+    def call(self, name: str, arguments: dict) -> dict:
+        if name == "get_run_details":
+            run = self.runs.get(arguments.get("run_id", ""))
+            if run is None:
+                return {
+                    "content": [{"type": "text", "text": "run not found"}],
+                    "isError": True,
+                }
+            text = json.dumps({"data": run})
+            return {"content": [{"type": "text", "text": text}]}
+        if name in self.results:
+            return self.results[name]
+        return {
+            "content": [{"type": "text", "text": f"unknown tool: {name}"}],
+            "isError": True,
+        }
+
+    def send(self, message: dict) -> None:
+        line = json.dumps({"jsonrpc": "2.0", **message})
+        with self._write_lock:
+            sys.stdout.write(line + "\n")
+            sys.stdout.flush()
+
+    def answer_call(self, request: dict) -> None:
+        if self.delay:
+            time.sleep(self.delay)
+        params = request.get("params") or {}
+        result = self.call(params.get("name", ""), params.get("arguments") or {})
+        self.send({"id": request["id"], "result": result})
+
+    def handle(self, request: dict) -> None:
+        if "id" not in request or "method" not in request:
+            return  # notification, or a reply to a server request
+        method = request["method"]
+        if method == "initialize":
+            self.send(
+                {
+                    "id": request["id"],
+                    "result": {
+                        "protocolVersion": "2024-11-05",
+                        "capabilities": {"tools": {}},
+                        "serverInfo": {"name": "fake-terraform-mcp"},
+                    },
+                }
+            )
+        elif method == "tools/list":
+            self.send({"id": request["id"], "result": {"tools": self.tools()}})
+        elif method == "tools/call":
+            threading.Thread(
+                target=self.answer_call, args=(request,), daemon=True
+            ).start()
+        else:
+            self.send(
+                {
+                    "id": request["id"],
+                    "error": {"code": -32601, "message": f"unknown method {method}"},
+                }
+            )
+
+    def serve(self) -> None:
+        for line in sys.stdin:
+            if line.strip():
+                self.handle(json.loads(line))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--delay",
+        type=float,
+        default=0.0,
+        help="Seconds each tools/call takes, standing in for upstream latency",
+    )
+    args = parser.parse_args()
+    FakeMCPServer(args.delay).serve()
+
+
+if __name__ == "__main__":
+    main()
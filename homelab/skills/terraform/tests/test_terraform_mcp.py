@@ -5,21 +5,73 @@
 # ///
 """Tests for terraform_mcp.py using real MCP response fixtures."""
 
+import argparse
+import gzip
+import io
 import json
+import os
+import subprocess
 import sys
+import threading
+from concurrent.futures import Future
 from pathlib import Path
 
+import httpx
 import pytest
 
-# Add parent scripts dir to path
+# Add parent scripts dir to path, and this dir for the fake servers
 sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+sys.path.insert(0, str(Path(__file__).parent))
 
+from fake_hcp_server import FakeHCPServer
 from terraform_mcp import (
+    HCP_MAX_RETRIES,
+    HCP_RETRY_MAX_WAIT,
+    STDERR_TAIL_LINES,
+    BrokerClient,
+    DocsCache,
+    HCPTerraformClient,
+    HCPTerraformError,
+    LazyMCPClient,
+    LogSummary,
+    LogTailer,
+    MCPBroker,
+    MCPStdioClient,
+    PollScheduler,
+    RegistryClient,
+    RunCache,
+    RunHistoryStore,
+    Timings,
+    TokenBucket,
+    ToolSchemaCache,
+    _active_org_runs,
+    _fetch_run,
+    _is_mcp_list_runs_broken,
+    _json_dumps,
+    _workspace_attributes,
+    _workspace_detail_row,
+    _workspace_status_detail,
+    broker_socket_path,
+    build_parser,
+    decode_resources,
+    format_output,
+    format_terraform_logs,
+    iter_format_terraform_logs,
+    iter_resources,
     parse_provider_search_markdown,
+    parse_since,
+    print_run_log,
     unwrap_result,
-    format_output,
-    _is_mcp_list_runs_broken,
-    _extract_runs_from_api_response,
+    workflow_batch,
+    workflow_list_runs,
+    workflow_provider_docs,
+    workflow_run_details,
+    workflow_run_history,
+    workflow_run_outputs,
+    workflow_search_runs,
+    workflow_warmup,
+    workflow_watch_run,
+    workflow_workspace_status,
 )
 
 # Load fixtures
@@ -204,40 +256,64 @@ class TestListRunsResponseHandling:
         assert _is_mcp_list_runs_broken(None) is False
 
 
-class TestExtractRunsFromApiResponse:
-    """Tests for _extract_runs_from_api_response function."""
+class TestIterResources:
+    """Tests for the shared listing decoder and its Resource records."""
 
-    def test_extract_from_api_response(self):
-        """Test extracting runs from direct API response."""
+    def test_iter_from_api_response(self):
+        """JSON:API listings yield one record per resource."""
         fixture = load_fixture("list_runs_api")
-        data = fixture["data"]
-
-        runs = _extract_runs_from_api_response(data)
+        runs = list(iter_resources(fixture["data"]))
 
-        assert isinstance(runs, list)
         assert len(runs) >= 1
-        # Check first run structure
-        assert runs[0]["type"] == "runs"
-        assert "attributes" in runs[0]
-        assert "status" in runs[0]["attributes"]
-
-    def test_extract_from_list(self):
-        """Test extracting runs from a list directly."""
-        data = [{"id": "run-1"}, {"id": "run-2"}]
-        runs = _extract_runs_from_api_response(data)
-        assert runs == data
-
-    def test_extract_from_items_key(self):
-        """Test extracting runs from items key."""
-        data = {"items": [{"id": "run-1"}]}
-        runs = _extract_runs_from_api_response(data)
-        assert runs == [{"id": "run-1"}]
-
-    def test_extract_empty_for_broken_response(self):
-        """Test that broken MCP response returns empty list."""
-        data = {"data": {"type": ""}}
-        runs = _extract_runs_from_api_response(data)
-        assert runs == []
+        assert runs[0].type == "runs"
+        assert runs[0].id == fixture["data"]["data"][0]["id"]
+        assert "status" in runs[0].attributes
+
+    def test_iter_from_list(self):
+        """A bare list is its own resource list."""
+        runs = list(iter_resources([{"id": "run-1"}, {"id": "run-2"}]))
+        assert [run.id for run in runs] == ["run-1", "run-2"]
+
+    def test_iter_from_items_key(self):
+        """Flat items serve as their own attributes."""
+        [run] = iter_resources({"items": [{"id": "run-1", "status": "applied"}]})
+        assert run.id == "run-1"
+        assert run.attributes["status"] == "applied"
+
+    def test_iter_empty_for_broken_response(self):
+        """The broken MCP list_runs body yields nothing, with a warning."""
+        with pytest.warns(UserWarning, match="Expected list"):
+            assert list(iter_resources({"data": {"type": ""}})) == []
+
+    def test_records_reference_the_decoded_payload(self):
+        """Records are slotted and share the decoded attributes, not copies."""
+        body = {"data": [{"id": "ws-1", "attributes": {"name": "dns"}}]}
+        [ws] = iter_resources(body)
+        assert not hasattr(ws, "__dict__")
+        assert ws.attributes is body["data"][0]["attributes"]
+
+    def test_decode_mcp_listing(self):
+        """MCP results are decoded straight into records."""
+        workspaces = list(decode_resources(load_fixture("list_workspaces")))
+        assert workspaces[0].attributes["name"] == "main-cluster-bootstrap"
+
+    def test_decode_rejects_non_json(self):
+        """Text that is not a JSON listing is an error, not an empty list."""
+        with pytest.raises(ValueError, match="Unexpected response format: str"):
+            list(decode_resources(load_fixture("get_provider_details")))
+
+    def test_markdown_is_not_parsed_as_json(self, recwarn):
+        """Markdown content is returned raw without a parse attempt or warning."""
+        assert "# Resource:" in unwrap_result(load_fixture("get_provider_details"))
+        assert len(recwarn) == 0
+
+    def test_one_warning_per_result(self):
+        """Several malformed items produce a single warning."""
+        content = [{"type": "text", "text": "{broken"} for _ in range(3)]
+        with pytest.warns(UserWarning) as record:
+            bodies = unwrap_result({"success": True, "result": {"content": content}})
+        assert bodies == ["{broken"] * 3
+        assert len(record) == 1
 
 
 class TestWorkspaceDetailsResponse:
@@ -253,5 +329,1726 @@ class TestWorkspaceDetailsResponse:
         assert result["data"]["type"] == "tool"
 
 
+# Minimal stdio MCP server: answers initialize, tools/list and tools/call.
+ECHO_SERVER = """
+import json, sys
+for line in sys.stdin:
+    req = json.loads(line)
+    if "id" not in req:
+        continue
+    method = req["method"]
+    if method == "initialize":
+        result = {"serverInfo": {"name": "echo"}}
+    elif method == "tools/list":
+        result = {"tools": [{"name": "echo", "inputSchema": {}}]}
+    elif method == "tools/call":
+        text = json.dumps(req["params"]["arguments"])
+        result = {"content": [{"type": "text", "text": text}]}
+    else:
+        result = {}
+    print(json.dumps({"jsonrpc": "2.0", "id": req["id"], "result": result}), flush=True)
+"""
+
+
+# Holds two tools/call requests, sends a notification and a server request,
+# waits for the client's reply to it, then answers the calls in reverse order.
+REORDER_SERVER = """
+import json, sys
+held = []
+for line in sys.stdin:
+    req = json.loads(line)
+    if req.get("method") == "initialize":
+        print(json.dumps({"jsonrpc": "2.0", "id": req["id"], "result": {}}), flush=True)
+    elif req.get("method") == "tools/call":
+        held.append(req)
+        if len(held) == 2:
+            print(json.dumps({"jsonrpc": "2.0", "method": "notifications/message",
+                              "params": {"level": "info"}}), flush=True)
+            print(json.dumps({"jsonrpc": "2.0", "id": "srv-1", "method": "roots/list"}),
+                  flush=True)
+    elif req.get("id") == "srv-1" and "error" in req:
+        for held_req in reversed(held):
+            text = json.dumps(held_req["params"]["arguments"])
+            result = {"content": [{"type": "text", "text": text}]}
+            print(json.dumps({"jsonrpc": "2.0", "id": held_req["id"], "result": result}),
+                  flush=True)
+        held = []
+"""
+
+
+# Answers each tools/call after the "delay" seconds in its arguments, so
+# replies can overtake one another or miss the client's deadline.
+DELAY_SERVER = """
+import json, sys, threading
+lock = threading.Lock()
+def reply(req, result):
+    with lock:
+        print(json.dumps({"jsonrpc": "2.0", "id": req["id"], "result": result}),
+              flush=True)
+for line in sys.stdin:
+    req = json.loads(line)
+    if req.get("method") == "initialize":
+        reply(req, {})
+    elif req.get("method") == "tools/call":
+        args = req["params"]["arguments"]
+        result = {"content": [{"type": "text", "text": json.dumps(args)}]}
+        threading.Timer(args.get("delay", 0), reply, (req, result)).start()
+"""
+
+
+# Complains on stderr, then never answers anything.
+HUNG_SERVER = """
+import sys, time
+sys.stderr.write("pulling image...\\nauth failed: token expired\\n")
+sys.stderr.flush()
+for line in sys.stdin:
+    pass
+"""
+
+# Floods stderr (far beyond a pipe buffer) before answering each request.
+CHATTY_SERVER = """
+import json, sys
+for line in sys.stdin:
+    req = json.loads(line)
+    if "id" not in req:
+        continue
+    sys.stderr.write(("noise " * 20 + "\\n") * 3000)
+    sys.stderr.flush()
+    result = {"content": [{"type": "text", "text": "{}"}]}
+    print(json.dumps({"jsonrpc": "2.0", "id": req["id"], "result": result}), flush=True)
+"""
+
+
+def spawn_echo_client(server: str = ECHO_SERVER) -> MCPStdioClient:
+    """MCPStdioClient bound to an in-test stdio server."""
+    proc = subprocess.Popen(
+        [sys.executable, "-c", server],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+    )
+    return MCPStdioClient(proc)
+
+
+class TestMultiplexedClient:
+    """Tests for pipelined JSON-RPC over one stdio session."""
+
+    def test_out_of_order_replies_match_by_id(self):
+        """Concurrent calls resolve to their own replies, not arrival order."""
+        client = spawn_echo_client(REORDER_SERVER)
+        try:
+            first = client.submit_tool("echo", {"n": 1})
+            second = client.submit_tool("echo", {"n": 2})
+            assert unwrap_result(second.result(timeout=10)) == {"n": 2}
+            assert unwrap_result(first.result(timeout=10)) == {"n": 1}
+        finally:
+            client.close()
+
+    def test_pending_requests_fail_when_server_exits(self):
+        """EOF resolves outstanding futures with an error instead of hanging."""
+        client = spawn_echo_client("import sys; sys.stdin.readline()")
+        try:
+            result = client.submit("tools/list").result(timeout=10)
+            assert "error" in result
+            assert client.call_tool("echo", {})["success"] is False
+        finally:
+            client.close()
+
+
+class FakeHCP:
+    """HCPTerraformClient stand-in serving the list_runs_api fixture."""
+
+    def __init__(self):
+        self.list_calls = []
+
+    def list_runs(self, organization, workspace, page_size=10, status_filter=None):
+        self.list_calls.append(workspace)
+        return load_fixture("list_runs_api")
+
+    def get_workspace(self, organization, workspace):
+        raise AssertionError("listing already carries workspace detail")
+
+
+class TestWorkspaceDetail:
+    """Tests for workspace-status --all --detail fan-out."""
+
+    def test_mcp_details_attributes_are_unnested(self):
+        """MCP get_workspace_details nests attributes under 'workspace'."""
+        attrs = _workspace_attributes(
+            unwrap_result(load_fixture("get_workspace_details"))
+        )
+        assert attrs["execution-mode"] == "local"
+        assert attrs["working-directory"] == "tf/cluster-bootstrap"
+
+    def test_detail_row_uses_listing_and_latest_run(self):
+        """Listed attributes are reused; only the latest run is fetched."""
+        ws = next(decode_resources(load_fixture("list_workspaces")))
+        hcp = FakeHCP()
+        row = _workspace_detail_row(None, hcp, "org", ws, "mcp")
+        assert row["name"] == "main-cluster-bootstrap"
+        assert row["execution_mode"] == "local"
+        assert row["vcs_repo"]
+        assert row["latest_run"]["id"] == "run-sdS826uRC6jot2ya"
+        assert hcp.list_calls == ["main-cluster-bootstrap"]
+
+    def test_detail_streams_one_json_line_per_workspace(self, capsys):
+        """JSON output is one object per line, emitted as lookups finish."""
+        items = list(decode_resources(load_fixture("list_workspaces")))
+        args = argparse.Namespace(engine="mcp", concurrency=4)
+        assert (
+            _workspace_status_detail(None, FakeHCP(), "org", items, args, "json") == 0
+        )
+        lines = capsys.readouterr().out.strip().splitlines()
+        assert len(lines) == len(items)
+        names = {json.loads(line)["name"] for line in lines}
+        assert names == {ws.attributes["name"] for ws in items}
+
+
+PLAN_LOG_LINES = [
+    '\x02{"@message":"Terraform 1.9.0","type":"version","terraform":"1.9.0"}',
+    '{"@message":"aws_instance.web: Plan to create","type":"planned_change"}',
+    '{"type":"diagnostic","diagnostic":{"severity":"error","summary":"Bad ref",'
+    '"range":{"filename":"main.tf","start":{"line":3,"column":5}}}}',
+    '{"type":"change_summary","changes":{"operation":"plan","add":1,"change":0,'
+    '"remove":0}}\x03',
+]
+
+
+def mock_hcp_client(handler) -> HCPTerraformClient:
+    """HCPTerraformClient whose API and log clients use an httpx MockTransport."""
+    hcp = HCPTerraformClient("token", "https://tfe.test")
+    transport = httpx.MockTransport(handler)
+    hcp._client = httpx.Client(base_url="https://tfe.test", transport=transport)
+    hcp._log_client = httpx.Client(transport=transport)
+    return hcp
+
+
+def log_handler(request: httpx.Request) -> httpx.Response:
+    """Serve a plan with a log-read-url and the log body behind it."""
+    if request.url.host == "archivist.test":
+        assert "authorization" not in request.headers
+        return httpx.Response(200, text="\n".join(PLAN_LOG_LINES))
+    url = "https://archivist.test/v1/object/abc"
+    return httpx.Response(200, json={"data": {"attributes": {"log-read-url": url}}})
+
+
+class TestStreamingLogs:
+    """Tests for streamed log download and formatting."""
+
+    def test_generator_matches_string_formatter(self):
+        """The lazy formatter yields exactly what the string version joins."""
+        entries = list(iter_format_terraform_logs(PLAN_LOG_LINES))
+        assert entries == [
+            "Terraform v1.9.0",
+            "aws_instance.web: Plan to create",
+            "ERROR: Bad ref\n  File: main.tf:3:5",
+            "Plan: 1 to add, 0 to change, 0 to destroy",
+        ]
+        assert "\n".join(entries) == format_terraform_logs("\n".join(PLAN_LOG_LINES))
+
+    def test_framing_characters_are_stripped(self):
+        """STX/ETX framing does not stop JSON lines from being formatted."""
+        formatted = format_terraform_logs("\n".join(PLAN_LOG_LINES))
+        assert formatted.startswith("Terraform v1.9.0")
+        assert formatted.endswith("Plan: 1 to add, 0 to change, 0 to destroy")
+
+    def test_print_run_log_streams_to_stdout(self, capsys):
+        """Logs go from the pooled log client through the formatter to stdout."""
+        hcp = mock_hcp_client(log_handler)
+        print_run_log(hcp, "plan", "plan-1")
+        out = capsys.readouterr().out
+        assert "aws_instance.web: Plan to create" in out
+        assert "File: main.tf:3:5" in out
+
+    def test_print_run_log_reports_download_errors(self, capsys):
+        """A failing log download is reported inline, not raised."""
+
+        def handler(request):
+            if request.url.host == "archivist.test":
+                return httpx.Response(404, text="gone")
+            return log_handler(request)
+
+        print_run_log(mock_hcp_client(handler), "apply", "apply-1")
+        assert "[Could not fetch apply logs: HTTP 404: gone]" in capsys.readouterr().out
+
+
+SUMMARY_LOG_LINES = [
+    '\x02{"type":"version","terraform":"1.9.0"}',
+    '{"type":"resource_drift","change":{"action":"update"}}',
+    '{"type":"planned_change","change":{"action":"create","resource":'
+    '{"addr":"aws_instance.web","resource_type":"aws_instance","module":""}}}',
+    '{"type":"planned_change","change":{"action":"delete","resource":'
+    '{"addr":"module.db.aws_db_instance.main","resource_type":"aws_db_instance",'
+    '"module":"module.db"}}}',
+    '{"type":"planned_change","change":{"action":"replace","resource":'
+    '{"addr":"module.db.aws_instance.bastion","resource_type":"aws_instance",'
+    '"module":"module.db"}}}',
+    "not json at all",
+    '{"type":"change_summary","changes":{"operation":"plan","add":2,"change":0,'
+    '"remove":2}}\x03',
+]
+
+
+class TestLogSummary:
+    """Tests for the one-pass plan/apply log digest behind run-details --summary."""
+
+    def test_counts_by_action_type_and_module(self):
+        """Planned changes are tallied three ways and risky addresses kept."""
+        digest = LogSummary()
+        for line in SUMMARY_LOG_LINES:
+            digest.feed(line)
+        assert digest.as_dict() == {
+            "change_summary": {"operation": "plan", "add": 2, "change": 0, "remove": 2},
+            "actions": {"create": 1, "delete": 1, "replace": 1},
+            "resource_types": {
+                "aws_instance": {"create": 1, "replace": 1},
+                "aws_db_instance": {"delete": 1},
+            },
+            "modules": {
+                "(root)": {"create": 1},
+                "module.db": {"delete": 1, "replace": 1},
+            },
+            "destroy": ["module.db.aws_db_instance.main"],
+            "replace": ["module.db.aws_instance.bastion"],
+            "drift": {"update": 1},
+        }
+
+    def test_run_details_summary_prints_digest_only(self, capsys):
+        """--summary prints one structure instead of the formatted log lines."""
+        run = {
+            "id": "run-1",
+            "type": "runs",
+            "attributes": {"status": "planned", "message": "Bump"},
+            "relationships": {"plan": {"data": {"id": "plan-1"}}},
+        }
+
+        def handler(request):
+            if request.url.host == "archivist.test":
+                return httpx.Response(200, text="\n".join(SUMMARY_LOG_LINES))
+            if request.url.path == "/api/v2/runs/run-1":
+                return httpx.Response(200, json={"data": run})
+            return log_handler(request)
+
+        args = argparse.Namespace(run_id="run-1", engine="api", summary=True)
+        code = workflow_run_details(None, mock_hcp_client(handler), args, "json")
+        assert code == 0
+        output = json.loads(capsys.readouterr().out)
+        assert output["run_id"] == "run-1"
+        assert output["plan"]["destroy"] == ["module.db.aws_db_instance.main"]
+        assert "apply" not in output
+
+    def test_run_details_summary_reports_log_errors(self, capsys):
+        """A log that cannot be fetched fails the command but keeps the run."""
+        run = {
+            "id": "run-1",
+            "type": "runs",
+            "attributes": {"status": "planned"},
+            "relationships": {"plan": {"data": {"id": "plan-1"}}},
+        }
+
+        def handler(request):
+            if request.url.path == "/api/v2/runs/run-1":
+                return httpx.Response(200, json={"data": run})
+            return httpx.Response(404, text="gone")
+
+        args = argparse.Namespace(run_id="run-1", engine="api", summary=True)
+        code = workflow_run_details(None, mock_hcp_client(handler), args, "json")
+        captured = capsys.readouterr()
+        assert code == 1
+        assert json.loads(captured.out)["status"] == "planned"
+        assert "could not fetch plan logs" in captured.err
+
+
+class TestConcurrentRunDetails:
+    """Tests for run-details fetching its run and logs concurrently."""
+
+    RUN = {
+        "id": "run-1",
+        "type": "runs",
+        "attributes": {"status": "errored"},
+        "relationships": {
+            "plan": {"data": {"id": "plan-1", "type": "plans"}},
+            "apply": {"data": {"id": "apply-1", "type": "applies"}},
+        },
+    }
+    INCLUDED = [
+        {
+            "id": "plan-1",
+            "type": "plans",
+            "attributes": {"log-read-url": "https://archivist.test/plan"},
+        },
+        {
+            "id": "apply-1",
+            "type": "applies",
+            "attributes": {"log-read-url": "https://archivist.test/apply"},
+        },
+    ]
+
+    def handler(self, calls, apply_status=200):
+        def handle(request):
+            calls.append(str(request.url))
+            if request.url.path == "/plan":
+                return httpx.Response(200, text="\n".join(PLAN_LOG_LINES))
+            if request.url.path == "/apply":
+                body = '{"@message":"apply failed","type":"log"}'
+                return httpx.Response(apply_status, text=body)
+            if request.url.path == "/api/v2/runs/run-1":
+                body = {"data": self.RUN}
+                if request.url.params.get("include") == "plan,apply":
+                    body["included"] = self.INCLUDED
+                return httpx.Response(200, json=body)
+            return httpx.Response(404, text="unexpected")
+
+        return handle
+
+    def test_log_urls_come_with_the_run(self, capsys):
+        """One sideloading request replaces the per-log URL lookups."""
+        calls = []
+        hcp = mock_hcp_client(self.handler(calls))
+        args = argparse.Namespace(run_id="run-1", engine="api")
+        assert workflow_run_details(None, hcp, args, "text") == 0
+        out = capsys.readouterr().out
+        assert out.index("=== Plan Output ===") < out.index("Plan: 1 to add")
+        assert out.index("Plan: 1 to add") < out.index("=== Apply Output ===")
+        assert out.index("=== Apply Output ===") < out.index("apply failed")
+        assert not any("/plans/" in url or "/applies/" in url for url in calls)
+        assert len(calls) == 3
+
+    class MCP:
+        """get_run_details stand-in that records each call."""
+
+        def __init__(self, run):
+            self.text = json.dumps({"data": run})
+            self.calls = []
+
+        def call_tool(self, name, arguments):
+            self.calls.append(name)
+            content = [{"type": "text", "text": self.text}]
+            return {"success": True, "result": {"content": content}}
+
+    def test_mcp_engine_uses_the_sideloaded_run(self, capsys):
+        """The API request answers the run too, so MCP is never started."""
+        calls = []
+        mcp = self.MCP(self.RUN)
+        hcp = mock_hcp_client(self.handler(calls))
+        args = argparse.Namespace(run_id="run-1", engine="mcp")
+        assert workflow_run_details(mcp, hcp, args, "text") == 0
+        assert "apply failed" in capsys.readouterr().out
+        assert mcp.calls == []
+        assert sorted(httpx.URL(url).path for url in calls) == [
+            "/api/v2/runs/run-1",
+            "/apply",
+            "/plan",
+        ]
+
+    def test_mcp_engine_falls_back_when_the_api_fails(self, capsys):
+        """A failed API request leaves the run to MCP and the URLs to lookups."""
+        calls = []
+        serve = self.handler(calls)
+        logs = {entry["id"]: entry for entry in self.INCLUDED}
+
+        def handle(request):
+            if request.url.path == "/api/v2/runs/run-1":
+                calls.append(str(request.url))
+                return httpx.Response(404, text="not found")
+            log_id = request.url.path.rsplit("/", 1)[-1]
+            if log_id in logs:
+                calls.append(str(request.url))
+                return httpx.Response(200, json={"data": logs[log_id]})
+            return serve(request)
+
+        mcp = self.MCP(self.RUN)
+        hcp = mock_hcp_client(handle)
+        args = argparse.Namespace(run_id="run-1", engine="mcp")
+        assert workflow_run_details(mcp, hcp, args, "text") == 0
+        assert "apply failed" in capsys.readouterr().out
+        assert mcp.calls == ["get_run_details"]
+        assert sorted(httpx.URL(url).path for url in calls) == [
+            "/api/v2/applies/apply-1",
+            "/api/v2/plans/plan-1",
+            "/api/v2/runs/run-1",
+            "/apply",
+            "/plan",
+        ]
+
+    def test_only_skips_the_other_log(self, capsys):
+        """--only apply never downloads the plan log."""
+        calls = []
+        hcp = mock_hcp_client(self.handler(calls))
+        args = argparse.Namespace(run_id="run-1", engine="api", only="apply")
+        assert workflow_run_details(None, hcp, args, "text") == 0
+        out = capsys.readouterr().out
+        assert "=== Plan Output ===" not in out
+        assert "apply failed" in out
+        assert not any(url.endswith("/plan") for url in calls)
+
+    def test_spooled_log_failure_is_reported_in_place(self, capsys):
+        """A background download that fails is reported in its own section."""
+        hcp = mock_hcp_client(self.handler([], apply_status=500))
+        args = argparse.Namespace(run_id="run-1", engine="api")
+        assert workflow_run_details(None, hcp, args, "text") == 0
+        out = capsys.readouterr().out
+        assert "Plan: 1 to add" in out
+        assert out.index("=== Apply Output ===") < out.index(
+            "[Could not fetch apply logs: HTTP 500"
+        )
+
+
+class GrowingLog:
+    """Serve a run whose plan log grows between polls, honoring offset/limit."""
+
+    def __init__(self, steps):
+        self.body = b""
+        self.steps = list(steps)
+        self.url_lookups = 0
+        self.expire_next = False
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        if request.url.host == "archivist.test":
+            if self.expire_next:
+                self.expire_next = False
+                return httpx.Response(403, text="expired")
+            offset = int(request.url.params.get("offset", 0))
+            limit = int(request.url.params.get("limit", len(self.body)))
+            return httpx.Response(200, content=self.body[offset : offset + limit])
+        if request.url.path == "/api/v2/plans/plan-1":
+            self.url_lookups += 1
+            url = "https://archivist.test/v1/object/abc"
+            return httpx.Response(
+                200, json={"data": {"attributes": {"log-read-url": url}}}
+            )
+        # Each run fetch advances one step, appending that step's log output
+        if len(self.steps) > 1:
+            status, output = self.steps.pop(0)
+        else:
+            status, output = self.steps[0]
+            self.steps[0] = (status, b"")
+        self.body += output
+        return httpx.Response(
+            200,
+            json={
+                "data": {
+                    "id": "run-1",
+                    "type": "runs",
+                    "attributes": {
+                        "status": status,
+                        "status-timestamps": {"planning-at": "2026-01-01T00:00:00Z"},
+                    },
+                    "relationships": {"plan": {"data": {"id": "plan-1"}}},
+                }
+            },
+        )
+
+
+class TestLogTailing:
+    """Tests for incremental log tailing used by watch-run --follow."""
+
+    def test_poll_returns_only_complete_new_lines(self):
+        """Partial trailing lines are held back until their newline arrives."""
+        log = GrowingLog([("planning", b"")])
+        log.body = b"\x02first\nsec"
+        tailer = LogTailer(mock_hcp_client(log.handler), "plan", "plan-1")
+        assert tailer.poll() == ["\x02first"]
+        log.body += b"ond\nthird\x03"
+        assert tailer.poll() == ["second", "third"]
+        assert tailer.done
+        assert tailer.offset == len(log.body)
+
+    def test_small_chunks_are_read_until_caught_up(self):
+        """One poll keeps reading while full chunks come back."""
+        log = GrowingLog([("planning", b"")])
+        log.body = b"alpha\nbeta\ngamma\n"
+        tailer = LogTailer(mock_hcp_client(log.handler), "plan", "plan-1", chunk_size=4)
+        assert tailer.poll() == ["alpha", "beta", "gamma"]
+        assert not tailer.done
+
+    def test_expired_url_is_resolved_again(self):
+        """A rejected pre-signed URL triggers one fresh log-read-url lookup."""
+        log = GrowingLog([("planning", b"")])
+        log.body = b"line\n"
+        tailer = LogTailer(mock_hcp_client(log.handler), "plan", "plan-1")
+        log.expire_next = True
+        assert tailer.poll() == ["line"]
+        assert log.url_lookups == 2
+
+    def test_watch_run_follow_streams_plan_once(self, capsys, monkeypatch):
+        """Lines print as they appear and are not repeated at completion."""
+        monkeypatch.setattr("terraform_mcp.time.sleep", lambda _: None)
+        monkeypatch.setattr("terraform_mcp.get_default_org", lambda: "org")
+        first = ("\n".join(PLAN_LOG_LINES[:2]) + "\n").encode()
+        rest = ("\n".join(PLAN_LOG_LINES[2:]) + "\n").encode()
+        log = GrowingLog(
+            [("planning", first), ("planning", b""), ("planned_and_finished", rest)]
+        )
+        args = argparse.Namespace(
+            run_id="run-1", follow=True, engine="api", interval=1, timeout=60
+        )
+        assert workflow_watch_run(None, mock_hcp_client(log.handler), args, "json") == 0
+        out = capsys.readouterr().out
+        assert out.count("=== Plan Output ===") == 1
+        assert out.count("aws_instance.web: Plan to create") == 1
+        assert "Plan: 1 to add, 0 to change, 0 to destroy" in out
+
+
+class TestAdaptivePolling:
+    """Tests for the watch-run poll scheduler and multi-run watching."""
+
+    def test_backoff_doubles_in_planning_and_resets_on_transition(self, monkeypatch):
+        """Unchanged planning runs back off; any transition polls fast."""
+        monkeypatch.setattr("terraform_mcp.random.uniform", lambda a, b: 1.0)
+        scheduler = PollScheduler(interval=5, max_interval=20, fast_interval=2)
+        scheduler.add("run-1")
+        assert scheduler.record("run-1", "planning", changed=True) == 2
+        delays = [scheduler.record("run-1", "planning", False) for _ in range(4)]
+        assert delays == [4, 8, 16, 20]
+        assert scheduler.record("run-1", "applying", changed=True) == 2
+        assert scheduler.record("run-1", "applying", changed=False) == 5
+
+    def test_wait_returns_earliest_due_run(self, monkeypatch):
+        """The shared loop always services whichever run is due first."""
+        slept = []
+        monkeypatch.setattr("terraform_mcp.time.sleep", slept.append)
+        scheduler = PollScheduler(interval=5)
+        scheduler.add("run-a")
+        scheduler.add("run-b")
+        scheduler.record("run-a", "applying", changed=False)
+        assert scheduler.wait() == "run-b"
+        scheduler.remove("run-b")
+        scheduler.defer(30)
+        assert scheduler.wait() == "run-a"
+        assert slept and slept[-1] > 25
+
+    def test_rate_limit_carries_retry_after(self, monkeypatch):
+        """HTTP 429s that outlast the retries tell the caller how long to back off."""
+        monkeypatch.setattr("terraform_mcp.time.sleep", lambda _: None)
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(429, headers={"Retry-After": "7"}, text="slow")
+
+        result = mock_hcp_client(handler).get_run("run-1")
+        assert not result["success"]
+        assert result["retry_after"] == 7
+        assert len(requests) == 1 + HCP_MAX_RETRIES
+
+    def test_watch_many_workspaces_in_one_loop(self, capsys, monkeypatch):
+        """Several workspaces are watched together until all finish."""
+        monkeypatch.setattr("terraform_mcp.time.sleep", lambda _: None)
+        monkeypatch.setattr("terraform_mcp.get_default_org", lambda: "org")
+        statuses = {"run-a": ["planning", "applied"], "run-b": ["errored"]}
+        throttled = []
+
+        def handler(request):
+            if request.url.path == "/api/v2/runs":
+                ws = request.url.params["filter[workspace][name]"]
+                return httpx.Response(200, json={"data": [{"id": f"run-{ws}"}]})
+            run_id = request.url.path.rsplit("/", 1)[-1]
+            # Throttle past the client's own retries so the loop must defer
+            if len(throttled) <= HCP_MAX_RETRIES:
+                throttled.append(run_id)
+                return httpx.Response(429, headers={"Retry-After": "0"})
+            queue = statuses[run_id]
+            status = queue.pop(0) if len(queue) > 1 else queue[0]
+            return httpx.Response(
+                200,
+                json={
+                    "data": {
+                        "id": run_id,
+                        "type": "runs",
+                        "attributes": {"status": status},
+                    }
+                },
+            )
+
+        args = argparse.Namespace(workspace=["a", "b"], engine="api", timeout=60)
+        assert workflow_watch_run(None, mock_hcp_client(handler), args, "json") == 1
+        captured = capsys.readouterr()
+        rows = json.loads(captured.out)
+        assert [(r["run_id"], r["status"]) for r in rows] == [
+            ("run-a", "applied"),
+            ("run-b", "errored"),
+        ]
+        assert "Rate limited" in captured.err
+        assert "a (run-a): applied" in captured.err
+
+    def test_org_active_labels_runs_with_workspace_names(self, monkeypatch):
+        """Sideloaded workspaces name each non-final run."""
+        monkeypatch.setattr("terraform_mcp.get_default_org", lambda: "org")
+
+        def handler(request):
+            assert request.url.path == "/api/v2/organizations/org/runs"
+            assert request.url.params["filter[status_group]"] == "non_final"
+            ws = {"data": {"id": "ws-1", "type": "workspaces"}}
+            return httpx.Response(
+                200,
+                json={
+                    "data": [{"id": "run-1", "relationships": {"workspace": ws}}],
+                    "included": [
+                        {
+                            "id": "ws-1",
+                            "type": "workspaces",
+                            "attributes": {"name": "dns"},
+                        }
+                    ],
+                    "links": {"next": None},
+                },
+            )
+
+        result = _active_org_runs(mock_hcp_client(handler), "org")
+        assert result["runs"] == {"run-1": "dns (run-1)"}
+
+
+def paged_runs_handler(pages, requested):
+    """Serve runs newest first, `pages` lists of created-at values per page."""
+
+    def handler(request):
+        number = int(request.url.params.get("page[number]", 1))
+        requested.append(number)
+        runs = [
+            {
+                "id": f"run-{stamp}",
+                "attributes": {"status": "applied", "created-at": stamp},
+            }
+            for stamp in pages[number - 1]
+        ]
+        next_url = (
+            f"https://tfe.test/api/v2/runs?page%5Bnumber%5D={number + 1}"
+            if number < len(pages)
+            else None
+        )
+        return httpx.Response(200, json={"data": runs, "links": {"next": next_url}})
+
+    return handler
+
+
+class TestRunPagination:
+    """Tests for list-runs --all/--since streaming."""
+
+    PAGES = [
+        ["2026-03-03T00:00:00Z", "2026-03-02T00:00:00Z"],
+        ["2026-03-01T00:00:00Z", "2026-02-01T00:00:00Z"],
+        ["2026-01-01T00:00:00Z"],
+    ]
+
+    def test_parse_since_accepts_relative_and_iso(self):
+        """Ages count back from now; naive timestamps are UTC."""
+        assert parse_since("2026-03-01").tzinfo is not None
+        assert parse_since("2026-03-01T00:00:00Z") == parse_since("2026-03-01")
+        with pytest.raises(ValueError):
+            parse_since("yesterday")
+
+    def test_iter_runs_follows_next_links(self):
+        """Every page is visited when the consumer reads to the end."""
+        requested = []
+        hcp = mock_hcp_client(paged_runs_handler(self.PAGES, requested))
+        assert len(list(hcp.iter_runs("org", "ws"))) == 5
+        assert requested == [1, 2, 3]
+
+    def test_since_stops_paging_at_cutoff(self, capsys, monkeypatch):
+        """Pages beyond the created-at cutoff are never requested."""
+        requested = []
+        handler = paged_runs_handler(self.PAGES, requested)
+        monkeypatch.setattr(
+            "terraform_mcp.HCPTerraformClient",
+            lambda token, address: mock_hcp_client(handler),
+        )
+        monkeypatch.setenv("TFE_TOKEN", "token")
+        monkeypatch.setattr("terraform_mcp.get_default_org", lambda: "org")
+        args = argparse.Namespace(workspace="ws", since="2026-02-15", all=False)
+        assert workflow_list_runs(None, args, "json") == 0
+        rows = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+        assert [row["created_at"][:10] for row in rows] == [
+            "2026-03-03",
+            "2026-03-02",
+            "2026-03-01",
+        ]
+        assert requested == [1, 2]
+
+
+def history_run(run_id, created, status="applied", plan=60, apply=None):
+    """JSON:API run with planning/applying timestamps `plan`/`apply` seconds long."""
+    timestamps = {
+        "planning-at": "2026-03-01T00:00:00Z",
+        "planned-at": f"2026-03-01T00:{plan // 60:02d}:{plan % 60:02d}Z",
+    }
+    if apply is not None:
+        timestamps["applying-at"] = "2026-03-01T01:00:00Z"
+        timestamps["applied-at"] = f"2026-03-01T01:{apply // 60:02d}:{apply % 60:02d}Z"
+    return {
+        "id": run_id,
+        "attributes": {
+            "status": status,
+            "created-at": created,
+            "status-timestamps": timestamps,
+        },
+    }
+
+
+class TestRunHistory:
+    """Tests for the local run-history store and its sync."""
+
+    def test_stats_percentiles_and_error_rate(self, tmp_path):
+        """Durations come from status-timestamps; errors count per workspace."""
+        store = RunHistoryStore(tmp_path / "h.sqlite3")
+        store.upsert(
+            "org",
+            "dns",
+            [
+                history_run("run-1", "2026-03-01T00:00:00Z", plan=60, apply=120),
+                history_run("run-2", "2026-03-02T00:00:00Z", plan=120, apply=240),
+                history_run("run-3", "2026-03-03T00:00:00Z", status="errored"),
+                history_run("run-4", "2026-03-04T00:00:00Z", status="planning"),
+            ],
+        )
+        [row] = store.stats("org")
+        assert row["workspace"] == "dns"
+        assert row["runs"] == 4
+        assert row["error_rate"] == round(1 / 3, 3)
+        assert row["apply_p50"] == 180
+        assert row["apply_p95"] == pytest.approx(234)
+        assert store.stats("org", since="2026-03-03")[0]["runs"] == 2
+
+    def test_resume_point_revisits_unfinished_runs(self, tmp_path):
+        """Sync resumes from the oldest run that was still in progress."""
+        store = RunHistoryStore(tmp_path / "h.sqlite3")
+        assert store.resume_point("org", "dns") is None
+        store.upsert(
+            "org",
+            "dns",
+            [
+                history_run("run-1", "2026-03-01T00:00:00Z"),
+                history_run("run-2", "2026-03-02T00:00:00Z", status="applying"),
+                history_run("run-3", "2026-03-03T00:00:00Z"),
+            ],
+        )
+        assert store.resume_point("org", "dns") == "2026-03-02T00:00:00Z"
+        store.upsert("org", "dns", [history_run("run-2", "2026-03-02T00:00:00Z")])
+        assert store.resume_point("org", "dns") == "2026-03-03T00:00:00Z"
+
+    def test_sync_stops_at_resume_point(self, tmp_path, monkeypatch):
+        """A second sync only pages back to the newest stored run."""
+        monkeypatch.setattr("terraform_mcp.get_default_org", lambda: "org")
+        requested = []
+        pages = [
+            ["2026-03-03T00:00:00Z", "2026-03-02T00:00:00Z"],
+            ["2026-03-01T00:00:00Z"],
+        ]
+        hcp = mock_hcp_client(paged_runs_handler(pages, requested))
+        args = argparse.Namespace(
+            action="sync", workspaces=["dns"], db=str(tmp_path / "h.sqlite3")
+        )
+        assert workflow_run_history(hcp, args, "json") == 0
+        assert requested == [1, 2]
+        requested.clear()
+        assert workflow_run_history(hcp, args, "json") == 0
+        assert requested == [1]
+
+
+def search_run(run_id, created, message, workspace_id="ws-1"):
+    """JSON:API run with a workspace relationship, for search-runs."""
+    return {
+        "id": run_id,
+        "attributes": {"status": "errored", "created-at": created, "message": message},
+        "relationships": {"workspace": {"data": {"id": workspace_id}}},
+    }
+
+
+class TestSearchRuns:
+    """Tests for the org-wide search-runs command."""
+
+    ARGS = {"status": "errored", "since": "2026-03-02T00:00:00Z", "until": None}
+
+    def test_org_listing_filters_and_stops_at_window(self, monkeypatch, capsys):
+        """One paged org query; paging ends at the first run past --since."""
+        monkeypatch.setattr("terraform_mcp.get_default_org", lambda: "org")
+        requests = []
+        pages = [
+            [
+                search_run("run-3", "2026-03-03T00:00:00Z", "Bump DNS records"),
+                search_run("run-2", "2026-03-02T12:00:00Z", "Rotate certs"),
+            ],
+            [search_run("run-1", "2026-03-01T00:00:00Z", "Bump DNS again")],
+            [search_run("run-0", "2026-02-01T00:00:00Z", "never reached")],
+        ]
+
+        def handler(request):
+            requests.append(request.url)
+            number = int(request.url.params.get("page[number]", 1))
+            next_url = f"{request.url.path}?page%5Bnumber%5D={number + 1}"
+            body = {
+                "data": pages[number - 1],
+                "included": [
+                    {"id": "ws-1", "type": "workspaces", "attributes": {"name": "dns"}}
+                ],
+                "links": {"next": next_url if number < len(pages) else None},
+            }
+            return httpx.Response(200, json=body)
+
+        args = argparse.Namespace(message="dns", **self.ARGS)
+        assert workflow_search_runs(mock_hcp_client(handler), args, "jsonl") == 0
+        rows = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+        assert [(row["workspace"], row["id"]) for row in rows] == [("dns", "run-3")]
+        assert len(requests) == 2
+        assert requests[0].path == "/api/v2/organizations/org/runs"
+        assert requests[0].params["filter[status]"] == "errored"
+        assert requests[0].params["include"] == "workspace"
+
+    def test_falls_back_to_workspace_fan_out(self, monkeypatch, capsys):
+        """Without an org runs listing, workspaces are listed once and searched."""
+        monkeypatch.setattr("terraform_mcp.get_default_org", lambda: "org")
+        paths = []
+
+        def handler(request):
+            paths.append(request.url.path)
+            if request.url.path == "/api/v2/organizations/org/runs":
+                return httpx.Response(404, text="not found")
+            if request.url.path == "/api/v2/organizations/org/workspaces":
+                names = [{"attributes": {"name": name}} for name in ("dns", "k8s")]
+                return httpx.Response(200, json={"data": names, "links": {}})
+            ws = request.url.params["filter[workspace][name]"]
+            runs = [search_run(f"run-{ws}", "2026-03-03T00:00:00Z", "Fix")]
+            return httpx.Response(200, json={"data": runs, "links": {}})
+
+        args = argparse.Namespace(message=None, concurrency=2, **self.ARGS)
+        assert workflow_search_runs(mock_hcp_client(handler), args, "json") == 0
+        rows = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+        assert sorted((row["workspace"], row["id"]) for row in rows) == [
+            ("dns", "run-dns"),
+            ("k8s", "run-k8s"),
+        ]
+        assert paths.count("/api/v2/organizations/org/workspaces") == 1
+
+    def test_invalid_message_pattern(self, monkeypatch, capsys):
+        """A bad regex is reported before any request is made."""
+        monkeypatch.setattr("terraform_mcp.get_default_org", lambda: "org")
+        args = argparse.Namespace(message="(", **self.ARGS)
+        assert workflow_search_runs(mock_hcp_client(None), args, "json") == 1
+        assert "invalid --message pattern" in capsys.readouterr().err
+
+
+class TestRunCache:
+    """Tests for the terminal run and log cache."""
+
+    def test_terminal_run_is_served_offline(self, tmp_path):
+        """Once a finished run is cached, no request is made for it."""
+        calls = []
+
+        def handler(request):
+            calls.append(request.url.path)
+            return httpx.Response(
+                200,
+                json={
+                    "data": {
+                        "id": "run-1",
+                        "type": "runs",
+                        "attributes": {"status": "errored"},
+                    }
+                },
+            )
+
+        cache = RunCache(tmp_path)
+        hcp = mock_hcp_client(handler)
+        first = _fetch_run(None, hcp, "run-1", "api", cache)
+        second = _fetch_run(None, hcp, "run-1", "api", cache)
+        assert first == second
+        assert calls == ["/api/v2/runs/run-1"]
+
+    def test_active_run_is_not_cached(self, tmp_path):
+        """Runs that can still change are never stored."""
+        cache = RunCache(tmp_path)
+        cache.put_run({"id": "run-1", "attributes": {"status": "planning"}})
+        assert cache.get_run("run-1") is None
+
+    def test_log_is_teed_then_replayed(self, tmp_path, capsys):
+        """The first print downloads and caches; the second reads gzip."""
+        calls = []
+
+        def handler(request):
+            calls.append(request.url.host)
+            return log_handler(request)
+
+        cache = RunCache(tmp_path)
+        hcp = mock_hcp_client(handler)
+        print_run_log(hcp, "plan", "plan-1", cache)
+        first = capsys.readouterr().out
+        print_run_log(hcp, "plan", "plan-1", cache)
+        assert capsys.readouterr().out == first
+        assert calls == ["tfe.test", "archivist.test"]
+        assert (tmp_path / "plan-plan-1.log.gz").exists()
+
+    def test_failed_download_leaves_no_entry(self, tmp_path):
+        """A log interrupted mid-stream is discarded, not cached truncated."""
+
+        def lines():
+            yield "partial"
+            raise HCPTerraformError("connection reset")
+
+        cache = RunCache(tmp_path)
+        with pytest.raises(HCPTerraformError):
+            list(cache.tee_log("apply", "apply-1", lines()))
+        assert cache.iter_log("apply", "apply-1") is None
+        assert list(tmp_path.iterdir()) == []
+
+    def test_log_without_end_marker_is_not_cached(self, tmp_path):
+        """A log that ends before its ETX marker may still be flushing."""
+        cache = RunCache(tmp_path)
+        assert list(cache.tee_log("plan", "plan-1", ["\x02partial"])) == ["\x02partial"]
+        assert cache.iter_log("plan", "plan-1") is None
+        assert list(tmp_path.iterdir()) == []
+
+    def test_corrupt_log_entry_is_downloaded_again(self, tmp_path, capsys):
+        """An unreadable cached log is dropped and fetched from the API."""
+        (tmp_path / "plan-plan-1.log.gz").write_bytes(b"\x1f\x8b\x08 not gzip")
+        cache = RunCache(tmp_path)
+        assert cache.iter_log("plan", "plan-1") is None
+        assert not (tmp_path / "plan-plan-1.log.gz").exists()
+
+        (tmp_path / "plan-plan-1.log.gz").write_bytes(
+            gzip.compress(b"line\n" * 100)[:-20]
+        )
+        print_run_log(mock_hcp_client(log_handler), "plan", "plan-1", cache)
+        assert "aws_instance.web: Plan to create" in capsys.readouterr().out
+        assert (tmp_path / "plan-plan-1.log.gz").exists()
+
+    def test_eviction_drops_least_recently_used(self, tmp_path):
+        """Over the size cap, the oldest-read entries go first."""
+        cache = RunCache(tmp_path, max_bytes=10**9)
+        for name in ("a", "b", "c"):
+            list(cache.tee_log("plan", name, [name * 2000 + "\x03"]))
+        for name, mtime in (("a", 100), ("b", 300), ("c", 200)):
+            os.utime(tmp_path / f"plan-{name}.log.gz", (mtime, mtime))
+        cache.iter_log("plan", "a")  # a read makes "a" the most recent
+        cache.max_bytes = sum(p.stat().st_size for p in tmp_path.iterdir()) - 1
+        cache._evict()
+        assert sorted(p.name for p in tmp_path.iterdir()) == [
+            "plan-a.log.gz",
+            "plan-b.log.gz",
+        ]
+
+
+class FixtureMCP:
+    """MCP client stand-in answering provider tools from fixtures."""
+
+    def __init__(self):
+        self.calls = []
+
+    def call_tool(self, name, arguments):
+        self.calls.append(name)
+        return load_fixture(name)
+
+    def submit_tool(self, name, arguments):
+        future = Future()
+        future.set_result(self.call_tool(name, arguments))
+        return future
+
+    def _await(self, future):
+        return future.result()
+
+
+def registry_handler(request: httpx.Request) -> httpx.Response:
+    """Serve a one-page listing of two aws resources from a fake registry."""
+    if request.url.path == "/v1/providers/hashicorp/aws":
+        return httpx.Response(200, json={"version": "6.27.0"})
+    if request.url.path == "/v2/providers/hashicorp/aws":
+        versions = [
+            {"id": "70000", "attributes": {"version": "6.26.0"}},
+            {"id": "70001", "attributes": {"version": "6.27.0"}},
+        ]
+        return httpx.Response(200, json={"data": {}, "included": versions})
+    assert request.url.params["filter[provider-version]"] == "70001"
+    docs = [
+        {"id": "10931109", "attributes": {"title": "lambda_function"}},
+        {"id": "10931112", "attributes": {"title": "lambda_function_url"}},
+    ]
+    return httpx.Response(200, json={"data": docs, "links": {"next": None}})
+
+
+class TestDocsCache:
+    """Tests for the provider docs cache and its offline index."""
+
+    def test_content_is_indexed_for_search(self, tmp_path):
+        """Stored markdown is found by full-text search."""
+        cache = DocsCache(tmp_path / "docs.sqlite3")
+        entry = {"id": "1", "title": "lambda_function", "category": "resources"}
+        cache.put_search(
+            "hashicorp", "aws", "resources", "lambda_function", "6.0", [entry]
+        )
+        cache.put_content("hashicorp", "aws", "6.0", "1", "Manages a Lambda Function.")
+        [match] = cache.search("lambda", provider="aws")
+        assert match["title"] == "lambda_function"
+        assert match["version"] == "6.0"
+        assert cache.search("lambda", provider="google") == []
+
+    def test_stale_search_is_ignored(self, tmp_path):
+        """Searches expire after the TTL so a new release is picked up."""
+        cache = DocsCache(tmp_path / "docs.sqlite3", ttl=-1)
+        cache.put_search("hashicorp", "aws", "resources", "s3_bucket", "6.0", [])
+        assert cache.get_search("hashicorp", "aws", "resources", "s3_bucket") is None
+
+    def test_warm_lookup_skips_mcp(self, tmp_path, capsys):
+        """A second lookup of the same resource is answered from the cache."""
+        cache = DocsCache(tmp_path / "docs.sqlite3")
+        args = argparse.Namespace(provider="aws", resource="lambda_function")
+        mcp = FixtureMCP()
+        assert workflow_provider_docs(mcp, args, "compact", cache) == 0
+        cold = capsys.readouterr().out
+        assert mcp.calls == ["search_providers", "get_provider_details"]
+        assert workflow_provider_docs(mcp, args, "compact", cache) == 0
+        assert capsys.readouterr().out == cold
+        assert len(mcp.calls) == 2
+        [match] = cache.search("Lambda", provider="aws")
+        assert match["version"] == "6.27.0"
+
+    def test_prefetch_populates_every_listed_resource(self, tmp_path, monkeypatch):
+        """Prefetch lists docs from the registry and fetches each once."""
+
+        def registry():
+            client = RegistryClient()
+            client._client = httpx.Client(
+                base_url="https://registry.test",
+                transport=httpx.MockTransport(registry_handler),
+            )
+            return client
+
+        monkeypatch.setattr("terraform_mcp.RegistryClient", registry)
+        cache = DocsCache(tmp_path / "docs.sqlite3")
+        args = argparse.Namespace(provider="aws", prefetch=True, resources=True)
+        mcp = FixtureMCP()
+        assert workflow_provider_docs(mcp, args, "json", cache) == 0
+        assert mcp.calls == ["get_provider_details"] * 2
+        assert workflow_provider_docs(mcp, args, "json", cache) == 0
+        assert len(mcp.calls) == 2
+        hit = cache.get_search("hashicorp", "aws", "resources", "lambda_function_url")
+        assert hit["version"] == "6.27.0"
+
+
+class TestBroker:
+    """Tests for the Unix-socket broker and its client."""
+
+    def test_socket_path_depends_on_token(self, tmp_path, monkeypatch):
+        """A different token must never reuse another token's broker."""
+        monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path))
+        env = {"TFE_TOKEN": "a", "TFE_ADDRESS": "https://app.terraform.io"}
+        first = broker_socket_path(env)
+        second = broker_socket_path({**env, "TFE_TOKEN": "b"})
+        assert first != second
+        assert first.parent.stat().st_mode & 0o777 == 0o700
+
+    def test_connect_returns_none_without_broker(self, tmp_path):
+        """No socket means the caller falls back to spawning a container."""
+        assert BrokerClient.connect(tmp_path / "missing.sock") is None
+
+    def test_round_trip_through_broker(self, tmp_path):
+        """Tool calls are forwarded to the one shared session."""
+        path = tmp_path / "b.sock"
+        client = spawn_echo_client()
+        broker = MCPBroker(client, path, idle_timeout=30)
+        thread = threading.Thread(target=broker.serve, daemon=True)
+        thread.start()
+        try:
+            remote = None
+            for _ in range(100):
+                remote = BrokerClient.connect(path)
+                if remote:
+                    break
+                threading.Event().wait(0.05)
+            assert remote is not None
+
+            result = remote.call_tool("echo", {"x": 1})
+            assert unwrap_result(result) == {"x": 1}
+            assert remote.list_tools() == {"success": True, "tools": ["echo"]}
+            assert remote.status()["result"]["requests"] == 2
+
+            remote.shutdown()
+            remote.close()
+            thread.join(timeout=5)
+            assert not thread.is_alive()
+            assert not path.exists()
+        finally:
+            client.close()
+
+
+class TestBatch:
+    """Tests for the JSONL batch command."""
+
+    def test_results_stream_tagged_by_line(self, tmp_path, capsys):
+        """Pipelined calls report in completion order with their line number."""
+        requests = tmp_path / "calls.jsonl"
+        requests.write_text(
+            '{"name": "echo", "arguments": {"n": 1}}\n'
+            "\n"
+            "not json\n"
+            '{"name": "echo", "arguments": {"n": 2}}\n'
+        )
+        client = spawn_echo_client(REORDER_SERVER)
+        try:
+            args = argparse.Namespace(file=str(requests), max_in_flight=2)
+            assert workflow_batch(client, args, "json") == 1
+        finally:
+            client.close()
+        rows = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+        assert [(row["line"], row["success"]) for row in rows] == [
+            (3, False),
+            (4, True),
+            (1, True),
+        ]
+        assert rows[1]["result"] == {"n": 2}
+        assert "Invalid JSON" in rows[0]["error"]
+
+    def test_late_reply_after_timeout_is_dropped(self, tmp_path, capsys):
+        """A reply that misses its deadline does not disturb later calls."""
+        requests = tmp_path / "calls.jsonl"
+        requests.write_text(
+            '{"name": "echo", "arguments": {"delay": 1.4}}\n'
+            '{"name": "echo", "arguments": {"delay": 0.7}}\n'
+            '{"name": "echo", "arguments": {"n": 3}}\n'
+        )
+        client = spawn_echo_client(DELAY_SERVER)
+        client.request_timeout = 1.0
+        try:
+            args = argparse.Namespace(file=str(requests), max_in_flight=1)
+            assert workflow_batch(client, args, "json") == 1
+        finally:
+            client.close()
+        rows = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+        assert [(row["line"], row["success"]) for row in rows] == [
+            (1, False),
+            (2, True),
+            (3, True),
+        ]
+        assert "timed out after 1s" in rows[0]["error"]
+        assert rows[2]["result"] == {"n": 3}
+
+    def test_reads_stdin_by_default(self, monkeypatch, capsys):
+        """Requests can be piped in; arguments default to {}."""
+        monkeypatch.setattr("sys.stdin", io.StringIO('{"name": "echo"}\n'))
+        client = spawn_echo_client()
+        try:
+            assert workflow_batch(client, argparse.Namespace(), "json") == 0
+        finally:
+            client.close()
+        assert json.loads(capsys.readouterr().out) == {
+            "line": 1,
+            "name": "echo",
+            "success": True,
+            "result": {},
+        }
+
+
+class TestStdioDeadlines:
+    """Tests for request deadlines and stderr draining in MCPStdioClient."""
+
+    def test_hung_server_times_out_with_stderr(self):
+        """A server that never answers fails in bounded time with its stderr."""
+        client = spawn_echo_client(HUNG_SERVER)
+        client.request_timeout = 0.5
+        try:
+            result = client.call_tool("echo", {})
+        finally:
+            client.close()
+        assert not result["success"]
+        assert "timed out after 0.5s" in result["error"]
+        assert "auth failed: token expired" in result["error"]
+
+    def test_timed_out_request_is_forgotten(self):
+        """A missed deadline drops the request so a late reply is ignored."""
+        client = spawn_echo_client(HUNG_SERVER)
+        client.request_timeout = 0.2
+        try:
+            future = client.submit_tool("echo", {})
+            assert client._await(future) is None
+            assert "error" in client._send("ping")
+            assert future.cancelled()
+            assert client._pending == {}
+        finally:
+            client.close()
+
+    def test_chatty_stderr_does_not_wedge_session(self):
+        """Megabytes of stderr are drained, keeping only a bounded tail."""
+        client = spawn_echo_client(CHATTY_SERVER)
+        client.request_timeout = 10
+        try:
+            for _ in range(3):
+                assert client.call_tool("echo", {})["success"]
+            assert len(client._stderr_lines) <= STDERR_TAIL_LINES
+        finally:
+            client.close()
+
+
+class TestFakeServers:
+    """The fixture-driven stand-ins speak the real stdio and HTTP transports."""
+
+    def test_fake_mcp_server_replays_fixtures(self):
+        """Tool calls over stdio return the captured fixture results."""
+        proc = subprocess.Popen(
+            [sys.executable, str(Path(__file__).parent / "fake_mcp_server.py")],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+        )
+        client = MCPStdioClient(proc)
+        try:
+            tools = client.list_tools()
+            assert "list_workspaces" in tools["tools"]
+            futures = [
+                client.submit_tool("list_workspaces", {}),
+                client.submit_tool("get_run_details", {"run_id": "run-missing"}),
+            ]
+            workspaces, missing = (future.result(timeout=10) for future in futures)
+        finally:
+            client.close()
+        assert workspaces["result"] == load_fixture("list_workspaces")["result"]
+        assert missing["result"]["isError"]
+
+    def test_fake_hcp_server_pages_runs_and_logs(self):
+        """Runs page through links.next and logs stream over real HTTP."""
+        with FakeHCPServer(run_count=250, log_lines=50) as server:
+            hcp = HCPTerraformClient("fake-token", server.address)
+            try:
+                runs = list(hcp.iter_runs("org", "ws"))
+                run = _fetch_run(None, hcp, runs[0]["id"], engine="api")
+                plan_id = run["run"]["relationships"]["plan"]["data"]["id"]
+                url = hcp.get_log_url("plan", plan_id)["url"]
+                lines = list(hcp.iter_log_lines(url))
+            finally:
+                hcp.close()
+        assert len(runs) == 250
+        assert server.requests["runs"] == 4
+        assert len(lines) == 51
+
+    def test_streamed_log_error_is_reported(self, capsys):
+        """An expired log URL reports its HTTP status, not a closed stream."""
+        with FakeHCPServer() as server:
+            hcp = HCPTerraformClient("fake-token", server.address)
+            try:
+                with pytest.raises(HCPTerraformError, match="HTTP 404"):
+                    list(hcp.iter_log_lines(f"{server.address}/expired/plan"))
+                print_run_log(
+                    hcp, "plan", "plan-1", log_url=f"{server.address}/expired/plan"
+                )
+            finally:
+                hcp.close()
+        assert "[Could not fetch plan logs: HTTP 404" in capsys.readouterr().out
+
+
+class TestTimings:
+    """Tests for per-phase timing instrumentation."""
+
+    def test_disabled_records_nothing(self):
+        """Spans are free no-ops until timings are enabled."""
+        timings = Timings()
+        with timings.span("hcp.request"):
+            pass
+        assert timings.spans == []
+
+    def test_summary_aggregates_by_phase(self):
+        """Repeated phases are counted and totalled in one summary row."""
+        timings = Timings()
+        timings.enable()
+        for _ in range(3):
+            with timings.span("mcp.tool/echo"):
+                pass
+        with timings.span("docker.spawn"):
+            pass
+        summary = timings.summary()
+        row = next(line for line in summary.splitlines() if "mcp.tool/echo" in line)
+        assert row.split()[1] == "3"
+        assert "docker.spawn" in summary
+        assert "wall clock" in summary
+
+    def test_span_recorded_when_block_raises(self):
+        """A failing phase still reports how long it took."""
+        timings = Timings()
+        timings.enable()
+        with pytest.raises(ValueError), timings.span("hcp.request", path="/x"):
+            raise ValueError
+        assert timings.spans[0]["name"] == "hcp.request"
+        assert timings.spans[0]["path"] == "/x"
+
+    def test_report_appends_jsonl(self, tmp_path):
+        """Each invocation appends one JSON record for offline comparison."""
+        log = tmp_path / "timings.jsonl"
+        for _ in range(2):
+            timings = Timings()
+            timings.enable()
+            with timings.span("mcp.initialize"):
+                pass
+            timings.report(str(log), "list-tools")
+        records = [json.loads(line) for line in log.read_text().splitlines()]
+        assert len(records) == 2
+        assert records[0]["command"] == "list-tools"
+        assert records[0]["spans"][0]["name"] == "mcp.initialize"
+        assert records[0]["total_ms"] >= records[0]["spans"][0]["duration_ms"]
+
+    def test_bare_flag_leaves_the_command_alone(self):
+        """`--timings` takes no value, so the subcommand is not eaten as FILE."""
+        args = build_parser().parse_args(["--timings", "run-details", "run-abc123"])
+        assert args.timings is True
+        assert args.timings_file is None
+        assert args.command == "run-details"
+
+        args = build_parser().parse_args(
+            ["--timings-file", "/tmp/t.jsonl", "list-tools"]
+        )
+        assert args.timings_file == "/tmp/t.jsonl"
+        assert args.command == "list-tools"
+
+
+class TestWarmup:
+    """Tests for the warmup command, with containers served by the fake server."""
+
+    @pytest.fixture
+    def fake_docker(self, monkeypatch):
+        """Spawn fake_mcp_server.py for containers and record docker commands."""
+        commands = []
+        server = str(Path(__file__).parent / "fake_mcp_server.py")
+
+        def run(cmd, **kwargs):
+            commands.append(cmd)
+            return subprocess.CompletedProcess(cmd, 0, "", "")
+
+        monkeypatch.setenv("TFE_TOKEN", "fake-token")
+        monkeypatch.setattr("terraform_mcp.subprocess.run", run)
+        monkeypatch.setattr(
+            "terraform_mcp.SessionManager._spawn_container",
+            lambda self: subprocess.Popen(
+                [sys.executable, server],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+            ),
+        )
+        return commands
+
+    def test_reports_cold_and_warm_start(self, fake_docker, tmp_path, capsys):
+        """Both sessions reach tools/list and the schema cache is filled."""
+        cache = ToolSchemaCache(tmp_path)
+        args = argparse.Namespace(broker=False, idle_timeout=60)
+        assert workflow_warmup(args, "json", cache) == 0
+        report = json.loads(capsys.readouterr().out)
+        assert report["pulled"] is False
+        assert fake_docker == [["docker", "image", "inspect", report["image"]]]
+        for phase in ("cold_start", "warm_start"):
+            assert report[phase]["tools"] > 0
+            assert report[phase]["total_seconds"] >= 0
+        assert cache.load()
+
+    def test_pulls_missing_image(self, fake_docker, monkeypatch, capsys):
+        """An absent image is pulled first and the pull is timed."""
+        monkeypatch.setattr("terraform_mcp._docker_image_present", lambda i: False)
+        args = argparse.Namespace(broker=False, idle_timeout=60)
+        assert workflow_warmup(args, "json") == 0
+        report = json.loads(capsys.readouterr().out)
+        assert fake_docker == [["docker", "pull", report["image"]]]
+        assert report["pulled"] is True
+        assert "pull_seconds" in report
+
+
+def outputs_handler(requested):
+    """Serve two workspaces, each with one plain and one sensitive output."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requested.append(request.url.path)
+        parts = request.url.path.split("/")
+        if parts[-2] == "workspaces" and parts[-1] in ("app", "db"):
+            name = parts[-1]
+            return httpx.Response(
+                200,
+                json={
+                    "data": {
+                        "id": f"ws-{name}",
+                        "relationships": {
+                            "current-state-version": {"data": {"id": f"sv-{name}"}}
+                        },
+                    }
+                },
+            )
+        if parts[-1] == "current-state-version-outputs":
+            name = parts[-2].removeprefix("ws-")
+            outputs = [
+                {"attributes": {"name": "url", "sensitive": False, "value": name}},
+                {"attributes": {"name": "password", "sensitive": True, "value": "s3"}},
+            ]
+            return httpx.Response(200, json={"data": outputs, "links": {}})
+        return httpx.Response(404, json={"errors": [{"title": "not found"}]})
+
+    return handler
+
+
+class TestRunOutputs:
+    """Tests for run-outputs via current state version outputs."""
+
+    def test_workspaces_fetched_with_sensitive_redacted(
+        self, monkeypatch, tmp_path, capsys
+    ):
+        """Each workspace's outputs come back in order, secrets redacted."""
+        monkeypatch.setenv("TFE_ORG", "org")
+        hcp = mock_hcp_client(outputs_handler([]))
+        cache = RunCache(tmp_path)
+        args = argparse.Namespace(run_id=None, workspace=["db", "app"], concurrency=4)
+        assert workflow_run_outputs(None, args, "json", hcp, cache) == 0
+        rows = json.loads(capsys.readouterr().out)
+        assert [row["workspace"] for row in rows] == ["db", "app"]
+        assert rows[0]["state_version_id"] == "sv-db"
+        assert rows[0]["outputs"] == {"url": "db", "password": "<sensitive>"}
+        assert cache.get_outputs("sv-db")["password"] == "<sensitive>"
+
+    def test_outputs_cached_per_state_version(self, monkeypatch, tmp_path, capsys):
+        """A repeat lookup only re-reads the workspace to learn its state version."""
+        monkeypatch.setenv("TFE_ORG", "org")
+        requested = []
+        hcp = mock_hcp_client(outputs_handler(requested))
+        cache = RunCache(tmp_path)
+        args = argparse.Namespace(run_id=None, workspace=["app"], concurrency=4)
+        assert workflow_run_outputs(None, args, "json", hcp, cache) == 0
+        requested.clear()
+        capsys.readouterr()
+        assert workflow_run_outputs(None, args, "json", hcp, cache) == 0
+        assert requested == ["/api/v2/organizations/org/workspaces/app"]
+        assert json.loads(capsys.readouterr().out)["outputs"]["url"] == "app"
+
+    def test_missing_workspace_fails_others_still_print(self, monkeypatch, capsys):
+        """One bad workspace is reported without hiding the rest."""
+        monkeypatch.setenv("TFE_ORG", "org")
+        hcp = mock_hcp_client(outputs_handler([]))
+        args = argparse.Namespace(run_id=None, workspace=["app", "nope"], concurrency=2)
+        assert workflow_run_outputs(None, args, "json", hcp) == 1
+        captured = capsys.readouterr()
+        assert json.loads(captured.out)[0]["workspace"] == "app"
+        assert "Error: nope:" in captured.err
+
+
+class FakeClock:
+    """Stand-in for time.monotonic/time.sleep where sleeping advances time."""
+
+    def __init__(self):
+        self.now = 1000.0
+        self.slept = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.slept.append(seconds)
+        self.now += seconds
+
+
+class TestHCPRetries:
+    """Tests for retries, rate-limit headers and pacing in HCPTerraformClient."""
+
+    @pytest.fixture
+    def clock(self, monkeypatch):
+        clock = FakeClock()
+        monkeypatch.setattr("terraform_mcp.time.monotonic", clock.monotonic)
+        monkeypatch.setattr("terraform_mcp.time.sleep", clock.sleep)
+        return clock
+
+    def test_unavailable_retried_after_ratelimit_reset(self, clock):
+        """A 503 is retried after the X-RateLimit-Reset the server gave."""
+        responses = [
+            httpx.Response(503, headers={"X-RateLimit-Reset": "0.25"}),
+            httpx.Response(200, json={"data": {"id": "run-1"}}),
+        ]
+        result = mock_hcp_client(lambda request: responses.pop(0)).get_run("run-1")
+        assert result["success"]
+        assert clock.slept == [0.25]
+
+    def test_transport_errors_retried_with_backoff(self, clock):
+        """Dropped connections back off exponentially, then succeed."""
+        failures = [1, 2]
+
+        def handler(request):
+            if failures:
+                failures.pop()
+                raise httpx.ConnectError("reset by peer")
+            return httpx.Response(200, json={"data": []})
+
+        assert mock_hcp_client(handler).list_runs("org", "ws")["success"]
+        assert len(clock.slept) == 2
+        assert clock.slept[1] > clock.slept[0] / 2
+
+    def test_long_retry_after_not_retried(self, clock):
+        """A wait beyond HCP_RETRY_MAX_WAIT goes straight back to the caller."""
+        retry_after = str(int(HCP_RETRY_MAX_WAIT) + 30)
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(429, headers={"Retry-After": retry_after})
+
+        result = mock_hcp_client(handler).get_run("run-1")
+        assert result["retry_after"] == float(retry_after)
+        assert len(requests) == 1
+        assert clock.slept == []
+
+    def test_log_downloads_retried(self, clock):
+        """Archivist log reads are retried like API requests."""
+        responses = [
+            httpx.Response(502),
+            httpx.Response(200, content=b"line 1\nline 2\n"),
+        ]
+        hcp = mock_hcp_client(lambda request: responses.pop(0))
+        lines = list(hcp.iter_log_lines("https://archivist.test/log"))
+        assert lines == ["line 1", "line 2"]
+        assert len(clock.slept) == 1
+
+    def test_bucket_paces_bursts(self, clock):
+        """Beyond one burst, callers are held to the bucket's rate."""
+        bucket = TokenBucket(10)
+        for _ in range(30):
+            bucket.acquire()
+        assert sum(clock.slept) == pytest.approx(2.0)
+
+    def test_exhausted_ratelimit_pauses_other_callers(self, clock):
+        """X-RateLimit-Remaining: 0 holds the next request until the reset."""
+
+        def handler(request):
+            headers = {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "0.5"}
+            return httpx.Response(200, headers=headers, json={"data": {}})
+
+        hcp = mock_hcp_client(handler)
+        hcp.get_run("run-1")
+        assert clock.slept == []
+        hcp.get_run("run-2")
+        assert sum(clock.slept) == pytest.approx(0.5)
+
+
+class TestJsonLines:
+    """Tests for --format jsonl and the optional fast JSON encoder."""
+
+    def test_format_output_one_line_per_item(self):
+        """Lists become one JSON object per line; anything else one line."""
+        rows = [{"name": "a"}, {"name": "b", "tags": ["x"]}]
+        assert format_output(rows, "jsonl").splitlines() == [
+            '{"name":"a"}',
+            '{"name":"b","tags":["x"]}',
+        ]
+        assert format_output({"name": "a"}, "jsonl") == '{"name":"a"}'
+
+    def test_fallback_encoder_matches(self, monkeypatch):
+        """Without orjson the stdlib encoder produces the same documents."""
+        data = {"runs": [{"id": "run-1", "n": 3, "ok": True, "msg": None}]}
+        fast = _json_dumps(data)
+        monkeypatch.setattr("terraform_mcp.orjson", None)
+        assert json.loads(_json_dumps(data)) == json.loads(fast) == data
+
+    def test_list_runs_rows_without_envelope(self, capsys, monkeypatch):
+        """A plain list-runs emits bare run rows, one per line."""
+        handler = paged_runs_handler([["2026-03-03T00:00:00Z"]], [])
+        monkeypatch.setattr(
+            "terraform_mcp.HCPTerraformClient",
+            lambda token, address: mock_hcp_client(handler),
+        )
+        monkeypatch.setenv("TFE_TOKEN", "token")
+        monkeypatch.setattr("terraform_mcp.get_default_org", lambda: "org")
+        args = argparse.Namespace(workspace="ws", engine="api", limit=10)
+        assert workflow_list_runs(None, args, "jsonl") == 0
+        rows = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+        assert [row["id"] for row in rows] == ["run-2026-03-03T00:00:00Z"]
+
+    def test_workspaces_stream_before_last_page(self, capsys, monkeypatch):
+        """Rows of the first page are out before the second is requested."""
+        monkeypatch.setattr("terraform_mcp.get_default_org", lambda: "org")
+        seen_at_page_two = []
+
+        def handler(request):
+            number = int(request.url.params.get("page[number]", 1))
+            if number == 2:
+                seen_at_page_two.append(capsys.readouterr().out)
+            workspace = {"id": f"ws-{number}", "attributes": {"name": f"w{number}"}}
+            next_url = (
+                "https://tfe.test/api/v2/organizations/org/workspaces?page%5Bnumber%5D=2"
+                if number == 1
+                else None
+            )
+            return httpx.Response(
+                200, json={"data": [workspace], "links": {"next": next_url}}
+            )
+
+        args = argparse.Namespace(workspace=None, detail=False, engine="api")
+        hcp = mock_hcp_client(handler)
+        assert workflow_workspace_status(None, args, "jsonl", hcp) == 0
+        assert json.loads(seen_at_page_two[0])["name"] == "w1"
+        assert json.loads(capsys.readouterr().out)["name"] == "w2"
+
+
+class TestLazyClientAndApiEngine:
+    """Commands that only need the REST API must not start a container."""
+
+    def test_lazy_client_defers_session(self):
+        """The session is created on the first MCP request, not before."""
+        calls = []
+
+        class Session:
+            def get_client(self):
+                calls.append(1)
+                return spawn_echo_client()
+
+        lazy = LazyMCPClient(Session())
+        assert not lazy.started
+        assert calls == []
+        try:
+            assert unwrap_result(lazy.call_tool("echo", {"a": 2})) == {"a": 2}
+            assert lazy.started
+            lazy.call_tool("echo", {})
+            assert calls == [1]
+        finally:
+            lazy._client.close()
+
+    def test_tool_schema_cache_skips_session(self, tmp_path):
+        """Once tools/list is cached for the image, no session is started."""
+        calls = []
+
+        class Session:
+            def get_client(self):
+                calls.append(1)
+                return spawn_echo_client()
+
+        cache = ToolSchemaCache(tmp_path, image="example/mcp:1")
+        cold = LazyMCPClient(Session(), cache)
+        try:
+            assert cold.list_tools() == {"success": True, "tools": ["echo"]}
+        finally:
+            cold._client.close()
+        warm = LazyMCPClient(Session(), cache)
+        assert warm.describe_tool("echo")["tool"]["name"] == "echo"
+        assert not warm.started
+        assert calls == [1]
+
+    def test_tool_schema_cache_is_per_image(self, tmp_path):
+        """A new image tag misses and replaces the old tag's file."""
+        ToolSchemaCache(tmp_path, image="example/mcp:1").store([{"name": "a"}])
+        newer = ToolSchemaCache(tmp_path, image="example/mcp:2")
+        assert newer.load() is None
+        newer.store([{"name": "b"}])
+        assert [p.name for p in tmp_path.iterdir()] == ["tools-example-mcp-2.json"]
+
+    def test_describe_suggests_close_names(self, tmp_path):
+        """Typos are answered with fuzzy matches over the cached names."""
+        cache = ToolSchemaCache(tmp_path)
+        cache.store([{"name": "get_run_details"}, {"name": "list_runs"}])
+        result = LazyMCPClient(None, cache).describe_tool("get_run_detials")
+        assert not result["success"]
+        assert "Similar: get_run_details" in result["error"]
+
+    def test_fetch_run_api_engine_skips_mcp(self):
+        """engine=api reads the run from HCPTerraformClient.get_run."""
+        run = load_fixture("list_runs_api")["data"]["data"][0]
+
+        class Hcp:
+            def get_run(self, run_id, include=None):
+                return {"success": True, "data": {"data": run}}
+
+        class NoMCP:
+            def call_tool(self, *args):
+                raise AssertionError("MCP must not be used")
+
+        result = _fetch_run(NoMCP(), Hcp(), run["id"], "api")
+        assert result["success"]
+        assert result["run"]["id"] == run["id"]
+        assert result["run"]["attributes"]["status"] == run["attributes"]["status"]
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])